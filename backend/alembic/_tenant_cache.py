@@ -0,0 +1,41 @@
+"""Tenant schema list for revisions, fetched once per Alembic connection (i.e. per run)."""
+
+from sqlalchemy import Connection, text
+
+_cached: tuple[Connection, list[str]] | None = None
+
+
+def tenant_schemas(conn: Connection) -> list[str]:
+    """
+    Return schema_name for every survey, ordered by name (deterministic for parallel workers).
+    The list is reused by later revisions on the same connection; a new bind refetches it.
+    Revisions should return early when it is empty (fresh database, nothing to migrate).
+    """
+    global _cached
+    if _cached is None or _cached[0] is not conn:
+        result = conn.execute(text("SELECT schema_name FROM public.surveys ORDER BY schema_name"))
+        _cached = (conn, list(result.scalars().all()))
+    return list(_cached[1])
+
+
+def schemas_missing_column(conn: Connection, table_name: str, column_name: str) -> list[str]:
+    """
+    Tenant schemas whose `table_name` lacks `column_name`, from one catalog query.
+    Lets a revision skip tenants a previous (partial) run already migrated.
+    """
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return []
+    result = conn.execute(
+        text(
+            """
+            SELECT table_schema FROM information_schema.columns
+            WHERE table_schema = ANY(:schemas)
+              AND table_name = :table_name
+              AND column_name = :column_name
+            """
+        ),
+        {"schemas": schemas, "table_name": table_name, "column_name": column_name},
+    )
+    done = set(result.scalars())
+    return [s for s in schemas if s not in done]
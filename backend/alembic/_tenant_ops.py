@@ -0,0 +1,183 @@
+"""Helpers for revisions that apply the same change to every tenant schema.
+
+Tenant schemas are independent, so per-schema work can run on separate connections in
+parallel. Each schema is migrated and committed in its own transaction, outside Alembic's
+migration transaction; the per-schema SQL must therefore be idempotent (IF [NOT] EXISTS)
+so a partially applied revision can simply be re-run.
+
+Cheap catalog-only DDL (e.g. DROP COLUMN) is better sent as one server-side DO block that
+loops over public.surveys: a single round-trip regardless of the tenant count. Several
+parameterless statements for one schema can likewise go out as one script (execute_script).
+Statements that must run outside a transaction (CREATE / DROP INDEX CONCURRENTLY) go through
+run_concurrently, one autocommit call per schema and statement. A failed or interrupted
+concurrent build leaves an INVALID index that IF NOT EXISTS would take as done;
+run_concurrently drops such leftovers before building and checks every build it runs.
+"""
+
+import re
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from alembic import op
+from sqlalchemy import Connection, TextClause, create_engine, text
+from sqlalchemy.exc import OperationalError
+
+DEFAULT_WORKERS = 6
+BATCH_SIZE = 50
+# Per-schema lock wait before giving up and retrying later (a busy tenant must not stall others)
+DEFAULT_LOCK_TIMEOUT = "2s"
+LOCK_RETRY_BACKOFF_SECONDS = (0.25, 1.0, 4.0, 16.0)
+_LOCK_NOT_AVAILABLE = "55P03"
+# ADD COLUMN ... [NOT NULL] DEFAULT <constant> is a catalog-only change (no rewrite) from PG11
+FAST_DEFAULT_MIN_SERVER_VERSION = (11,)
+# Index name of a "CREATE [UNIQUE] INDEX CONCURRENTLY IF NOT EXISTS <name> ON ..." template
+_CREATE_INDEX_NAME = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE
+)
+_INDEX_IS_VALID = text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index)")
+
+
+def require_fast_default(bind: Connection) -> None:
+    """
+    Fail early if the server would rewrite every tenant table for ADD COLUMN ... DEFAULT.
+    Revisions that add defaulted columns rely on PG11+ storing the constant default in the
+    catalog, so NOT NULL + DEFAULT in one statement stays O(1) per table.
+    """
+    version = bind.dialect.server_version_info or ()
+    if version < FAST_DEFAULT_MIN_SERVER_VERSION:
+        raise RuntimeError(
+            f"PostgreSQL {'.'.join(map(str, version)) or '?'} rewrites tables on "
+            "ADD COLUMN ... DEFAULT; tenant migrations require PostgreSQL 11 or newer"
+        )
+
+
+def _is_lock_timeout(error: Exception) -> bool:
+    return (
+        isinstance(error, OperationalError)
+        and getattr(error.orig, "pgcode", None) == _LOCK_NOT_AVAILABLE
+    )
+
+
+def run_per_schema(
+    bind: Connection,
+    schemas: Sequence[str],
+    migrate: Callable[[Connection, str], None],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = BATCH_SIZE,
+    lock_timeout: str = DEFAULT_LOCK_TIMEOUT,
+    statement_timeout: str | None = None,
+) -> None:
+    """
+    Call migrate(conn, schema_name) for each schema on a worker pool (one COMMIT per schema,
+    asynchronous: durability comes from the revision's commit on `bind`).
+    Each transaction sets lock_timeout (and optionally statement_timeout); a schema whose lock
+    cannot be taken is retried with backoff (LOCK_RETRY_BACKOFF_SECONDS) on its worker while
+    the others proceed. Failures are collected over all batches and raised once at the end.
+    Do not touch tenant tables on `bind` itself in the same revision (the outer transaction
+    would block the workers).
+    """
+    if not schemas:
+        return
+    engine = create_engine(bind.engine.url, pool_size=workers, max_overflow=0)
+
+    def _attempt(schema_name: str) -> None:
+        with engine.begin() as conn:
+            # Per-schema commits skip the WAL flush wait; the revision's own (synchronous)
+            # commit on `bind` flushes all earlier WAL, so the work is durable once stamped.
+            conn.exec_driver_sql("SET LOCAL synchronous_commit = off")
+            conn.exec_driver_sql(f"SET LOCAL lock_timeout = '{lock_timeout}'")
+            if statement_timeout is not None:
+                conn.exec_driver_sql(f"SET LOCAL statement_timeout = '{statement_timeout}'")
+            migrate(conn, schema_name)
+
+    def _one(schema_name: str) -> tuple[str, Exception | None]:
+        retries = 0
+        while True:
+            try:
+                _attempt(schema_name)
+                return schema_name, None
+            except Exception as e:
+                if retries >= len(LOCK_RETRY_BACKOFF_SECONDS) or not _is_lock_timeout(e):
+                    return schema_name, e
+                time.sleep(LOCK_RETRY_BACKOFF_SECONDS[retries])
+                retries += 1
+
+    failed: list[tuple[str, Exception]] = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(schemas), batch_size):
+                batch = schemas[start : start + batch_size]
+                failed.extend((s, e) for s, e in executor.map(_one, batch) if e is not None)
+        if failed:
+            names = ", ".join(s for s, _ in failed)
+            raise RuntimeError(f"Tenant migration failed for: {names}") from failed[0][1]
+    finally:
+        engine.dispose()
+
+
+def for_each_tenant(statement: str) -> TextClause:
+    """
+    Build a DO block that runs `statement` for every schema in public.surveys.
+    `statement` is a format() template with %I for the schema name, e.g.
+    "ALTER TABLE %I.published_opinions DROP COLUMN IF EXISTS foo". The loop runs server-side,
+    inside the caller's transaction, so keep it to statements that do not rewrite tables.
+    """
+    return text(
+        f"""
+        DO $$
+        DECLARE s text;
+        BEGIN
+          FOR s IN SELECT schema_name FROM public.surveys ORDER BY schema_name LOOP
+            EXECUTE format($stmt${statement}$stmt$, s);
+          END LOOP;
+        END $$
+        """
+    )
+
+
+def execute_script(conn: Connection, statements: Sequence[str]) -> None:
+    """
+    Send parameterless statements as one multi-statement simple query (one round-trip).
+    Not for statements that refuse to run in a transaction block (e.g. CREATE INDEX CONCURRENTLY).
+    """
+    conn.exec_driver_sql(";\n".join(s.strip().rstrip(";") for s in statements))
+
+
+def _index_is_valid(bind: Connection, qualified_name: str) -> bool | None:
+    """pg_index.indisvalid of the index, or None if it does not exist."""
+    return bind.execute(_INDEX_IS_VALID, {"index": qualified_name}).scalar()
+
+
+def run_concurrently(bind: Connection, schemas: Sequence[str], *templates: str) -> None:
+    """
+    Run statements that refuse a transaction block (CREATE / DROP INDEX CONCURRENTLY) in
+    autocommit, outside the migration transaction: each template, formatted with
+    schema=<name>, for every schema in turn. All statements are built before any I/O, and each
+    is its own call (CONCURRENTLY refuses multi-statement strings too). Templates must be
+    idempotent (IF [NOT] EXISTS), so a partially applied revision can be re-run.
+    A failed or interrupted CREATE INDEX CONCURRENTLY leaves the index behind as INVALID (never
+    used by the planner, nor by ON CONFLICT), and IF NOT EXISTS would skip it on the re-run:
+    such an index is dropped before its CREATE template runs, and every build is checked to be
+    valid before the schema's next statement (e.g. dropping the index it replaces).
+    """
+    statements = [
+        (schema_name, template.format(schema=schema_name))
+        for schema_name in schemas
+        for template in templates
+    ]
+    if not statements:
+        return
+    with op.get_context().autocommit_block():
+        for schema_name, statement in statements:
+            match = _CREATE_INDEX_NAME.match(statement.lstrip())
+            if match is None:
+                bind.exec_driver_sql(statement)
+                continue
+            index = f"{schema_name}.{match.group(1)}"
+            if _index_is_valid(bind, index) is False:
+                bind.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+            bind.exec_driver_sql(statement)
+            if not _index_is_valid(bind, index):
+                raise RuntimeError(f"Index {index} was not built (missing or INVALID)")
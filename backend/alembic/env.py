@@ -1,20 +1,18 @@
 """Alembic environment: use app config and metadata for migrations."""
 
+import os
+import sys
 from logging.config import fileConfig
 
 from alembic import context
 from app.config import settings
-
-# Import all models so Base.metadata includes every table
-from app.models import (
-    public,  # noqa: F401
-    tenant,  # noqa: F401
-)
-from app.models.base import Base
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import MetaData, engine_from_config, pool
 
 config = context.config
 
+# Make shared revision helpers (e.g. _tenant_ops) importable from versions/*.py
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
@@ -22,7 +20,32 @@ if config.config_file_name is not None:
 sync_url = settings.database_url.replace("postgresql+asyncpg", "postgresql")
 config.set_main_option("sqlalchemy.url", sync_url)
 
-target_metadata = Base.metadata
+
+def _needs_metadata() -> bool:
+    """
+    Model metadata is only read by autogenerate (revision --autogenerate, check).
+    Hand-written upgrades/downgrades skip importing the model tree. Force with -x metadata=1.
+    """
+    if context.get_x_argument(as_dictionary=True).get("metadata"):
+        return True
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None:
+        return True  # Programmatic use (command.* API): keep the previous behaviour
+    cmd = getattr(cmd_opts, "cmd", None)
+    cmd_name = getattr(cmd[0], "__name__", "") if cmd else ""
+    return bool(getattr(cmd_opts, "autogenerate", False)) or cmd_name == "check"
+
+
+target_metadata: MetaData | None = None
+if _needs_metadata():
+    # Import all models so Base.metadata includes every table
+    from app.models import (
+        public,  # noqa: F401
+        tenant,  # noqa: F401
+    )
+    from app.models.base import Base
+
+    target_metadata = Base.metadata
 
 
 def run_migrations_offline() -> None:
@@ -40,21 +63,28 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """
+    Run migrations in 'online' mode on one shared connection (StaticPool).
+    Each revision commits in its own transaction, so a failure keeps earlier revisions applied.
+    """
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.StaticPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                transaction_per_migration=True,
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
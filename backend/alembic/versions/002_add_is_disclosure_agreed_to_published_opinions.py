@@ -4,14 +4,19 @@ Revision ID: 002
 Revises: 001
 Create Date: Add is_disclosure_agreed (PII disclose yes/no at opinion level)
 
-Adds column, sets TRUE for legacy rows with disclosed_pii, then corrects to FALSE
-where source raw_answers have is_disclosure_agreed=false.
+Adds column, then in a single UPDATE pass sets TRUE for legacy rows with disclosed_pii,
+unless source raw_answers have is_disclosure_agreed=false.
+Tenant schemas are migrated in parallel, one transaction per schema (see _tenant_ops);
+the downgrade is a single server-side DO block.
 """
 
 from collections.abc import Sequence
 
 from alembic import op
-from sqlalchemy import text
+from sqlalchemy import Connection
+
+from _tenant_cache import schemas_missing_column, tenant_schemas
+from _tenant_ops import execute_script, for_each_tenant, require_fast_default, run_per_schema
 
 revision: str = "002"
 down_revision: str | None = "001"
@@ -19,66 +24,53 @@ branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
 
+# Statement templates built once at import; only the schema name is substituted per tenant.
+# The constant default keeps the ADD catalog-only (see require_fast_default).
+_ADD_COLUMN_SQL = """
+    ALTER TABLE {schema}.published_opinions
+    ADD COLUMN IF NOT EXISTS is_disclosure_agreed BOOLEAN NOT NULL DEFAULT FALSE
+"""
+_BACKFILL_SQL = """
+    UPDATE {schema}.published_opinions po
+    SET is_disclosure_agreed = NOT EXISTS (
+        SELECT 1
+        FROM {schema}.raw_responses rr
+        JOIN {schema}.raw_answers ra ON ra.response_id = rr.id
+        JOIN {schema}.questions q ON q.id = ra.question_id
+        WHERE rr.id = po.raw_response_id
+          AND q.is_personal_data = true
+          AND ra.answer_text IS NOT NULL
+          AND trim(ra.answer_text) != ''
+          AND ra.is_disclosure_agreed = false
+    )
+    WHERE po.disclosed_pii IS NOT NULL
+      AND po.disclosed_pii != 'null'::jsonb
+      AND po.disclosed_pii != '{{}}'::jsonb
+"""
+
+
+def _upgrade_schema(conn: Connection, schema_name: str) -> None:
+    # ALTER + backfill in one round-trip
+    execute_script(
+        conn, [_ADD_COLUMN_SQL.format(schema=schema_name), _BACKFILL_SQL.format(schema=schema_name)]
+    )
+
+
 def upgrade() -> None:
-    """Add is_disclosure_agreed; set TRUE for legacy, correct FALSE from raw_answers."""
+    """Add is_disclosure_agreed; derive legacy values from raw_answers in one UPDATE per tenant."""
     conn = op.get_bind()
-    result = conn.execute(text("SELECT schema_name FROM public.surveys"))
-    rows = result.fetchall()
-    for (schema_name,) in rows:
-        op.execute(
-            text(
-                f"""
-                ALTER TABLE {schema_name}.published_opinions
-                ADD COLUMN IF NOT EXISTS is_disclosure_agreed BOOLEAN NOT NULL DEFAULT FALSE
-                """
-            )
-        )
-        op.execute(
-            text(
-                f"""
-                UPDATE {schema_name}.published_opinions
-                SET is_disclosure_agreed = TRUE
-                WHERE disclosed_pii IS NOT NULL
-                  AND disclosed_pii != 'null'::jsonb
-                  AND disclosed_pii != '{{}}'::jsonb
-                """
-            )
-        )
-        op.execute(
-            text(
-                f"""
-                UPDATE {schema_name}.published_opinions po
-                SET is_disclosure_agreed = FALSE
-                WHERE po.disclosed_pii IS NOT NULL
-                  AND po.disclosed_pii != 'null'::jsonb
-                  AND po.disclosed_pii != '{{}}'::jsonb
-                  AND EXISTS (
-                    SELECT 1
-                    FROM {schema_name}.raw_responses rr
-                    JOIN {schema_name}.raw_answers ra ON ra.response_id = rr.id
-                    JOIN {schema_name}.questions q ON q.id = ra.question_id
-                    WHERE rr.id = po.raw_response_id
-                      AND q.is_personal_data = true
-                      AND ra.answer_text IS NOT NULL
-                      AND trim(ra.answer_text) != ''
-                      AND ra.is_disclosure_agreed = false
-                  )
-                """
-            )
-        )
+    require_fast_default(conn)
+    # ALTER + backfill commit together, so tenants that have the column are fully migrated
+    pending = schemas_missing_column(conn, "published_opinions", "is_disclosure_agreed")
+    run_per_schema(conn, pending, _upgrade_schema)
 
 
 def downgrade() -> None:
-    """Remove is_disclosure_agreed column."""
-    conn = op.get_bind()
-    result = conn.execute(text("SELECT schema_name FROM public.surveys"))
-    rows = result.fetchall()
-    for (schema_name,) in rows:
-        op.execute(
-            text(
-                f"""
-                ALTER TABLE {schema_name}.published_opinions
-                DROP COLUMN IF EXISTS is_disclosure_agreed
-                """
-            )
+    """Remove is_disclosure_agreed column (all tenants in one DO block)."""
+    if not tenant_schemas(op.get_bind()):
+        return
+    op.execute(
+        for_each_tenant(
+            "ALTER TABLE %I.published_opinions DROP COLUMN IF EXISTS is_disclosure_agreed"
         )
+    )
@@ -0,0 +1,70 @@
+"""Replace the published_opinions FTS expression index with a stored tsvector column.
+
+Revision ID: 003
+Revises: 002
+Create Date: Generated search_tsv column + GIN index built concurrently
+
+Adds search_tsv (GENERATED ALWAYS AS to_tsvector(...) STORED) to every tenant
+published_opinions, indexes it with CREATE INDEX CONCURRENTLY (outside the migration
+transaction, so writes stay online during the build), then drops the old expression index.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import Connection
+
+from _tenant_cache import schemas_missing_column, tenant_schemas
+from _tenant_ops import for_each_tenant, run_concurrently, run_per_schema
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_FTS_EXPR = "to_tsvector('simple', coalesce(title,'') || ' ' || coalesce(content,''))"
+INDEX_NAME = "idx_published_opinions_search_tsv"
+LEGACY_INDEX_NAME = "idx_published_opinions_fts"
+
+# Statement templates built once at import; only the schema name is substituted per tenant
+_ADD_COLUMN_SQL = (
+    "ALTER TABLE {schema}.published_opinions ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+    f"GENERATED ALWAYS AS ({_FTS_EXPR}) STORED"
+)
+_CREATE_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+    "ON {schema}.published_opinions USING GIN (search_tsv)"
+)
+_DROP_LEGACY_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{LEGACY_INDEX_NAME}"
+_CREATE_LEGACY_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {LEGACY_INDEX_NAME} "
+    f"ON {{schema}}.published_opinions USING GIN ({_FTS_EXPR})"
+)
+
+
+def _add_column(conn: Connection, schema_name: str) -> None:
+    conn.exec_driver_sql(_ADD_COLUMN_SQL.format(schema=schema_name))
+
+
+def upgrade() -> None:
+    """Add search_tsv per tenant, build its GIN index concurrently, drop the expression index."""
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_per_schema(
+        conn, schemas_missing_column(conn, "published_opinions", "search_tsv"), _add_column
+    )
+    run_concurrently(conn, schemas, _CREATE_INDEX_SQL, _DROP_LEGACY_INDEX_SQL)
+
+
+def downgrade() -> None:
+    """Restore the expression index, then drop search_tsv (and its index) per tenant."""
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_concurrently(conn, schemas, _CREATE_LEGACY_INDEX_SQL)
+    op.execute(
+        for_each_tenant("ALTER TABLE %I.published_opinions DROP COLUMN IF EXISTS search_tsv")
+    )
@@ -0,0 +1,52 @@
+"""NOTIFY survey_schemas on public.surveys changes.
+
+Revision ID: 004
+Revises: 003
+Create Date: Trigger-based invalidation for the in-process survey -> schema cache
+
+Every INSERT and DELETE on public.surveys, and every UPDATE OF schema_name, sends
+pg_notify('survey_schemas', <survey id>); updates of other columns (status, access code, ...)
+do not notify. app.middleware.schema_cache listens on that channel and drops the affected
+entry, so deletions from any process (e.g. run_survey_lifecycle.py) reach every API worker.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CHANNEL = "survey_schemas"
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION public.notify_survey_schemas() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('{CHANNEL}', OLD.id::text);
+            ELSE
+                PERFORM pg_notify('{CHANNEL}', NEW.id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_surveys_notify_schemas ON public.surveys")
+    op.execute(
+        """
+        CREATE TRIGGER trg_surveys_notify_schemas
+        AFTER INSERT OR UPDATE OF schema_name OR DELETE ON public.surveys
+        FOR EACH ROW EXECUTE FUNCTION public.notify_survey_schemas()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_surveys_notify_schemas ON public.surveys")
+    op.execute("DROP FUNCTION IF EXISTS public.notify_survey_schemas()")
@@ -0,0 +1,48 @@
+"""Reconcile public.surveys access-code columns left by the pre-squash history.
+
+Revision ID: 005
+Revises: 004
+Create Date: Single-statement replacement for the old 008/009 column swap
+
+Databases created before migrations were squashed (and then stamped) may still carry
+access_code_hash and lack access_code_plain. Both changes go into one ALTER TABLE (one
+catalog update, one ACCESS EXCLUSIVE lock); databases already in the target state skip it.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    columns = set(
+        conn.execute(
+            text(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = 'surveys'
+                  AND column_name IN ('access_code_plain', 'access_code_hash')
+                """
+            )
+        ).scalars()
+    )
+    if columns == {"access_code_plain"}:
+        return
+    op.execute(
+        """
+        ALTER TABLE public.surveys
+        ADD COLUMN IF NOT EXISTS access_code_plain VARCHAR(64),
+        DROP COLUMN IF EXISTS access_code_hash
+        """
+    )
+
+
+def downgrade() -> None:
+    """No-op: access_code_hash is not restored (its values cannot be recovered)."""
@@ -0,0 +1,47 @@
+"""GIN (jsonb_path_ops) indexes on disclosed_pii in every tenant schema.
+
+Revision ID: 006
+Revises: 005
+Create Date: Containment (@>) lookups on disclosed PII for moderation
+
+Indexes published_opinions.disclosed_pii and upvotes.disclosed_pii with jsonb_path_ops (about
+half the size of the default jsonb_ops; serves @>). Built with CREATE INDEX CONCURRENTLY, one
+statement per tenant table, so moderation writes stay online.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table)
+_INDEXES = (
+    ("idx_published_opinions_disclosed_pii", "published_opinions"),
+    ("idx_upvotes_disclosed_pii", "upvotes"),
+)
+# Per-index templates; only the schema name is substituted per tenant
+_CREATE_INDEX_SQL = tuple(
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+    f"ON {{schema}}.{table} USING GIN (disclosed_pii jsonb_path_ops)"
+    for index, table in _INDEXES
+)
+_DROP_INDEX_SQL = tuple(
+    f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{index}" for index, _table in _INDEXES
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), *_CREATE_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), *_DROP_INDEX_SQL)
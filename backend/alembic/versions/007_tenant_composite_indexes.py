@@ -0,0 +1,48 @@
+"""Composite B-tree indexes for the per-tenant read paths.
+
+Revision ID: 007
+Revises: 006
+Create Date: questions (survey_id, id), raw_answers (response_id, question_id),
+upvotes (opinion_id, status)
+
+Form definition reads (WHERE survey_id ORDER BY id), submission detail (answers by
+response_id) and per-opinion upvote listings become ordered index range scans. Built with
+CREATE INDEX CONCURRENTLY, one statement per tenant table.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns)
+_INDEXES = (
+    ("idx_questions_survey_id_id", "questions", "survey_id, id"),
+    ("idx_raw_answers_response_id_question_id", "raw_answers", "response_id, question_id"),
+    ("idx_upvotes_opinion_id_status", "upvotes", "opinion_id, status"),
+)
+# Per-index templates; only the schema name is substituted per tenant
+_CREATE_INDEX_SQL = tuple(
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {{schema}}.{table} ({columns})"
+    for index, table, columns in _INDEXES
+)
+_DROP_INDEX_SQL = tuple(
+    f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{index}" for index, _table, _columns in _INDEXES
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), *_CREATE_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), *_DROP_INDEX_SQL)
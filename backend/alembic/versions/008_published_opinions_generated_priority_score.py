@@ -0,0 +1,89 @@
+"""Make published_opinions.priority_score a stored generated column.
+
+Revision ID: 008
+Revises: 007
+Create Date: priority_score GENERATED ALWAYS AS (...) STORED + (priority_score DESC, id) index
+
+The score was computed by the API on every write and could drift from its components.
+PostgreSQL cannot convert an existing column to GENERATED, so each tenant's column is
+dropped and re-added as generated in one ALTER (one table rewrite per tenant, on a worker).
+The ranked-listing index is then built with CREATE INDEX CONCURRENTLY.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import Connection, text
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently, run_per_schema
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_SCORE_EXPR = "(importance + urgency + expected_impact) * 2 + supporter_points"
+INDEX_NAME = "idx_published_opinions_priority_score"
+
+_TO_GENERATED_SQL = (
+    "ALTER TABLE {schema}.published_opinions DROP COLUMN IF EXISTS priority_score, "
+    "ADD COLUMN priority_score INTEGER NOT NULL "
+    f"GENERATED ALWAYS AS ({_SCORE_EXPR}) STORED"
+)
+_TO_PLAIN_SQL = (
+    "ALTER TABLE {schema}.published_opinions ALTER COLUMN priority_score DROP EXPRESSION, "
+    "ALTER COLUMN priority_score SET DEFAULT 0"
+)
+_CREATE_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+    "ON {schema}.published_opinions (priority_score DESC, id)"
+)
+_DROP_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{INDEX_NAME}"
+
+
+def _schemas_by_generated(conn: Connection, generated: bool) -> list[str]:
+    """Tenant schemas whose priority_score is (generated=True) or is not yet generated."""
+    schemas = tenant_schemas(conn)
+    done = set(
+        conn.execute(
+            text(
+                """
+                SELECT table_schema FROM information_schema.columns
+                WHERE table_schema = ANY(:schemas)
+                  AND table_name = 'published_opinions'
+                  AND column_name = 'priority_score'
+                  AND is_generated = 'ALWAYS'
+                """
+            ),
+            {"schemas": schemas},
+        ).scalars()
+    )
+    return [s for s in schemas if (s in done) is generated]
+
+
+def _to_generated(conn: Connection, schema_name: str) -> None:
+    conn.exec_driver_sql(_TO_GENERATED_SQL.format(schema=schema_name))
+
+
+def _to_plain(conn: Connection, schema_name: str) -> None:
+    # DROP EXPRESSION (PG13+) keeps the computed values as plain data
+    conn.exec_driver_sql(_TO_PLAIN_SQL.format(schema=schema_name))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_per_schema(conn, _schemas_by_generated(conn, False), _to_generated)
+    run_concurrently(conn, schemas, _CREATE_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_concurrently(conn, schemas, _DROP_INDEX_SQL)
+    run_per_schema(conn, _schemas_by_generated(conn, True), _to_plain)
@@ -0,0 +1,44 @@
+"""Index public.surveys for keyset pagination of the admin survey list.
+
+Revision ID: 009
+Revises: 008
+Create Date: (contract_end_date DESC, id DESC) B-tree on public.surveys
+
+GET /admin/surveys pages with WHERE (contract_end_date, id) < (:date, :id) ... LIMIT n; this
+index turns each page into a bounded range scan. Built concurrently (outside a transaction).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "idx_surveys_contract_end_date_id"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "surveys",
+            [sa.text("contract_end_date DESC"), sa.text("id DESC")],
+            schema="public",
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="surveys",
+            schema="public",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
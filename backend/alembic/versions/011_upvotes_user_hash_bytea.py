@@ -0,0 +1,101 @@
+"""Store upvotes.user_hash as a 32-byte bytea instead of 64 hex characters.
+
+Revision ID: 011
+Revises: 010
+Create Date: user_hash VARCHAR(64) -> BYTEA (octet_length = 32) + (user_hash, opinion_id) index
+
+Client votes hold hex SHA-256 digests and are decoded in place. Moderator conversions
+('modconverted' + response UUID hex) become a 16-byte marker + the 16 UUID bytes, matching
+the API. The type change rewrites each tenant's upvotes table, so it runs per schema on
+the worker pool; the lookup index is then built with CREATE INDEX CONCURRENTLY.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import Connection, text
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently, run_per_schema
+
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Keep in sync with app.routers.admin._MOD_CONVERTED_PREFIX
+_MARKER_HEX = b"modconverted".ljust(16, b"\0").hex()
+INDEX_NAME = "idx_upvotes_user_hash_opinion_id"
+CHECK_NAME = "ck_upvotes_user_hash_len"
+
+_TO_BYTEA_SQL = (
+    "ALTER TABLE {schema}.upvotes ALTER COLUMN user_hash TYPE bytea USING ("
+    "CASE WHEN left(user_hash, 12) = 'modconverted' "
+    f"THEN decode('{_MARKER_HEX}', 'hex') || decode(substr(user_hash, 13, 32), 'hex') "
+    "ELSE decode(user_hash, 'hex') END)"
+)
+_ADD_CHECK_SQL = (
+    f"ALTER TABLE {{schema}}.upvotes ADD CONSTRAINT {CHECK_NAME} "
+    "CHECK (octet_length(user_hash) = 32)"
+)
+_DROP_CHECK_SQL = f"ALTER TABLE {{schema}}.upvotes DROP CONSTRAINT IF EXISTS {CHECK_NAME}"
+_TO_VARCHAR_SQL = (
+    "ALTER TABLE {schema}.upvotes ALTER COLUMN user_hash TYPE varchar(64) USING ("
+    f"CASE WHEN substring(user_hash FROM 1 FOR 16) = decode('{_MARKER_HEX}', 'hex') "
+    "THEN 'modconverted' || encode(substring(user_hash FROM 17), 'hex') "
+    "ELSE encode(user_hash, 'hex') END)"
+)
+_CREATE_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+    "ON {schema}.upvotes (user_hash, opinion_id)"
+)
+_DROP_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{INDEX_NAME}"
+
+
+def _schemas_by_type(conn: Connection, is_bytea: bool) -> list[str]:
+    """Tenant schemas whose upvotes.user_hash is (is_bytea=True) or is not yet bytea."""
+    schemas = tenant_schemas(conn)
+    done = set(
+        conn.execute(
+            text(
+                """
+                SELECT table_schema FROM information_schema.columns
+                WHERE table_schema = ANY(:schemas)
+                  AND table_name = 'upvotes'
+                  AND column_name = 'user_hash'
+                  AND data_type = 'bytea'
+                """
+            ),
+            {"schemas": schemas},
+        ).scalars()
+    )
+    return [s for s in schemas if (s in done) is is_bytea]
+
+
+def _to_bytea(conn: Connection, schema_name: str) -> None:
+    # Type change and CHECK in one transaction per tenant (both are re-run safe via the filter)
+    conn.exec_driver_sql(_TO_BYTEA_SQL.format(schema=schema_name))
+    conn.exec_driver_sql(_ADD_CHECK_SQL.format(schema=schema_name))
+
+
+def _to_varchar(conn: Connection, schema_name: str) -> None:
+    conn.exec_driver_sql(_DROP_CHECK_SQL.format(schema=schema_name))
+    conn.exec_driver_sql(_TO_VARCHAR_SQL.format(schema=schema_name))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_per_schema(conn, _schemas_by_type(conn, False), _to_bytea)
+    run_concurrently(conn, schemas, _CREATE_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_concurrently(conn, schemas, _DROP_INDEX_SQL)
+    run_per_schema(conn, _schemas_by_type(conn, True), _to_varchar)
@@ -0,0 +1,40 @@
+"""Index each tenant's upvotes for keyset pagination of an opinion's upvotes.
+
+Revision ID: 012
+Revises: 011
+Create Date: upvotes (opinion_id, created_at DESC, id DESC)
+
+The moderation and manager upvote listings page with WHERE opinion_id = :id AND
+(created_at, id) < (:at, :id) ORDER BY created_at DESC, id DESC LIMIT n; this index turns
+each page into a bounded range scan. Built with CREATE INDEX CONCURRENTLY per tenant.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently
+
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "idx_upvotes_opinion_id_created_at"
+
+_CREATE_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+    "ON {schema}.upvotes (opinion_id, created_at DESC, id DESC)"
+)
+_DROP_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{INDEX_NAME}"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), _CREATE_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    run_concurrently(conn, tenant_schemas(conn), _DROP_INDEX_SQL)
@@ -0,0 +1,70 @@
+"""Make each tenant's (user_hash, opinion_id) upvote index unique.
+
+Revision ID: 013
+Revises: 012
+Create Date: idx_upvotes_user_hash_opinion_id -> UNIQUE uq_upvotes_user_hash_opinion_id
+
+One vote per client per opinion was only checked by the API (SELECT, then INSERT), so two
+concurrent requests could both insert. With the unique index the vote is a single
+INSERT ... ON CONFLICT DO NOTHING. Duplicates left by such races are removed first (the
+oldest vote is kept) per schema on the worker pool; the unique index is then built and the
+plain one dropped with CREATE / DROP INDEX CONCURRENTLY. The de-duplication is not undone.
+A vote inserted twice by the old code between the de-duplication and the build fails the
+build (23505) and leaves the unique index INVALID, while the plain one is still in place. A
+re-run de-duplicates again and rebuilds it (run_concurrently). The plain index is only
+dropped once the unique one is valid, because ON CONFLICT (user_hash, opinion_id) cannot use
+an INVALID index.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import Connection
+
+from _tenant_cache import tenant_schemas
+from _tenant_ops import run_concurrently, run_per_schema
+
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "idx_upvotes_user_hash_opinion_id"
+UNIQUE_INDEX_NAME = "uq_upvotes_user_hash_opinion_id"
+
+_DEDUPLICATE_SQL = (
+    "DELETE FROM {schema}.upvotes u USING {schema}.upvotes kept "
+    "WHERE u.user_hash = kept.user_hash AND u.opinion_id = kept.opinion_id AND u.id > kept.id"
+)
+_CREATE_UNIQUE_INDEX_SQL = (
+    f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {UNIQUE_INDEX_NAME} "
+    "ON {schema}.upvotes (user_hash, opinion_id)"
+)
+_DROP_UNIQUE_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{UNIQUE_INDEX_NAME}"
+_CREATE_INDEX_SQL = (
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+    "ON {schema}.upvotes (user_hash, opinion_id)"
+)
+_DROP_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {{schema}}.{INDEX_NAME}"
+
+
+def _deduplicate(conn: Connection, schema_name: str) -> None:
+    conn.exec_driver_sql(_DEDUPLICATE_SQL.format(schema=schema_name))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_per_schema(conn, schemas, _deduplicate)
+    # Per schema, in order: the plain index is dropped only after the unique build checks valid
+    run_concurrently(conn, schemas, _CREATE_UNIQUE_INDEX_SQL, _DROP_INDEX_SQL)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    schemas = tenant_schemas(conn)
+    if not schemas:
+        return
+    run_concurrently(conn, schemas, _CREATE_INDEX_SQL, _DROP_UNIQUE_INDEX_SQL)
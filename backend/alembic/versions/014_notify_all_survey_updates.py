@@ -0,0 +1,41 @@
+"""NOTIFY survey_schemas on every UPDATE of public.surveys, not only of schema_name.
+
+Revision ID: 014
+Revises: 013
+Create Date: trg_surveys_notify_schemas: UPDATE OF schema_name -> UPDATE
+
+Besides the schema cache, the same channel clears each worker's admin survey-list cache
+(app.services.survey_list_cache). Those entries also hold status, dates and the access code,
+which access-code resets and run_survey_lifecycle.py (a separate process) update without
+touching schema_name, so revision 004's trigger never reached the other workers. Survey
+rows change rarely, so a notification per updated row is cheap.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRIGGER_NAME = "trg_surveys_notify_schemas"
+
+# Revision 004 created public.notify_survey_schemas(); only the trigger's events change
+_CREATE_TRIGGER_SQL = f"""
+    CREATE TRIGGER {TRIGGER_NAME}
+    AFTER INSERT OR {{update}} OR DELETE ON public.surveys
+    FOR EACH ROW EXECUTE FUNCTION public.notify_survey_schemas()
+"""
+_DROP_TRIGGER_SQL = f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON public.surveys"
+
+
+def upgrade() -> None:
+    op.execute(_DROP_TRIGGER_SQL)
+    op.execute(_CREATE_TRIGGER_SQL.format(update="UPDATE"))
+
+
+def downgrade() -> None:
+    op.execute(_DROP_TRIGGER_SQL)
+    op.execute(_CREATE_TRIGGER_SQL.format(update="UPDATE OF schema_name"))
@@ -1,46 +1,132 @@
 """SQLAlchemy 2.0 async engine and session management."""
 
-import re
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from fastapi import Request
-from sqlalchemy import text
+from sqlalchemy import Connection, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
-# PostgreSQL identifier pattern; search_path cannot use bound params so we validate and embed
-_SCHEMA_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
-# Use NullPool so each request gets a clean connection and search_path is per-connection
+def _json_dumps(value: Any) -> str:
+    # SQLAlchemy hands the str to asyncpg's jsonb codec, which encodes it for the wire
+    return orjson.dumps(value).decode()
+
+
+# Pooled connections: tenant tables are schema-qualified at execution time through the
+# connection's schema_translate_map (no SET search_path), so no session state leaks between
+# checkouts beyond what the rollback-on-return reset already clears.
+# Prepared statements are cached per connection: tenant tables are schema-qualified in the SQL
+# text itself, so one cached statement always means the same tables and enum types. After a
+# migration alters a table, a connection's stale plan fails once and that cache is reset.
+# JSON(B): the dialect registers these as the asyncpg json/jsonb codecs on each new connection,
+# so options / disclosed_pii are (de)serialized by orjson instead of the stdlib json module.
+# UUID columns need nothing here: asyncpg's native codec already returns uuid.UUID.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
-    poolclass=NullPool,
+    # Explicit: the async engine must never fall back to a non-async-safe or no-op pool
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    # A saturated pool fails the request quickly instead of stalling the worker
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    # A ping per checkout: connections killed by a DB restart, failover or NAT idle drop are
+    # replaced before use instead of failing the request (pool_recycle alone cannot see them)
+    pool_pre_ping=True,
+    connect_args={
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+        "statement_cache_size": settings.database_statement_cache_size,
+        # Server-side GUC: the server probes idle client sockets; the pool relies on pre-ping
+        "server_settings": {"tcp_keepalives_idle": "60"},
+    },
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
+
+def is_valid_schema_name(schema_name: str) -> bool:
+    """
+    Unquoted PostgreSQL identifier check ([A-Za-z_][A-Za-z0-9_]*). Schema names are rendered
+    into SQL, so they are validated first; two str methods are cheaper than a regex match.
+    """
+    return schema_name.isascii() and schema_name.isidentifier()
+
+
+# Sync-side factory so ORM session events can be registered for AsyncSessionLocal sessions
+_SyncSessionLocal = sessionmaker()
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=_SyncSessionLocal,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
 )
 
 
+def pool_status() -> dict[str, int]:
+    """Connection pool counters for the admin health endpoint."""
+    pool = engine.pool
+    assert isinstance(pool, AsyncAdaptedQueuePool)
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.database_max_overflow,
+    }
+
+
+def _tenant_options(schema_name: str) -> dict[str, Any]:
+    # Tenant models have no schema (None); the map renders them as <schema_name>.<table>
+    return {"schema_translate_map": {None: schema_name}}
+
+
+@event.listens_for(_SyncSessionLocal, "after_begin")
+def _apply_tenant_schema(
+    session: Session, _transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Point the transaction's connection at the session's tenant schema (no SQL is sent)."""
+    schema_name = session.info.get("tenant_schema")
+    if schema_name:
+        # In place: ORM statements in this transaction run on this Connection object
+        connection.execution_options(**_tenant_options(schema_name))
+
+
+async def use_tenant_schema(session: AsyncSession, schema_name: str) -> None:
+    """
+    Schema-qualify tenant tables for the rest of the session, for handlers that resolve the
+    schema themselves (admin / manager routes). Applies to the open transaction, if any.
+    """
+    if not is_valid_schema_name(schema_name):
+        raise ValueError(f"Invalid schema name: {schema_name!r}")
+    session.info["tenant_schema"] = schema_name
+    if session.in_transaction():
+        conn = await session.connection()
+        await conn.execution_options(**_tenant_options(schema_name))
+
+
 async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency: yield an async session.
-    If SchemaSwitchingMiddleware set request.state.survey_schema_name,
-    runs SET search_path TO that schema so tenant tables are used.
+    If SchemaSwitchingMiddleware set request.state.survey_schema_name, the validated schema is
+    stored on session.info and applied as the connection's schema_translate_map at the start of
+    each transaction, so tenant queries go out schema-qualified with no extra statement.
     """
     async with AsyncSessionLocal() as session:
         schema_name = getattr(request.state, "survey_schema_name", None)
         if schema_name:
-            if not _SCHEMA_NAME_PATTERN.match(schema_name):
+            if not is_valid_schema_name(schema_name):
                 raise ValueError(f"Invalid schema name: {schema_name!r}")
-            await session.execute(text(f"SET search_path TO {schema_name}"))
+            session.info["tenant_schema"] = schema_name
         try:
             yield session
             await session.commit()
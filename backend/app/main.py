@@ -1,15 +1,36 @@
 """FastAPI application entry point."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.database import engine
+from app.middleware import schema_cache
 from app.middleware.schema_middleware import SchemaSwitchingMiddleware
 from app.routers import admin, manager, survey
 
+
+@contextlib.asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Keep the survey -> schema cache coherent via LISTEN while the app runs."""
+    listener = asyncio.create_task(schema_cache.listen_for_changes())
+    try:
+        yield
+    finally:
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+        await engine.dispose()
+
+
 app = FastAPI(
     title=settings.app_name,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # CORS last = outermost: handles OPTIONS first, adds headers to all responses (incl. 500)
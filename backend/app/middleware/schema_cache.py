@@ -0,0 +1,116 @@
+"""Process-level cache of survey_id -> tenant schema_name used by SchemaSwitchingMiddleware.
+
+A survey's schema_name never changes while the survey exists, so entries only go stale when
+a survey is deleted. A background listener (started from the app lifespan) prefetches every
+mapping and drops entries on NOTIFY survey_schemas, sent by a trigger on public.surveys
+(alembic revisions 004 and 014: every INSERT, UPDATE and DELETE), so deletions from any
+process reach every worker. The admin delete
+endpoints also invalidate directly, and the TTL bounds staleness if the listener is down.
+The same notifications drop the admin survey-list cache (services.survey_list_cache).
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+import asyncpg
+from cachetools import TTLCache
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services import survey_list_cache
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_CACHE_MAXSIZE = 10_000
+SCHEMA_CACHE_TTL_SECONDS = 300
+NOTIFY_CHANNEL = "survey_schemas"
+LISTENER_RECONNECT_SECONDS = 5.0
+
+# Reads and writes are synchronous (no await between lookup and store), so no lock is needed
+_cache: TTLCache[UUID, str] = TTLCache(maxsize=SCHEMA_CACHE_MAXSIZE, ttl=SCHEMA_CACHE_TTL_SECONDS)
+# session.info key: survey_id -> schema_name already resolved in this session (request)
+_SESSION_MEMO_KEY = "tenant_schema_by_survey"
+
+
+def get_schema_name(survey_id: UUID) -> str | None:
+    """Return the cached schema_name for survey_id, or None on miss."""
+    return _cache.get(survey_id)
+
+
+def set_schema_name(survey_id: UUID, schema_name: str) -> None:
+    _cache[survey_id] = schema_name
+
+
+async def lookup_schema_name(session: AsyncSession, survey_id: UUID) -> str | None:
+    """
+    schema_name for survey_id, or None if there is no such survey. Memoized on the session,
+    so a request resolves each survey once even if the process cache is invalidated meanwhile;
+    then the process cache; else one SELECT in the session's own transaction.
+    """
+    memo: dict[UUID, str] = session.info.setdefault(_SESSION_MEMO_KEY, {})
+    schema_name = memo.get(survey_id) or get_schema_name(survey_id)
+    if schema_name is None:
+        # Schema-qualified raw SQL: no ORM compilation, and no tenant schema needed yet
+        result = await session.execute(
+            text("SELECT schema_name FROM public.surveys WHERE id = :id"), {"id": survey_id}
+        )
+        schema_name = result.scalar_one_or_none()
+        if schema_name is None:
+            return None
+        set_schema_name(survey_id, schema_name)
+    memo[survey_id] = schema_name
+    return schema_name
+
+
+def invalidate(*survey_ids: UUID) -> None:
+    """Drop cached entries (call after a survey is deleted)."""
+    for survey_id in survey_ids:
+        _cache.pop(survey_id, None)
+
+
+def clear() -> None:
+    _cache.clear()
+
+
+def _on_notify(_conn: object, _pid: int, _channel: str, payload: str) -> None:
+    survey_list_cache.clear()
+    try:
+        invalidate(UUID(payload))
+    except ValueError:
+        clear()
+
+
+async def _listen_once() -> None:
+    """Hold one dedicated connection on LISTEN until it drops."""
+    dsn = settings.database_url.replace("postgresql+asyncpg", "postgresql")
+    conn = await asyncpg.connect(dsn)
+    closed = asyncio.Event()
+    conn.add_termination_listener(lambda _conn: closed.set())
+    try:
+        await conn.add_listener(NOTIFY_CHANNEL, _on_notify)
+        # Notifications may have been missed while disconnected: rebuild from the table
+        clear()
+        survey_list_cache.clear()
+        for survey_id, schema_name in await conn.fetch(
+            "SELECT id, schema_name FROM public.surveys"
+        ):
+            set_schema_name(survey_id, schema_name)
+        await closed.wait()
+    finally:
+        if not conn.is_closed():
+            await conn.close()
+
+
+async def listen_for_changes() -> None:
+    """Run the NOTIFY listener forever, reconnecting after errors (cancel to stop)."""
+    while True:
+        try:
+            await _listen_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("survey_schemas listener failed; retrying")
+        clear()
+        await asyncio.sleep(LISTENER_RECONNECT_SECONDS)
@@ -3,19 +3,24 @@
 import re
 from uuid import UUID
 
-from sqlalchemy import select, text
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
-from app.database import AsyncSessionLocal
-from app.models.public import Survey
+from app.database import engine
+from app.middleware import schema_cache
 
 # Paths that carry survey UUID: /survey/{uuid}, /manager/{uuid}, /admin/surveys/{uuid}
+# Bytes pattern: matched against the undecoded ASGI raw_path (all ASCII).
 SURVEY_PATH_PATTERN = re.compile(
-    r"^/(?:survey|manager|admin/surveys)/([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
+    rb"^/(?:survey|manager|admin/surveys)/([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})",
+    re.ASCII,
 )
 HEADER_SURVEY_UUID = "X-Survey-UUID"
 
+# Schema-qualified, so one prepared statement per pooled connection is valid for every tenant
+_SCHEMA_LOOKUP_SQL = "SELECT schema_name FROM public.surveys WHERE id = $1::uuid"
+_SCHEMA_LOOKUP_STMT_KEY = "schema_lookup_stmt"
+
 
 def _survey_uuid_from_request(request: Request) -> UUID | None:
     """Extract survey UUID from path (e.g. /survey/{uuid}/...) or header X-Survey-UUID."""
@@ -26,29 +31,41 @@ def _survey_uuid_from_request(request: Request) -> UUID | None:
             return UUID(header)
         except ValueError:
             pass
-    match = SURVEY_PATH_PATTERN.match(request.scope.get("path", ""))
+    raw_path = request.scope.get("raw_path") or request.scope.get("path", "").encode()
+    match = SURVEY_PATH_PATTERN.match(raw_path)
     if match:
         try:
-            return UUID(match.group(1))
+            return UUID(match.group(1).decode("ascii"))
         except ValueError:
             pass
     return None
 
 
 async def _resolve_schema_name(survey_id: UUID) -> str | None:
-    """Look up schema_name from public.surveys by survey id. Uses default search_path (public)."""
-    async with AsyncSessionLocal() as session:
-        await session.execute(text("SET search_path TO public"))
-        result = await session.execute(select(Survey.schema_name).where(Survey.id == survey_id))
-        row = result.scalar_one_or_none()
-        return row
+    """Look up schema_name by survey id: process cache first, then public.surveys."""
+    cached = schema_cache.get_schema_name(survey_id)
+    if cached is not None:
+        return cached
+    async with engine.connect() as conn:
+        # Prepared once per DBAPI connection (kept in its pool info), then bind + execute only
+        raw = await conn.get_raw_connection()
+        stmt = raw.info.get(_SCHEMA_LOOKUP_STMT_KEY)
+        if stmt is None:
+            driver_conn = raw.driver_connection
+            assert driver_conn is not None
+            stmt = await driver_conn.prepare(_SCHEMA_LOOKUP_SQL)
+            raw.info[_SCHEMA_LOOKUP_STMT_KEY] = stmt
+        schema_name: str | None = await stmt.fetchval(survey_id)
+    if schema_name is not None:
+        schema_cache.set_schema_name(survey_id, schema_name)
+    return schema_name
 
 
 class SchemaSwitchingMiddleware(BaseHTTPMiddleware):
     """
     For requests that include a survey UUID (path or X-Survey-UUID header),
     resolve the tenant schema_name from public.surveys and set request.state.survey_schema_name.
-    Route dependencies (get_db) then set search_path on the DB connection so tenant tables are used.
+    Route dependencies (get_db) then schema-qualify tenant tables via the connection's schema_translate_map.
     """
 
     async def dispatch(self, request: Request, call_next):
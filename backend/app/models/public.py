@@ -4,7 +4,7 @@ import enum
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import Date, String, Text
+from sqlalchemy import Date, Index, String, Text, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -22,7 +22,11 @@ class Survey(Base):
     """Global survey registry. Each survey has a dedicated tenant schema."""
 
     __tablename__ = "surveys"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        # Keyset pagination of the admin survey list (ORDER BY contract_end_date DESC, id DESC)
+        Index("idx_surveys_contract_end_date_id", text("contract_end_date DESC"), text("id DESC")),
+        {"schema": "public"},
+    )
 
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -4,12 +4,24 @@ import enum
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    ColumnElement,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
+from sqlalchemy.sql import func, literal_column, text
 
 from app.models.base import Base
 
@@ -27,13 +39,18 @@ class UpvoteStatus(enum.StrEnum):
     rejected = "rejected"
 
 
-# --- Tenant tables (no schema in __table_args__; search_path selects the schema) ---
+# published_opinions.priority_score is a stored generated column over the four components
+PRIORITY_SCORE_SQL = "(importance + urgency + expected_impact) * 2 + supporter_points"
+
+# --- Tenant tables (no schema in __table_args__; the session's schema_translate_map selects it) ---
 
 
 class Question(Base):
     """Dynamic form definition per survey."""
 
     __tablename__ = "questions"
+    # Serves WHERE survey_id = ? ORDER BY id without a sort node
+    __table_args__ = (Index("idx_questions_survey_id_id", "survey_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     survey_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
@@ -58,10 +75,13 @@ class RawResponse(Base):
         server_default=func.now(),
     )
 
+    # lazy="raise_on_sql": load explicitly (selectinload) so an N+1 fails loudly instead
     raw_answers: Mapped[list["RawAnswer"]] = relationship(
         "RawAnswer",
         back_populates="response",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -69,6 +89,10 @@ class RawAnswer(Base):
     """Per-question answer for a raw response."""
 
     __tablename__ = "raw_answers"
+    # A submission's answers (response detail and publish PII joins, by response_id)
+    __table_args__ = (
+        Index("idx_raw_answers_response_id_question_id", "response_id", "question_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     response_id: Mapped[UUID] = mapped_column(
@@ -84,20 +108,49 @@ class RawAnswer(Base):
     answer_text: Mapped[str] = mapped_column(Text, nullable=False)
     is_disclosure_agreed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
-    response: Mapped["RawResponse"] = relationship("RawResponse", back_populates="raw_answers")
-    question: Mapped["Question"] = relationship("Question", backref="raw_answers")
+    response: Mapped["RawResponse"] = relationship(
+        "RawResponse", back_populates="raw_answers", lazy="raise_on_sql"
+    )
+    # Question.raw_answers is never traversed; ON DELETE CASCADE removes answers with the question
+    question: Mapped["Question"] = relationship(
+        "Question",
+        backref=backref("raw_answers", lazy="raise_on_sql", passive_deletes=True),
+        lazy="raise_on_sql",
+    )
 
 
 class PublishedOpinion(Base):
-    """Moderated content derived from raw data. Score: (importance+urgency+expected_impact)*2 + supporter_points (max 14)."""
+    """Moderated content derived from raw data. Score: (importance+urgency+expected_impact)*2 + supporter_points (max 14).
+
+    The table also has a generated search_tsv tsvector (FTS, GIN-indexed); it is not mapped
+    and only referenced (as a literal column) by the public search query.
+    """
 
     __tablename__ = "published_opinions"
+    __table_args__ = (
+        # Ranked listings: ORDER BY priority_score DESC, id
+        Index(
+            "idx_published_opinions_priority_score",
+            text("priority_score DESC"),
+            "id",
+        ),
+        # jsonb_path_ops: smaller GIN that serves disclosed_pii @> '{...}' containment
+        Index(
+            "idx_published_opinions_disclosed_pii",
+            "disclosed_pii",
+            postgresql_using="gin",
+            postgresql_ops={"disclosed_pii": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     raw_response_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    priority_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Generated from the components by PostgreSQL (never written by the app)
+    priority_score: Mapped[int] = mapped_column(
+        Integer, Computed(PRIORITY_SCORE_SQL, persisted=True), nullable=False
+    )
     importance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-2
     urgency: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-2
     expected_impact: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-2
@@ -112,11 +165,40 @@ class PublishedOpinion(Base):
         nullable=False,
     )
 
+    # Fetch priority_score (and updated_at) via RETURNING on INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class Upvote(Base):
     """Support vote and optional comment on a published opinion."""
 
     __tablename__ = "upvotes"
+    __table_args__ = (
+        # Upvotes per opinion, optionally by moderation status
+        Index("idx_upvotes_opinion_id_status", "opinion_id", "status"),
+        # Keyset pages of an opinion's upvotes: ORDER BY created_at DESC, id DESC
+        Index(
+            "idx_upvotes_opinion_id_created_at",
+            "opinion_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # One vote per client per opinion (ON CONFLICT target); also "has this client voted"
+        Index("uq_upvotes_user_hash_opinion_id", "user_hash", "opinion_id", unique=True),
+        CheckConstraint("octet_length(user_hash) = 32", name="ck_upvotes_user_hash_len"),
+        # Most votes carry no comment: the partial index only holds the commented ones
+        Index(
+            "idx_upvotes_opinion_id_with_comment",
+            "opinion_id",
+            postgresql_where=text("published_comment IS NOT NULL"),
+        ),
+        Index(
+            "idx_upvotes_disclosed_pii",
+            "disclosed_pii",
+            postgresql_using="gin",
+            postgresql_ops={"disclosed_pii": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     opinion_id: Mapped[int] = mapped_column(
@@ -124,7 +206,8 @@ class Upvote(Base):
         ForeignKey("published_opinions.id", ondelete="CASCADE"),
         nullable=False,
     )
-    user_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Raw 32-byte SHA-256 digest (not hex); moderator conversions use a marker + response UUID
+    user_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     raw_comment: Mapped[str | None] = mapped_column(Text, nullable=True)
     published_comment: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[UpvoteStatus] = mapped_column(
@@ -138,3 +221,28 @@ class Upvote(Base):
         DateTime(timezone=True),
         server_default=func.now(),
     )
+
+    # Fetch created_at via RETURNING on INSERT (no refresh after flush)
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def upvote_status_is(status: UpvoteStatus) -> ColumnElement[bool]:
+    """
+    upvotes.status = '<status>' with the value inlined instead of bound: the statement text is
+    constant, and PostgreSQL plans it with that value's statistics. The untyped literal is
+    coerced to the column's enum, so no schema-qualified type name is needed.
+    """
+    return Upvote.status == literal_column(f"'{status.value}'", Upvote.status.type)
+
+
+# ASCII characters str.strip() removes; btrim() without a set trims spaces only
+_ASCII_WHITESPACE = " \t\n\r\v\f\x1c\x1d\x1e\x1f"
+
+
+def trimmed_published_comment() -> ColumnElement[str]:
+    """
+    btrim(upvotes.published_comment) for the "has a comment" tests: the admin routes store
+    published comments Python-stripped (empty -> NULL), so this only catches rows written
+    otherwise; Unicode spaces (e.g. U+3000) are not trimmed here.
+    """
+    return func.btrim(Upvote.published_comment, _ASCII_WHITESPACE)
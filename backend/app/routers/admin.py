@@ -1,17 +1,38 @@
 """Admin API: survey provisioning, question definition, moderation."""
 
-import re
+import hmac
+from collections.abc import AsyncIterator, Callable
+from datetime import date, datetime
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func, select, text
+from sqlalchemy import (
+    RowMapping,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    join,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import ProgrammingError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncMappingResult, AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, is_valid_schema_name, pool_status, use_tenant_schema
+from app.middleware import schema_cache
 from app.models.public import Survey
 from app.models.tenant import (
     PublishedOpinion,
@@ -26,29 +47,67 @@ from app.schemas.moderation import (
     ConvertToSupportCreate,
     OpinionUpdate,
     PublishedOpinionResponse,
+    PublishOpinionBulkCreate,
     PublishOpinionCreate,
     RawAnswerWithLabel,
     RawResponseDetail,
     RawResponseListItem,
     UpvoteResponse,
     UpvoteUpdate,
-    _score_from_components,
 )
-from app.schemas.question import QuestionCreate, QuestionResponse
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.schemas.question import QuestionBulkCreate, QuestionCreate, QuestionResponse
 from app.schemas.survey import SurveyCreate, SurveyCreateResponse, SurveyResponse
+from app.services import survey_list_cache
+from app.services.keyset import (
+    after_desc,
+    after_in_blocks,
+    decode_cursor,
+    decode_date,
+    decode_flag,
+    decode_int,
+    decode_timestamp,
+    encode_cursor,
+    encode_flag,
+    encode_timestamp,
+)
 from app.services.survey_lifecycle import run_survey_lifecycle
 from app.services.survey_provisioning import _generate_access_code, create_survey, delete_survey
+from app.services.upvote_counts import (
+    has_pending_upvotes,
+    list_opinion_responses,
+    list_upvote_responses,
+)
+
+# Read once at import (settings are not reloaded at runtime); None = no key configured
+_ADMIN_KEY: bytes | None = settings.admin_api_key.encode() or None
+
+
+def _admin_key_matches(candidate: str) -> bool:
+    """Constant-time comparison against ADMIN_API_KEY (bytes: compare_digest rejects non-ASCII str)."""
+    return _ADMIN_KEY is not None and hmac.compare_digest(candidate.encode(), _ADMIN_KEY)
 
 
 def _require_admin(admin_api_key: str | None = Header(default=None, alias="X-Admin-API-Key")):
-    if not settings.admin_api_key:
+    if _ADMIN_KEY is None:
         return  # No key configured = allow (dev mode)
-    if not admin_api_key or admin_api_key != settings.admin_api_key:
+    if not admin_api_key or not _admin_key_matches(admin_api_key):
         raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-API-Key")
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Enum lookup by value: a dict hit instead of Enum() + ValueError on bad input
+_QUESTION_TYPES = {m.value: m for m in QuestionType}
+_UPVOTE_STATUSES = {m.value: m for m in UpvoteStatus}
+
+_INVALID_CURSOR = HTTPException(status_code=400, detail="Invalid cursor")
+_UUID_ARRAY = ARRAY(PG_UUID(as_uuid=True))
+
+# Upvotes created by "convert to support": marker (16 bytes) + raw_response_id (16 bytes).
+# A SHA-256 client digest starting with the marker is practically impossible (2**-128).
+_MOD_CONVERTED_PREFIX = b"modconverted".ljust(16, b"\0")
+
 
 class _VerifyPasswordBody(BaseModel):
     password: str = ""
@@ -60,10 +119,10 @@ def verify_admin_password(body: _VerifyPasswordBody) -> None:
     Verify the admin password (for frontend login when VITE_ADMIN_API_KEY is not set, e.g. in Docker).
     Returns 200 if password matches ADMIN_API_KEY, 401 if not, 404 if admin is not configured.
     """
-    if not settings.admin_api_key:
+    if _ADMIN_KEY is None:
         raise HTTPException(status_code=404, detail="Admin access is not configured on the server")
     password = (body.password or "").strip()
-    if password != settings.admin_api_key:
+    if not _admin_key_matches(password):
         raise HTTPException(status_code=401, detail="Incorrect password")
     return None
 
@@ -79,6 +138,10 @@ async def create_survey_endpoint(
     Access code is returned only once - store it securely.
     """
     survey, access_code = await create_survey(db, body.name, notes=body.notes)
+    # Commit before seeding the schema cache so it never holds an uncommitted survey
+    await db.commit()
+    schema_cache.set_schema_name(survey.id, survey.schema_name)
+    survey_list_cache.clear()
     return SurveyCreateResponse(
         id=survey.id,
         name=survey.name,
@@ -91,28 +154,114 @@ async def create_survey_endpoint(
     )
 
 
-@router.get("/surveys", response_model=list[SurveyResponse])
+# Core columns for SurveyResponse: rows map straight onto the schema (no ORM hydration)
+_SURVEY_RESPONSE_COLUMNS = (
+    Survey.id,
+    Survey.name,
+    Survey.schema_name,
+    Survey.status,
+    Survey.contract_end_date,
+    Survey.deletion_due_date,
+    Survey.notes,
+    Survey.access_code_plain.label("access_code"),
+)
+
+
+def _encode_survey_cursor(contract_end_date: date | None, survey_id: UUID) -> str:
+    return encode_cursor(contract_end_date.isoformat() if contract_end_date else "", str(survey_id))
+
+
+def _decode_survey_cursor(cursor: str) -> tuple[date | None, UUID]:
+    try:
+        day, survey_id = decode_cursor(cursor, decode_date, UUID)
+    except ValueError:
+        raise _INVALID_CURSOR from None
+    return day, survey_id
+
+
+def _encode_listing_cursor(in_first_block: bool, at: datetime | None, row_id: object) -> str:
+    """Cursor for the moderation listings: (first-block flag, timestamp, id) of the last row."""
+    return encode_cursor(encode_flag(in_first_block), encode_timestamp(at), str(row_id))
+
+
+def _decode_listing_cursor(
+    cursor: str, parse_id: Callable[[str], Any]
+) -> tuple[bool, datetime | None, Any]:
+    try:
+        in_first_block, at, row_id = decode_cursor(cursor, decode_flag, decode_timestamp, parse_id)
+    except ValueError:
+        raise _INVALID_CURSOR from None
+    return in_first_block, at, row_id
+
+
+@router.get("/surveys", response_model=Page[SurveyResponse])
 async def list_surveys(
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """List all surveys (public schema)."""
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).order_by(Survey.contract_end_date.desc()))
-    surveys = result.scalars().all()
-    return [
-        SurveyResponse(
-            id=s.id,
-            name=s.name,
-            schema_name=s.schema_name,
-            status=s.status.value,
-            contract_end_date=s.contract_end_date,
-            deletion_due_date=s.deletion_due_date,
-            notes=s.notes,
-            access_code=getattr(s, "access_code_plain", None),
+    """
+    List surveys (public schema), newest contract end first (no end date first).
+    Keyset-paginated on (contract_end_date DESC, id DESC): pass next_cursor as ?after=.
+    The page is streamed as JSON while rows arrive from a server-side cursor; complete pages
+    are kept briefly in survey_list_cache.
+    """
+    cache_key = ("page", after, limit)
+    cached = survey_list_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    generation = survey_list_cache.generation()
+    stmt = select(*_SURVEY_RESPONSE_COLUMNS)
+    if after is not None:
+        # Rows with no end date sort first under DESC
+        stmt = stmt.where(
+            after_desc(Survey.contract_end_date, Survey.id, *_decode_survey_cursor(after))
         )
-        for s in surveys
-    ]
+    # One extra row tells whether another page exists. The cursor is read while the response
+    # streams: get_db's session stays open until it is sent (FastAPI >= 0.118, requirements.txt)
+    result = await db.stream(
+        stmt.order_by(Survey.contract_end_date.desc(), Survey.id.desc()).limit(limit + 1)
+    )
+    return StreamingResponse(
+        _cache_page(_stream_survey_page(result.mappings(), limit), cache_key, generation),
+        media_type="application/json",
+    )
+
+
+async def _cache_page(
+    chunks: AsyncIterator[bytes], cache_key: tuple, generation: int
+) -> AsyncIterator[bytes]:
+    """Pass chunks through; store the body once the whole page has been sent."""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        yield chunk
+    survey_list_cache.put(cache_key, bytes(body), generation)
+
+
+async def _stream_survey_page(rows: AsyncMappingResult, limit: int) -> AsyncIterator[bytes]:
+    """
+    Write a Page[SurveyResponse] as rows arrive from the server-side cursor (no row list).
+    Items are built without validation (typed columns) and encoded one by one by pydantic-core.
+    """
+    yield b'{"items":['
+    sent = 0
+    last: RowMapping | None = None
+    next_cursor = None
+    try:
+        async for row in rows:
+            if sent == limit:
+                assert last is not None
+                next_cursor = _encode_survey_cursor(last["contract_end_date"], last["id"])
+                break
+            item = SurveyResponse.model_construct(**row).model_dump_json().encode()
+            yield b"," + item if sent else item
+            sent += 1
+            last = row
+    finally:
+        await rows.close()
+    yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
 
 
 @router.get("/surveys/{survey_id}", response_model=SurveyResponse)
@@ -122,21 +271,18 @@ async def get_survey(
     _: None = Depends(_require_admin),
 ):
     """Get a single survey by ID (public schema)."""
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
+    cache_key = ("survey", survey_id)
+    cached = survey_list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = survey_list_cache.generation()
+    result = await db.execute(select(*_SURVEY_RESPONSE_COLUMNS).where(Survey.id == survey_id))
+    row = result.mappings().one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Survey not found")
-    return SurveyResponse(
-        id=survey.id,
-        name=survey.name,
-        schema_name=survey.schema_name,
-        status=survey.status.value,
-        contract_end_date=survey.contract_end_date,
-        deletion_due_date=survey.deletion_due_date,
-        notes=survey.notes,
-        access_code=getattr(survey, "access_code_plain", None),
-    )
+    survey = SurveyResponse.model_validate(row)
+    survey_list_cache.put(cache_key, survey, generation)
+    return survey
 
 
 @router.post("/surveys/{survey_id}/reset-access-code")
@@ -146,15 +292,16 @@ async def reset_access_code(
     _: None = Depends(_require_admin),
 ):
     """Generate a new Manager access code for the survey. Returns the new code (store it securely)."""
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
-        raise HTTPException(status_code=404, detail="Survey not found")
     new_code = _generate_access_code()
-    survey.access_code_plain = new_code
-    await db.flush()
-    await db.refresh(survey)
+    result = await db.execute(
+        update(Survey)
+        .where(Survey.id == survey_id)
+        .values(access_code_plain=new_code)
+        .returning(Survey.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Survey not found")
+    survey_list_cache.clear()
     return {"access_code": new_code}
 
 
@@ -169,6 +316,10 @@ async def delete_survey_endpoint(
         await delete_survey(db, survey_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    # Commit before invalidating so a concurrent lookup cannot re-cache the deleted survey
+    await db.commit()
+    schema_cache.invalidate(survey_id)
+    survey_list_cache.clear()
 
 
 @router.post("/jobs/survey-lifecycle")
@@ -181,6 +332,9 @@ async def run_survey_lifecycle_job(
     Callable via cron: curl -X POST -H "X-Admin-API-Key: $KEY" /admin/jobs/survey-lifecycle
     """
     result = await run_survey_lifecycle(db)
+    await db.commit()
+    schema_cache.invalidate(*(UUID(survey_id) for survey_id in result.deleted_ids))
+    survey_list_cache.clear()
     return {
         "suspended_count": result.suspended_count,
         "deleted_count": result.deleted_count,
@@ -189,6 +343,50 @@ async def run_survey_lifecycle_job(
     }
 
 
+@router.get("/health")
+async def admin_health(_: None = Depends(_require_admin)):
+    """Health plus DB connection pool usage (checked_out near size + max_overflow = saturated)."""
+    return {"status": "ok", "pool": pool_status()}
+
+
+async def _insert_questions(
+    db: AsyncSession, survey_id: UUID, items: list[QuestionCreate]
+) -> list[QuestionResponse]:
+    """
+    Insert questions in one multi-row INSERT ... RETURNING id (input order preserved).
+    Responses are built from the inserted values plus the returned ids: no ORM objects.
+    """
+    rows = []
+    for item in items:
+        qt = _QUESTION_TYPES.get(item.question_type)
+        if qt is None:
+            raise HTTPException(400, detail=f"Invalid question_type: {item.question_type!r}")
+        rows.append(
+            {
+                "survey_id": survey_id,
+                "label": item.label,
+                "question_type": qt,
+                "options": item.options if item.options else None,
+                "is_required": item.is_required,
+                "is_personal_data": item.is_personal_data,
+            }
+        )
+    try:
+        result = await db.scalars(
+            insert(Question).returning(Question.id, sort_by_parameter_order=True), rows
+        )
+        ids = result.all()
+    except ProgrammingError as e:
+        raise HTTPException(
+            400,
+            detail="Survey schema or tables not found. Create the survey via the Admin API first.",
+        ) from e
+    return [
+        QuestionResponse.model_validate({"id": qid, **row})
+        for qid, row in zip(ids, rows, strict=True)
+    ]
+
+
 @router.post("/surveys/{survey_id}/questions", response_model=QuestionResponse)
 async def create_question(
     survey_id: UUID,
@@ -199,66 +397,59 @@ async def create_question(
     """
     Add a question to the survey. Requires survey_id in path (middleware sets tenant schema).
     """
-    try:
-        qt = QuestionType(body.question_type)
-    except ValueError:
-        raise HTTPException(400, detail=f"Invalid question_type: {body.question_type!r}")
-    options_json = body.options if body.options else None
-    q = Question(
-        survey_id=survey_id,
-        label=body.label,
-        question_type=qt,
-        options=options_json,
-        is_required=body.is_required,
-        is_personal_data=body.is_personal_data,
-    )
-    try:
-        db.add(q)
-        await db.flush()
-        await db.refresh(q)
-    except ProgrammingError as e:
-        raise HTTPException(
-            400,
-            detail="Survey schema or tables not found. Create the survey via the Admin API first.",
-        ) from e
-    return QuestionResponse(
-        id=q.id,
-        survey_id=str(q.survey_id),
-        label=q.label,
-        question_type=q.question_type.value
-        if hasattr(q.question_type, "value")
-        else str(q.question_type),
-        options=q.options,
-        is_required=q.is_required,
-        is_personal_data=q.is_personal_data,
-    )
+    (question,) = await _insert_questions(db, survey_id, [body])
+    return question
+
+
+@router.post("/surveys/{survey_id}/questions/bulk", response_model=list[QuestionResponse])
+async def create_questions_bulk(
+    survey_id: UUID,
+    body: QuestionBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    _: None = Depends(_require_admin),
+):
+    """Add several questions in one round-trip; returned in request order."""
+    return await _insert_questions(db, survey_id, body.questions)
 
 
-@router.get("/surveys/{survey_id}/questions", response_model=list[QuestionResponse])
+@router.get("/surveys/{survey_id}/questions", response_model=Page[QuestionResponse])
 async def list_questions(
     survey_id: UUID,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """List questions for a survey (tenant schema)."""
-    result = await db.execute(
-        select(Question).where(Question.survey_id == survey_id).order_by(Question.id)
+    """
+    List questions for a survey (tenant schema) in id order.
+    Keyset-paginated on id (idx_questions_survey_id_id): pass next_cursor as ?after=.
+    """
+    stmt = select(
+        Question.id,
+        Question.survey_id,
+        Question.label,
+        Question.question_type,
+        Question.options,
+        Question.is_required,
+        Question.is_personal_data,
+    ).where(Question.survey_id == survey_id)
+    if after is not None:
+        try:
+            after_id = decode_int(after)
+        except ValueError:
+            raise _INVALID_CURSOR from None
+        stmt = stmt.where(Question.id > after_id)
+    result = await db.execute(stmt.order_by(Question.id).limit(limit + 1))
+    rows = result.mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = str(rows[-1]["id"])
+    # Rows come straight from typed columns: build without validation (FastAPI accepts
+    # the instances as-is and only serializes them)
+    return Page[QuestionResponse].model_construct(
+        items=[QuestionResponse.model_construct(**row) for row in rows], next_cursor=next_cursor
     )
-    questions = result.scalars().all()
-    return [
-        QuestionResponse(
-            id=q.id,
-            survey_id=str(q.survey_id),
-            label=q.label,
-            question_type=q.question_type.value
-            if hasattr(q.question_type, "value")
-            else str(q.question_type),
-            options=q.options,
-            is_required=q.is_required,
-            is_personal_data=q.is_personal_data,
-        )
-        for q in questions
-    ]
 
 
 @router.delete("/surveys/{survey_id}/questions/{question_id}")
@@ -268,55 +459,39 @@ async def delete_question(
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """Delete a question from the survey (tenant schema)."""
+    """Delete a question from the survey (tenant schema). Its raw_answers go via ON DELETE CASCADE."""
+    # One DELETE ... RETURNING: no fetch, and no ORM load of the question's raw_answers
     result = await db.execute(
-        select(Question).where(
-            Question.survey_id == survey_id,
-            Question.id == question_id,
-        )
+        delete(Question)
+        .where(Question.survey_id == survey_id, Question.id == question_id)
+        .returning(Question.id)
     )
-    q = result.scalar_one_or_none()
-    if not q:
+    deleted_id = result.scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Question not found")
-    await db.delete(q)
-    return {"deleted": question_id}
+    return {"deleted": deleted_id}
 
 
 # --- Moderation & Published Opinions ---
 
 
-def _priority_score(
-    importance: int, urgency: int, expected_impact: int, supporter_count: int = 0
-) -> int:
-    """14-point scale: (Imp+Urg+Exp)*2 + supporters(0-2). Supporters mapped: 0->0, 1-2->1, 3+->2."""
-    supporters_pts = min(2, (supporter_count > 0) + (supporter_count >= 3))
-    return (importance + urgency + expected_impact) * 2 + supporters_pts
-
-
 def _supporters_pts_from_count(supporter_count: int) -> int:
     """Map supporter count to 0-2 points."""
     return min(2, (supporter_count > 0) + (supporter_count >= 3))
 
 
-_SCHEMA_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
-
-
 async def _get_tenant_schema(db: AsyncSession, survey_id: UUID) -> str:
-    """Resolve tenant schema_name from public.surveys. Raises 404 if not found."""
-    await db.execute(text("SET search_path TO public"))
-    # Use raw SQL to avoid any ORM/schema resolution ambiguity
-    r = await db.execute(
-        text("SELECT schema_name FROM public.surveys WHERE id = :id"),
-        {"id": str(survey_id)},
-    )
-    row = r.mappings().first()
-    if not row:
+    """
+    Resolve tenant schema_name (session memo, process cache, else public.surveys). Raises 404
+    if not found. A warm hit is a dict lookup with no SQL.
+    """
+    schema_name = await schema_cache.lookup_schema_name(db, survey_id)
+    if schema_name is None:
         raise HTTPException(
             status_code=404,
             detail=f"Survey not found: {survey_id}. Check GET /admin/surveys and ensure the same DB is used.",
         )
-    schema_name = str(row["schema_name"])
-    if not _SCHEMA_NAME_PATTERN.match(schema_name):
+    if not is_valid_schema_name(schema_name):
         raise HTTPException(status_code=400, detail="Invalid schema name")
     return schema_name
 
@@ -330,32 +505,63 @@ async def get_response(
 ):
     """Get one raw response with answers and question labels (moderation workspace)."""
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
+    await use_tenant_schema(db, schema_name)
+    # Response and its answers (with question labels) in one round-trip; the LEFT JOIN keeps a
+    # response that has no answers
     result = await db.execute(
-        select(RawResponse)
+        select(
+            RawResponse.submitted_at,
+            RawAnswer.question_id,
+            Question.label,
+            RawAnswer.answer_text,
+            RawAnswer.is_disclosure_agreed,
+            Question.is_personal_data,
+        )
+        .select_from(RawResponse)
+        .outerjoin(
+            join(RawAnswer, Question, RawAnswer.question_id == Question.id),
+            RawAnswer.response_id == RawResponse.id,
+        )
         .where(RawResponse.id == response_id)
-        .options(selectinload(RawResponse.raw_answers).selectinload(RawAnswer.question))
+        .order_by(RawAnswer.question_id)
     )
-    response = result.scalar_one_or_none()
-    if not response:
+    rows = result.all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Response not found")
+    # Typed columns: build without re-validation
     answers = [
-        RawAnswerWithLabel(
-            question_id=a.question_id,
-            label=a.question.label,
-            answer_text=a.answer_text,
-            is_disclosure_agreed=a.is_disclosure_agreed,
-            is_personal_data=a.question.is_personal_data,
+        RawAnswerWithLabel.model_construct(
+            question_id=r.question_id,
+            label=r.label,
+            answer_text=r.answer_text,
+            is_disclosure_agreed=r.is_disclosure_agreed,
+            is_personal_data=r.is_personal_data,
         )
-        for a in sorted(response.raw_answers, key=lambda x: x.question_id)
+        for r in rows
+        if r.question_id is not None
     ]
+    submitted_at = rows[0].submitted_at
     return RawResponseDetail(
-        id=str(response.id),
-        submitted_at=response.submitted_at.isoformat() if response.submitted_at else "",
+        id=str(response_id),
+        submitted_at=submitted_at.isoformat() if submitted_at else "",
         answers=answers,
     )
 
 
+# RETURNING of convert_response_to_support (every UpvoteResponse field)
+_UPVOTE_RESPONSE_COLUMNS = (
+    Upvote.id,
+    Upvote.opinion_id,
+    Upvote.user_hash,
+    Upvote.raw_comment,
+    Upvote.published_comment,
+    Upvote.status,
+    Upvote.created_at,
+    Upvote.is_disclosure_agreed,
+    Upvote.disclosed_pii,
+)
+
+
 @router.post(
     "/moderation/{survey_id}/responses/{response_id}/convert-to-support",
     response_model=UpvoteResponse,
@@ -369,46 +575,54 @@ async def convert_response_to_support(
 ):
     """Convert a submitted response to support (upvote) for an existing opinion. Creates Upvote with status=published."""
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    resp_result = await db.execute(select(RawResponse).where(RawResponse.id == response_id))
-    raw_response = resp_result.scalar_one_or_none()
-    if not raw_response:
-        raise HTTPException(status_code=404, detail="Response not found")
-    pub_result = await db.execute(
-        select(PublishedOpinion).where(PublishedOpinion.raw_response_id == response_id)
+    await use_tenant_schema(db, schema_name)
+    # The three preconditions in one round-trip
+    checks = await db.execute(
+        select(
+            exists().where(RawResponse.id == response_id),
+            exists().where(PublishedOpinion.raw_response_id == response_id),
+            exists().where(PublishedOpinion.id == body.opinion_id),
+        )
     )
-    if pub_result.scalar_one_or_none():
+    response_exists, already_published, opinion_exists = checks.one()
+    if not response_exists:
+        raise HTTPException(status_code=404, detail="Response not found")
+    if already_published:
         raise HTTPException(
             status_code=400,
             detail="Response is already published as an opinion. Cannot convert to support.",
         )
-    opinion_result = await db.execute(
-        select(PublishedOpinion).where(PublishedOpinion.id == body.opinion_id)
-    )
-    opinion = opinion_result.scalar_one_or_none()
-    if not opinion:
+    if not opinion_exists:
         raise HTTPException(status_code=404, detail="Opinion not found")
-    user_hash = f"mod-converted-{response_id}".replace("-", "")[:64]
+    user_hash = _MOD_CONVERTED_PREFIX + response_id.bytes
     # Store PII whenever entered (for admin moderation); is_disclosure_agreed controls Manager visibility
     disclosed_pii = None
     if body.disclosed_pii:
         disclosed_pii = {k: str(v) for k, v in body.disclosed_pii.items() if v}
-    upvote = Upvote(
-        opinion_id=body.opinion_id,
-        user_hash=user_hash,
-        raw_comment=None,
-        published_comment=(body.published_comment or "").strip() or None,
-        status=UpvoteStatus.published,
-        is_disclosure_agreed=body.is_disclosure_agreed,
-        disclosed_pii=disclosed_pii,
+    # The unique (user_hash, opinion_id) index: converting the same response twice is a no-op
+    result = await db.execute(
+        pg_insert(Upvote)
+        .values(
+            opinion_id=body.opinion_id,
+            user_hash=user_hash,
+            raw_comment=None,
+            published_comment=(body.published_comment or "").strip() or None,
+            status=UpvoteStatus.published,
+            is_disclosure_agreed=body.is_disclosure_agreed,
+            disclosed_pii=disclosed_pii,
+        )
+        .on_conflict_do_nothing(index_elements=[Upvote.user_hash, Upvote.opinion_id])
+        .returning(*_UPVOTE_RESPONSE_COLUMNS)
     )
-    db.add(upvote)
-    await db.flush()
-    await db.refresh(upvote)
+    upvote = result.one_or_none()
+    if upvote is None:
+        raise HTTPException(
+            status_code=409, detail="Response is already converted to support for this opinion."
+        )
     return UpvoteResponse(
         id=upvote.id,
         opinion_id=upvote.opinion_id,
-        user_hash=upvote.user_hash,
+        user_hash=upvote.user_hash.hex(),
         raw_comment=upvote.raw_comment,
         published_comment=upvote.published_comment,
         status=upvote.status.value,
@@ -418,14 +632,19 @@ async def convert_response_to_support(
     )
 
 
-@router.get("/moderation/{survey_id}/submissions", response_model=list[RawResponseListItem])
+@router.get("/moderation/{survey_id}/submissions", response_model=Page[RawResponseListItem])
 async def list_submissions(
     survey_id: UUID,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """List raw responses for moderation workspace."""
-    return await _list_raw_responses_impl(db, survey_id)
+    """
+    List raw responses for moderation workspace: pending first, then newest first.
+    Keyset-paginated on (pending, submitted_at DESC, id DESC): pass next_cursor as ?after=.
+    """
+    return await _list_raw_responses_impl(db, survey_id, after, limit)
 
 
 @router.patch(
@@ -438,35 +657,26 @@ async def update_opinion(
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """Update title, content, and/or score components (Imp, Urg, Impact, supporters 0-2). Recomputes priority_score."""
+    """Update title, content, and/or score components (Imp, Urg, Impact, supporters 0-2). priority_score is regenerated by the database."""
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(select(PublishedOpinion).where(PublishedOpinion.id == opinion_id))
-    opinion = result.scalar_one_or_none()
+    await use_tenant_schema(db, schema_name)
+    # OpinionUpdate fields are named after the columns; omitted fields are left unchanged
+    values = body.model_dump(exclude_none=True)
+    if "admin_notes" in values:
+        values["admin_notes"] = values["admin_notes"].strip() or None
+    if values:
+        # One UPDATE ... RETURNING: regenerated priority_score and updated_at come back with it
+        result = await db.execute(
+            update(PublishedOpinion)
+            .where(PublishedOpinion.id == opinion_id)
+            .values(**values)
+            .returning(PublishedOpinion)
+        )
+        opinion = result.scalar_one_or_none()
+    else:
+        opinion = await db.get(PublishedOpinion, opinion_id)
     if not opinion:
         raise HTTPException(status_code=404, detail="Opinion not found")
-    if body.title is not None:
-        opinion.title = body.title
-    if body.content is not None:
-        opinion.content = body.content
-    if body.admin_notes is not None:
-        opinion.admin_notes = (body.admin_notes or "").strip() or None
-    if body.importance is not None:
-        opinion.importance = body.importance
-    if body.urgency is not None:
-        opinion.urgency = body.urgency
-    if body.expected_impact is not None:
-        opinion.expected_impact = body.expected_impact
-    if body.supporter_points is not None:
-        opinion.supporter_points = body.supporter_points
-    opinion.priority_score = _score_from_components(
-        opinion.importance,
-        opinion.urgency,
-        opinion.expected_impact,
-        opinion.supporter_points,
-    )
-    await db.flush()
-    await db.refresh(opinion)
     return PublishedOpinionResponse(
         id=opinion.id,
         raw_response_id=str(opinion.raw_response_id),
@@ -478,106 +688,73 @@ async def update_opinion(
         urgency=opinion.urgency,
         expected_impact=opinion.expected_impact,
         supporter_points=opinion.supporter_points,
-        is_disclosure_agreed=getattr(opinion, "is_disclosure_agreed", False),
+        is_disclosure_agreed=opinion.is_disclosure_agreed,
         disclosed_pii=opinion.disclosed_pii,
     )
 
 
-@router.get("/moderation/{survey_id}/opinions", response_model=list[PublishedOpinionResponse])
+@router.get("/moderation/{survey_id}/opinions", response_model=Page[PublishedOpinionResponse])
 async def list_opinions_alt(
     survey_id: UUID,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """List published opinions for the survey (tenant schema)."""
+    """
+    List published opinions for the survey (tenant schema): opinions with pending upvotes
+    first, then by updated_at desc. Keyset-paginated on (has pending, updated_at DESC, id DESC):
+    pass next_cursor as ?after=.
+    """
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(PublishedOpinion).order_by(PublishedOpinion.updated_at.desc(), PublishedOpinion.id)
-    )
-    opinions = result.scalars().all()
-    opinion_ids = [o.id for o in opinions]
-    supporters_by_opinion: dict[int, int] = {}
-    pending_by_opinion: dict[int, int] = {}
-    if opinion_ids:
-        supporters_result = await db.execute(
-            select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-            .where(Upvote.opinion_id.in_(opinion_ids))
-            .group_by(Upvote.opinion_id)
-        )
-        supporters_by_opinion = {
-            row[0]: int(row[1]) if row[1] is not None else 0 for row in supporters_result.all()
-        }
-        pending_result = await db.execute(
-            select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-            .where(
-                Upvote.opinion_id.in_(opinion_ids),
-                Upvote.status == UpvoteStatus.pending,
+    await use_tenant_schema(db, schema_name)
+    pending = has_pending_upvotes()
+    where = []
+    if after is not None:
+        cur_pending, cur_updated_at, cur_id = _decode_listing_cursor(after, decode_int)
+        where.append(
+            after_in_blocks(
+                pending,
+                cur_pending,
+                after_desc(
+                    PublishedOpinion.updated_at, PublishedOpinion.id, cur_updated_at, cur_id
+                ),
             )
-            .group_by(Upvote.opinion_id)
-        )
-        pending_by_opinion = {
-            row[0]: int(row[1]) if row[1] is not None else 0 for row in pending_result.all()
-        }
-
-    # Prioritize opinions with pending upvotes, then by updated_at desc
-    def _opinion_sort_key(o: PublishedOpinion) -> tuple:
-        has_pending = 0 if pending_by_opinion.get(o.id, 0) > 0 else 1
-        ts = o.updated_at.timestamp() if o.updated_at else 0.0
-        return (has_pending, -ts)
-
-    sorted_opinions = sorted(opinions, key=_opinion_sort_key)
-    return [
-        PublishedOpinionResponse(
-            id=o.id,
-            raw_response_id=str(o.raw_response_id),
-            title=o.title,
-            content=o.content,
-            admin_notes=getattr(o, "admin_notes", None),
-            priority_score=o.priority_score,
-            importance=getattr(o, "importance", 0),
-            urgency=getattr(o, "urgency", 0),
-            expected_impact=getattr(o, "expected_impact", 0),
-            supporter_points=getattr(o, "supporter_points", 0),
-            supporters=supporters_by_opinion.get(o.id, 0),
-            pending_upvotes_count=pending_by_opinion.get(o.id, 0),
-            is_disclosure_agreed=getattr(o, "is_disclosure_agreed", False),
-            disclosed_pii=o.disclosed_pii,
         )
-        for o in sorted_opinions
-    ]
+    return await list_opinion_responses(
+        db,
+        pending.desc(),
+        PublishedOpinion.updated_at.desc(),
+        PublishedOpinion.id.desc(),
+        limit=limit,
+        where=where,
+        cursor_of=lambda row: _encode_listing_cursor(
+            row["pending_upvotes_count"] > 0, row["updated_at"], row["id"]
+        ),
+    )
 
 
 @router.get(
-    "/moderation/{survey_id}/opinions/{opinion_id}/upvotes", response_model=list[UpvoteResponse]
+    "/moderation/{survey_id}/opinions/{opinion_id}/upvotes", response_model=Page[UpvoteResponse]
 )
 async def list_upvotes_for_opinion(
     survey_id: UUID,
     opinion_id: int,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(_require_admin),
 ):
-    """List upvotes (with raw_comment, published_comment, status) for an opinion. For moderation."""
+    """
+    List upvotes (with raw_comment, published_comment, status) for an opinion. For moderation.
+    Newest first, keyset-paginated on (created_at DESC, id DESC): pass next_cursor as ?after=.
+    """
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(Upvote).where(Upvote.opinion_id == opinion_id).order_by(Upvote.created_at.desc())
-    )
-    upvotes = result.scalars().all()
-    return [
-        UpvoteResponse(
-            id=u.id,
-            opinion_id=u.opinion_id,
-            user_hash=u.user_hash,
-            raw_comment=u.raw_comment,
-            published_comment=u.published_comment,
-            status=u.status.value,
-            created_at=u.created_at.isoformat() if u.created_at else "",
-            is_disclosure_agreed=u.is_disclosure_agreed,
-            disclosed_pii=u.disclosed_pii,
-        )
-        for u in upvotes
-    ]
+    await use_tenant_schema(db, schema_name)
+    try:
+        return await list_upvote_responses(db, opinion_id, limit=limit, after=after)
+    except ValueError:
+        raise _INVALID_CURSOR from None
 
 
 @router.patch("/moderation/{survey_id}/upvotes/{upvote_id}", response_model=UpvoteResponse)
@@ -590,26 +767,30 @@ async def update_upvote(
 ):
     """Set published_comment and/or status (pending, published, rejected) for an upvote."""
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(select(Upvote).where(Upvote.id == upvote_id))
-    upvote = result.scalar_one_or_none()
-    if not upvote:
-        raise HTTPException(status_code=404, detail="Upvote not found")
+    await use_tenant_schema(db, schema_name)
+    values: dict[str, Any] = {}
     if body.published_comment is not None:
-        upvote.published_comment = body.published_comment.strip() or None
+        values["published_comment"] = body.published_comment.strip() or None
     if body.status is not None:
-        try:
-            upvote.status = UpvoteStatus(body.status)
-        except ValueError:
+        status = _UPVOTE_STATUSES.get(body.status)
+        if status is None:
             raise HTTPException(
                 status_code=400, detail="status must be pending, published, or rejected"
             )
-    await db.flush()
-    await db.refresh(upvote)
+        values["status"] = status
+    if values:
+        result = await db.execute(
+            update(Upvote).where(Upvote.id == upvote_id).values(**values).returning(Upvote)
+        )
+        upvote = result.scalar_one_or_none()
+    else:
+        upvote = await db.get(Upvote, upvote_id)
+    if not upvote:
+        raise HTTPException(status_code=404, detail="Upvote not found")
     return UpvoteResponse(
         id=upvote.id,
         opinion_id=upvote.opinion_id,
-        user_hash=upvote.user_hash,
+        user_hash=upvote.user_hash.hex(),
         raw_comment=upvote.raw_comment,
         published_comment=upvote.published_comment,
         status=upvote.status.value,
@@ -619,61 +800,155 @@ async def update_upvote(
     )
 
 
-def _uuid_from_mod_converted_hash(user_hash: str) -> UUID | None:
-    """Extract response_id from user_hash like 'modconverted550e8400e29b41d4a716446655440000'.
-    Note: create uses .replace('-','') so 'mod-converted-' becomes 'modconverted'.
-    """
-    prefix = "modconverted"
-    if not user_hash.startswith(prefix) or len(user_hash) < len(prefix) + 32:
-        return None
-    rest = user_hash[len(prefix) :]
-    if len(rest) >= 32:
-        try:
-            return UUID(f"{rest[0:8]}-{rest[8:12]}-{rest[12:16]}-{rest[16:20]}-{rest[20:32]}")
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-async def _list_raw_responses_impl(db: AsyncSession, survey_id: UUID) -> list[RawResponseListItem]:
+async def _list_raw_responses_impl(
+    db: AsyncSession, survey_id: UUID, after: str | None, limit: int
+) -> Page[RawResponseListItem]:
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(select(RawResponse).order_by(RawResponse.submitted_at.desc()))
-    responses = result.scalars().all()
+    await use_tenant_schema(db, schema_name)
+    # Status is computed in the same statement: outer joins to the de-duplicated published /
+    # converted ids, so both tables are scanned once (hash joins), not probed per response.
+    prefix_len = len(_MOD_CONVERTED_PREFIX)
+    published = select(PublishedOpinion.raw_response_id).distinct().subquery()
+    converted = (
+        select(func.substring(Upvote.user_hash, prefix_len + 1).label("response_uuid"))
+        .where(func.substring(Upvote.user_hash, 1, prefix_len) == _MOD_CONVERTED_PREFIX)
+        .distinct()
+        .subquery()
+    )
+    listing = (
+        select(
+            RawResponse.id,
+            RawResponse.submitted_at,
+            case(
+                (published.c.raw_response_id.is_not(None), "published"),
+                (converted.c.response_uuid.is_not(None), "converted_to_support"),
+                else_="pending",
+            ).label("status"),
+        )
+        .outerjoin(published, published.c.raw_response_id == RawResponse.id)
+        .outerjoin(converted, converted.c.response_uuid == func.uuid_send(RawResponse.id))
+        .subquery()
+    )
+    pending = listing.c.status == "pending"
+    stmt = select(listing)
+    if after is not None:
+        cur_pending, cur_submitted_at, cur_id = _decode_listing_cursor(after, UUID)
+        stmt = stmt.where(
+            after_in_blocks(
+                pending,
+                cur_pending,
+                after_desc(
+                    listing.c.submitted_at, listing.c.id, cur_submitted_at, cur_id, nulls_last=True
+                ),
+            )
+        )
+    # Pending first, then by submitted_at descending (newest first)
+    result = await db.execute(
+        stmt.order_by(
+            pending.desc(), listing.c.submitted_at.desc().nulls_last(), listing.c.id.desc()
+        ).limit(limit + 1)
+    )
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_listing_cursor(last.status == "pending", last.submitted_at, last.id)
+    # Fields are already plain str: skip model validation (the response model still
+    # serializes them straight to JSON bytes)
+    items = [
+        RawResponseListItem.model_construct(
+            id=str(r.id),
+            submitted_at=r.submitted_at.isoformat() if r.submitted_at else "",
+            status=r.status,
+        )
+        for r in rows
+    ]
+    return Page[RawResponseListItem].model_construct(items=items, next_cursor=next_cursor)
 
-    pub_result = await db.execute(select(PublishedOpinion.raw_response_id))
-    published_ids = set(pub_result.scalars().all())
 
-    upvote_result = await db.execute(
-        select(Upvote.user_hash).where(Upvote.user_hash.like("modconverted%"))
+async def _publish_opinions(
+    db: AsyncSession, survey_id: UUID, items: list[PublishOpinionCreate]
+) -> list[PublishedOpinionResponse]:
+    """
+    Publish opinions from raw responses: one query for every response's PII answers, then one
+    INSERT ... RETURNING for all rows (input order preserved). 404 if any response is missing.
+    disclosed_pii holds the non-empty PII answers in question order.
+    """
+    raw_response_ids = [item.raw_response_id for item in items]
+    # Response rows outer-joined to their PII answers: a response without any still yields a row
+    pii_answers = join(
+        RawAnswer,
+        Question,
+        and_(
+            Question.id == RawAnswer.question_id,
+            Question.survey_id == survey_id,
+            Question.is_personal_data.is_(True),
+        ),
+    )
+    result = await db.execute(
+        select(
+            RawResponse.id, Question.label, RawAnswer.answer_text, RawAnswer.is_disclosure_agreed
+        )
+        .select_from(RawResponse)
+        .outerjoin(pii_answers, RawAnswer.response_id == RawResponse.id)
+        # One uuid[] parameter rather than IN (:p1, ...): the same statement for any batch size
+        .where(
+            RawResponse.id
+            == any_(bindparam("raw_response_ids", list(set(raw_response_ids)), type_=_UUID_ARRAY))
+        )
+        .order_by(RawResponse.id, Question.id)
+    )
+    pii_by_response: dict[UUID, dict[str, str]] = {}
+    agreed_by_response: dict[UUID, bool] = {}
+    for response_id, label, answer_text, agreed in result.all():
+        disclosed = pii_by_response.setdefault(response_id, {})
+        agreed_by_response.setdefault(response_id, True)
+        if label is not None and answer_text and answer_text.strip():
+            disclosed[label] = answer_text.strip()
+            if not agreed:
+                agreed_by_response[response_id] = False
+    if any(rid not in pii_by_response for rid in raw_response_ids):
+        raise HTTPException(status_code=404, detail="Raw response not found")
+    supporter_pts = _supporters_pts_from_count(0)
+    rows = []
+    for item, rid in zip(items, raw_response_ids, strict=True):
+        disclosed_pii = pii_by_response[rid]
+        rows.append(
+            {
+                "raw_response_id": rid,
+                "title": item.title,
+                "content": item.content,
+                "admin_notes": (item.admin_notes or "").strip() or None,
+                "importance": item.importance,
+                "urgency": item.urgency,
+                "expected_impact": item.expected_impact,
+                "supporter_points": supporter_pts,
+                "is_disclosure_agreed": agreed_by_response[rid] and bool(disclosed_pii),
+                "disclosed_pii": disclosed_pii or None,
+            }
+        )
+    # insertmanyvalues: many rows go out as batched multi-row INSERTs, RETURNING every column
+    # (id, generated priority_score, updated_at)
+    opinions = await db.scalars(
+        insert(PublishedOpinion).returning(PublishedOpinion, sort_by_parameter_order=True), rows
     )
-    converted_ids = set()
-    for (h,) in upvote_result.all():
-        uid = _uuid_from_mod_converted_hash(h)
-        if uid:
-            converted_ids.add(uid)
-
-    def _status(r: RawResponse) -> str:
-        if r.id in published_ids:
-            return "published"
-        if r.id in converted_ids:
-            return "converted_to_support"
-        return "pending"
-
-    def _sort_key(r: RawResponse) -> tuple:
-        """Pending first, then by submitted_at descending (newest first)."""
-        priority = 0 if _status(r) == "pending" else 1
-        ts = r.submitted_at.timestamp() if r.submitted_at else 0.0
-        return (priority, -ts)
-
-    sorted_responses = sorted(responses, key=_sort_key)
     return [
-        RawResponseListItem(
-            id=str(r.id),
-            submitted_at=r.submitted_at.isoformat() if r.submitted_at else "",
-            status=_status(r),
+        PublishedOpinionResponse(
+            id=o.id,
+            raw_response_id=str(o.raw_response_id),
+            title=o.title,
+            content=o.content,
+            admin_notes=o.admin_notes,
+            priority_score=o.priority_score,
+            importance=o.importance,
+            urgency=o.urgency,
+            expected_impact=o.expected_impact,
+            supporter_points=o.supporter_points,
+            is_disclosure_agreed=o.is_disclosure_agreed,
+            disclosed_pii=o.disclosed_pii,
         )
-        for r in sorted_responses
+        for o in opinions.all()
     ]
 
 
@@ -686,65 +961,19 @@ async def create_opinion(
 ):
     """Create published_opinion from a raw response. Builds disclosed_pii from PII answers with consent (order follows question order)."""
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(RawResponse)
-        .where(RawResponse.id == UUID(body.raw_response_id))
-        .options(selectinload(RawResponse.raw_answers).selectinload(RawAnswer.question))
-    )
-    response = result.scalar_one_or_none()
-    if not response:
-        raise HTTPException(status_code=404, detail="Raw response not found")
-    questions_result = await db.execute(
-        select(Question)
-        .where(Question.survey_id == survey_id, Question.is_personal_data.is_(True))
-        .order_by(Question.id)
-    )
-    pii_questions = questions_result.scalars().all()
-    answers_by_qid = {a.question_id: a for a in response.raw_answers}
-    disclosed_pii: dict[str, str] = {}
-    all_agreed = True
-    for q in pii_questions:
-        a = answers_by_qid.get(q.id)
-        if a and a.answer_text and a.answer_text.strip():
-            disclosed_pii[q.label] = a.answer_text.strip()
-            if not a.is_disclosure_agreed:
-                all_agreed = False
-    supporter_count = 0
-    supporter_pts = _supporters_pts_from_count(supporter_count)
-    priority = _priority_score(
-        body.importance,
-        body.urgency,
-        body.expected_impact,
-        supporter_count,
-    )
-    opinion = PublishedOpinion(
-        raw_response_id=response.id,
-        title=body.title,
-        content=body.content,
-        admin_notes=(body.admin_notes or "").strip() or None,
-        priority_score=priority,
-        importance=body.importance,
-        urgency=body.urgency,
-        expected_impact=body.expected_impact,
-        supporter_points=supporter_pts,
-        is_disclosure_agreed=all_agreed and bool(disclosed_pii),
-        disclosed_pii=disclosed_pii if disclosed_pii else None,
-    )
-    db.add(opinion)
-    await db.flush()
-    await db.refresh(opinion)
-    return PublishedOpinionResponse(
-        id=opinion.id,
-        raw_response_id=str(opinion.raw_response_id),
-        title=opinion.title,
-        content=opinion.content,
-        admin_notes=opinion.admin_notes,
-        priority_score=opinion.priority_score,
-        importance=opinion.importance,
-        urgency=opinion.urgency,
-        expected_impact=opinion.expected_impact,
-        supporter_points=opinion.supporter_points,
-        is_disclosure_agreed=opinion.is_disclosure_agreed,
-        disclosed_pii=opinion.disclosed_pii,
-    )
+    await use_tenant_schema(db, schema_name)
+    (opinion,) = await _publish_opinions(db, survey_id, [body])
+    return opinion
+
+
+@router.post("/surveys/{survey_id}/opinions/bulk", response_model=list[PublishedOpinionResponse])
+async def create_opinions_bulk(
+    survey_id: UUID,
+    body: PublishOpinionBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    _: None = Depends(_require_admin),
+):
+    """Publish several opinions in one request (all or none); returned in request order."""
+    schema_name = await _get_tenant_schema(db, survey_id)
+    await use_tenant_schema(db, schema_name)
+    return await _publish_opinions(db, survey_id, body.opinions)
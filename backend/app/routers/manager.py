@@ -1,44 +1,76 @@
 """Manager API: client HR dashboard with Access Code auth and export."""
 
+import asyncio
+import hashlib
+import hmac
+import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import jwt
-from fastapi import APIRouter, Depends, Header, HTTPException
-from sqlalchemy import and_, func, select, text
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, use_tenant_schema
+from app.middleware import schema_cache
 from app.models.public import Survey
-from app.models.tenant import PublishedOpinion, Upvote, UpvoteStatus
+from app.models.tenant import (
+    PublishedOpinion,
+    Upvote,
+    UpvoteStatus,
+    trimmed_published_comment,
+    upvote_status_is,
+)
 from app.schemas.moderation import PublishedOpinionResponse, UpvoteResponse
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.services.keyset import decode_cursor, decode_int, encode_cursor
+from app.services.upvote_counts import (
+    list_opinion_responses,
+    list_upvote_responses,
+    supporters_per_opinion,
+)
 
 router = APIRouter(prefix="/manager", tags=["manager"])
 
+_INVALID_CURSOR = HTTPException(status_code=400, detail="Invalid cursor")
+
+# Characters not allowed in the export's Content-Disposition filename
+_UNSAFE_FILENAME = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+
+TOKEN_CACHE_MAXSIZE = 2_048
+TOKEN_CACHE_TTL_SECONDS = 30
+# Verified manager tokens: blake2b(token) -> (sub, exp). Sync access only, so no lock
+_token_cache: TTLCache[bytes, tuple[str, float]] = TTLCache(
+    maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL_SECONDS
+)
+
 
 async def _get_tenant_schema(db: AsyncSession, survey_id: UUID) -> str:
-    """Resolve tenant schema_name from public.surveys. Raises 404 if not found."""
-    await db.execute(text("SET search_path TO public"))
-    r = await db.execute(
-        text("SELECT schema_name FROM public.surveys WHERE id = :id"),
-        {"id": str(survey_id)},
-    )
-    row = r.mappings().first()
-    if not row:
+    """Resolve tenant schema_name (session memo, process cache, else public.surveys), or 404."""
+    schema_name = await schema_cache.lookup_schema_name(db, survey_id)
+    if schema_name is None:
         raise HTTPException(status_code=404, detail="Survey not found")
-    return str(row["schema_name"])
+    return schema_name
 
 
 def _verify_access_code(plain: str, stored: str | None) -> bool:
     if not stored or not plain:
         return False
-    return plain.strip() == stored.strip()
+    # Fixed-length digests + compare_digest: the time taken says nothing about the stored code
+    return hmac.compare_digest(_access_code_digest(plain), _access_code_digest(stored))
+
+
+def _access_code_digest(code: str) -> bytes:
+    return hashlib.blake2b(code.strip().encode(), digest_size=32).digest()
 
 
-def _create_manager_token(survey_id: UUID) -> str:
+def _create_manager_token(survey_id: UUID, survey_name: str) -> str:
     exp = datetime.now(UTC) + timedelta(minutes=settings.jwt_expire_minutes)
-    payload = {"sub": str(survey_id), "exp": exp}
+    # The survey name never changes, so the dashboard can show it from the token claims
+    payload = {"sub": str(survey_id), "name": survey_name, "exp": exp}
     return str(
         jwt.encode(
             payload,
@@ -49,15 +81,31 @@ def _create_manager_token(survey_id: UUID) -> str:
 
 
 def _decode_manager_token(token: str) -> str | None:
+    """
+    The token's sub if its signature and exp are valid. The dashboard sends the same bearer on
+    every poll, so verified tokens are remembered (by digest) with their exp, which is
+    re-checked on each hit; invalid tokens are never cached.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if time.time() < cached[1]:
+            return cached[0]
+        _token_cache.pop(key, None)
+        return None
     try:
         payload = jwt.decode(
             token,
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm],
         )
-        return payload.get("sub")
     except Exception:
         return None
+    sub = payload.get("sub")
+    exp = payload.get("exp")
+    if isinstance(sub, str) and isinstance(exp, int | float):
+        _token_cache[key] = (sub, exp)
+    return sub
 
 
 async def require_manager(
@@ -79,13 +127,14 @@ async def get_manager_survey(
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_manager),
 ):
-    """Get survey name for Manager dashboard (id and name only)."""
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
+    """
+    Get survey name for Manager dashboard (id and name only). The auth response and the token's
+    name claim carry the same name; this serves tokens issued without it.
+    """
+    name = await db.scalar(select(Survey.name).where(Survey.id == survey_id))
+    if name is None:
         raise HTTPException(status_code=404, detail="Survey not found")
-    return {"id": str(survey.id), "name": survey.name}
+    return {"id": str(survey_id), "name": name}
 
 
 @router.post("/auth")
@@ -95,7 +144,8 @@ async def manager_auth(
 ):
     """
     Authenticate as Manager with Survey UUID and Access Code.
-    Returns JWT to use in Authorization: Bearer <token> for /manager/{survey_id}/*.
+    Returns JWT to use in Authorization: Bearer <token> for /manager/{survey_id}/*, and the
+    survey name (also in the token's name claim).
     """
     survey_id_str = body.get("survey_id")
     access_code = body.get("access_code")
@@ -105,104 +155,79 @@ async def manager_auth(
         survey_id = UUID(survey_id_str)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid survey_id")
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
+    # Only the two columns auth needs, not the whole ORM row
+    result = await db.execute(
+        select(Survey.name, Survey.access_code_plain).where(Survey.id == survey_id)
+    )
+    survey = result.one_or_none()
+    if survey is None:
         raise HTTPException(status_code=404, detail="Survey not found")
     if not _verify_access_code(access_code, survey.access_code_plain):
         raise HTTPException(status_code=401, detail="Invalid access code")
-    token = _create_manager_token(survey_id)
-    return {"access_token": token, "token_type": "bearer"}
+    token = _create_manager_token(survey_id, survey.name)
+    return {"access_token": token, "token_type": "bearer", "name": survey.name}
 
 
-@router.get("/{survey_id}/opinions", response_model=list[PublishedOpinionResponse])
+@router.get("/{survey_id}/opinions", response_model=Page[PublishedOpinionResponse])
 async def list_manager_opinions(
     survey_id: UUID,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_manager),
 ):
-    """List published opinions for Manager dashboard (includes disclosed_pii and priority_score)."""
-    schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(PublishedOpinion).order_by(
-            PublishedOpinion.priority_score.desc(), PublishedOpinion.id
-        )
-    )
-    opinions = result.scalars().all()
-    opinion_ids = [o.id for o in opinions]
-    supporters_by_opinion: dict[int, int] = {}
-    pending_by_opinion: dict[int, int] = {}
-    if opinion_ids:
-        supporters_result = await db.execute(
-            select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-            .where(Upvote.opinion_id.in_(opinion_ids))
-            .group_by(Upvote.opinion_id)
-        )
-        supporters_by_opinion = {
-            row[0]: int(row[1]) if row[1] is not None else 0 for row in supporters_result.all()
-        }
-        pending_result = await db.execute(
-            select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-            .where(
-                Upvote.opinion_id.in_(opinion_ids),
-                Upvote.status == UpvoteStatus.pending,
+    """
+    List published opinions for Manager dashboard (includes disclosed_pii and priority_score).
+    Ranked by priority_score DESC, id; keyset-paginated on that order (pass next_cursor as
+    ?after=), a range scan of idx_published_opinions_priority_score.
+    """
+    where = []
+    if after is not None:
+        try:
+            cur_score, cur_id = decode_cursor(after, decode_int, decode_int)
+        except ValueError:
+            raise _INVALID_CURSOR from None
+        # Mixed directions, so no row comparison: the score bound is the index condition
+        where.append(
+            and_(
+                PublishedOpinion.priority_score <= cur_score,
+                or_(PublishedOpinion.priority_score < cur_score, PublishedOpinion.id > cur_id),
             )
-            .group_by(Upvote.opinion_id)
-        )
-        pending_by_opinion = {
-            row[0]: int(row[1]) if row[1] is not None else 0 for row in pending_result.all()
-        }
-    return [
-        PublishedOpinionResponse(
-            id=o.id,
-            raw_response_id=str(o.raw_response_id),
-            title=o.title,
-            content=o.content,
-            admin_notes=getattr(o, "admin_notes", None),
-            priority_score=o.priority_score,
-            importance=getattr(o, "importance", 0),
-            urgency=getattr(o, "urgency", 0),
-            expected_impact=getattr(o, "expected_impact", 0),
-            supporter_points=getattr(o, "supporter_points", 0),
-            supporters=supporters_by_opinion.get(o.id, 0),
-            pending_upvotes_count=pending_by_opinion.get(o.id, 0),
-            is_disclosure_agreed=getattr(o, "is_disclosure_agreed", False),
-            disclosed_pii=o.disclosed_pii if getattr(o, "is_disclosure_agreed", False) else None,
         )
-        for o in opinions
-    ]
+    schema_name = await _get_tenant_schema(db, survey_id)
+    await use_tenant_schema(db, schema_name)
+    return await list_opinion_responses(
+        db,
+        PublishedOpinion.priority_score.desc(),
+        PublishedOpinion.id,
+        limit=limit,
+        where=where,
+        cursor_of=lambda row: encode_cursor(str(row["priority_score"]), str(row["id"])),
+        consented_pii_only=True,
+    )
 
 
-@router.get("/{survey_id}/opinions/{opinion_id}/upvotes", response_model=list[UpvoteResponse])
+@router.get("/{survey_id}/opinions/{opinion_id}/upvotes", response_model=Page[UpvoteResponse])
 async def list_manager_upvotes(
     survey_id: UUID,
     opinion_id: int,
+    after: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_manager),
 ):
-    """List upvotes for an opinion (Published comment, PII when disclosed). For Manager dashboard."""
+    """
+    List upvotes for an opinion (Published comment, PII when disclosed). For Manager dashboard.
+    Newest first, keyset-paginated: pass next_cursor as ?after=.
+    """
     schema_name = await _get_tenant_schema(db, survey_id)
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(Upvote).where(Upvote.opinion_id == opinion_id).order_by(Upvote.created_at.desc())
-    )
-    upvotes = result.scalars().all()
-    return [
-        UpvoteResponse(
-            id=u.id,
-            opinion_id=u.opinion_id,
-            user_hash=u.user_hash,
-            raw_comment=u.raw_comment,
-            published_comment=u.published_comment,
-            status=u.status.value,
-            created_at=u.created_at.isoformat() if u.created_at else "",
-            is_disclosure_agreed=u.is_disclosure_agreed,
-            disclosed_pii=u.disclosed_pii if u.is_disclosure_agreed else None,
+    await use_tenant_schema(db, schema_name)
+    try:
+        return await list_upvote_responses(
+            db, opinion_id, limit=limit, after=after, consented_pii_only=True
         )
-        for u in upvotes
-    ]
+    except ValueError:
+        raise _INVALID_CURSOR from None
 
 
 @router.get("/{survey_id}/export")
@@ -215,83 +240,78 @@ async def export_survey(
     """Export opinions as Excel (.xlsx) or PDF. Requires Manager JWT."""
     if format not in ("xlsx", "pdf"):
         raise HTTPException(status_code=400, detail="format must be xlsx or pdf")
-    await db.execute(text("SET search_path TO public"))
-    survey_result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = survey_result.scalar_one_or_none()
-    if not survey:
+    result = await db.execute(select(Survey.name, Survey.schema_name).where(Survey.id == survey_id))
+    survey = result.one_or_none()
+    if survey is None:
         raise HTTPException(status_code=404, detail="Survey not found")
-    survey_name = survey.name
-    schema_name = survey.schema_name
-    safe_name = (
-        "".join(c if c not in '\\/:*?"<>|' else "_" for c in (survey_name or "Survey")[:80]).strip()
-        or "Survey"
-    )
+    survey_name, schema_name = survey
+    safe_name = (survey_name or "Survey")[:80].translate(_UNSAFE_FILENAME).strip() or "Survey"
     base_filename = f"Survey Opinions Report - {safe_name}"
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    result = await db.execute(
-        select(PublishedOpinion).order_by(
-            PublishedOpinion.priority_score.desc(), PublishedOpinion.id
-        )
+    await use_tenant_schema(db, schema_name)
+    from fastapi.responses import StreamingResponse
+
+    from app.routers.manager_export import (
+        EXPORT_FETCH_ROWS,
+        EXPORT_OPINION_COLUMNS,
+        EXPORT_UPVOTE_COLUMNS,
+        ExportOpinion,
+        ExportUpvote,
+        build_pdf,
+        build_xlsx,
+        iter_file,
     )
-    opinions = result.scalars().all()
-    opinion_ids = [o.id for o in opinions]
+
+    # Plain rows, not ORM entities; supporter counts come with the opinions (correlated COUNT).
+    # Both reads use a server-side cursor, EXPORT_FETCH_ROWS at a time: only the Row objects
+    # the builders need are held, never the driver's full result set on top of them.
+    opinions: list[ExportOpinion] = []
     supporters_by_opinion: dict[int, int] = {}
-    upvotes_by_opinion: dict[int, list[Upvote]] = {oid: [] for oid in opinion_ids}
-    if opinion_ids:
-        supporters_result = await db.execute(
-            select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-            .where(Upvote.opinion_id.in_(opinion_ids))
-            .group_by(Upvote.opinion_id)
-        )
-        supporters_by_opinion = {
-            row[0]: int(row[1]) if row[1] is not None else 0 for row in supporters_result.all()
-        }
-        upvotes_result = await db.execute(
-            select(Upvote)
+    opinion_stream = await db.stream(
+        select(*EXPORT_OPINION_COLUMNS, supporters_per_opinion().label("supporters"))
+        .order_by(PublishedOpinion.priority_score.desc(), PublishedOpinion.id)
+        .execution_options(yield_per=EXPORT_FETCH_ROWS)
+    )
+    async for row in opinion_stream:
+        opinions.append(row)
+        supporters_by_opinion[row.id] = row.supporters
+    upvotes_by_opinion: dict[int, list[ExportUpvote]] = {oid: [] for oid in supporters_by_opinion}
+    if opinions:
+        # Every opinion is exported, so no id list: all of the tenant's published comments
+        upvote_stream = await db.stream(
+            select(*EXPORT_UPVOTE_COLUMNS)
             .where(
-                Upvote.opinion_id.in_(opinion_ids),
-                Upvote.status == UpvoteStatus.published,
+                upvote_status_is(UpvoteStatus.published),
                 and_(
                     Upvote.published_comment.isnot(None),
-                    func.trim(Upvote.published_comment) != "",
+                    trimmed_published_comment() != "",
                 ),
             )
             .order_by(Upvote.opinion_id, Upvote.created_at)
+            .execution_options(yield_per=EXPORT_FETCH_ROWS)
         )
-        for u in upvotes_result.scalars().all():
+        async for u in upvote_stream:
             upvotes_by_opinion.setdefault(u.opinion_id, []).append(u)
 
     if format == "xlsx":
-        from fastapi.responses import Response
-
-        from app.routers.manager_export import build_xlsx
-
-        buf = build_xlsx(
-            opinions,
-            supporters_by_opinion,
-            upvotes_by_opinion,
-            survey_name=survey_name,
-            document_title=base_filename,
-        )
-        return Response(
-            content=buf.getvalue(),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f'attachment; filename="{base_filename}.xlsx"'},
+        build, media_type = (
+            build_xlsx,
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
     else:
-        from fastapi.responses import Response
-
-        from app.routers.manager_export import build_pdf
-
-        buf = build_pdf(
-            opinions,
-            supporters_by_opinion,
-            upvotes_by_opinion,
-            survey_name=survey_name,
-            document_title=base_filename,
-        )
-        return Response(
-            content=buf.getvalue(),
-            media_type="application/pdf",
-            headers={"Content-Disposition": f'attachment; filename="{base_filename}.pdf"'},
-        )
+        build, media_type = build_pdf, "application/pdf"
+    # CPU-bound (openpyxl zip / reportlab layout): build on a worker thread so the event loop
+    # keeps serving other requests. The inputs are plain rows, detached from the session.
+    out = await asyncio.to_thread(
+        build,
+        opinions,
+        supporters_by_opinion,
+        upvotes_by_opinion,
+        survey_name=survey_name,
+        document_title=base_filename,
+    )
+    # Sent from the spooled file in chunks (no full-body bytes copy)
+    return StreamingResponse(
+        iter_file(out),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{base_filename}.{format}"'},
+    )
@@ -1,7 +1,8 @@
 """Export helpers for Manager dashboard: Excel (openpyxl) and PDF (reportlab)."""
 
-from collections.abc import Sequence
-from io import BytesIO
+from collections.abc import Iterator, Sequence
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Protocol
 
 from openpyxl import Workbook
 from reportlab.lib import colors
@@ -13,21 +14,110 @@ from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, Tabl
 from app.models.tenant import PublishedOpinion, Upvote
 
 
+class ExportOpinion(Protocol):
+    """Opinion fields the exports read: an EXPORT_OPINION_COLUMNS row (or any such object)."""
+
+    @property
+    def id(self) -> int: ...
+    @property
+    def title(self) -> str: ...
+    @property
+    def content(self) -> str: ...
+    @property
+    def admin_notes(self) -> str | None: ...
+    @property
+    def priority_score(self) -> int: ...
+    @property
+    def importance(self) -> int: ...
+    @property
+    def urgency(self) -> int: ...
+    @property
+    def expected_impact(self) -> int: ...
+    @property
+    def supporter_points(self) -> int: ...
+    @property
+    def is_disclosure_agreed(self) -> bool: ...
+    @property
+    def disclosed_pii(self) -> dict[str, Any] | None: ...
+
+
+class ExportUpvote(Protocol):
+    """Upvote fields the exports read: an EXPORT_UPVOTE_COLUMNS row."""
+
+    @property
+    def published_comment(self) -> str | None: ...
+    @property
+    def is_disclosure_agreed(self) -> bool: ...
+    @property
+    def disclosed_pii(self) -> dict[str, Any] | None: ...
+
+
+# Plain column selects for the export (no ORM hydration); rows match the protocols above
+EXPORT_OPINION_COLUMNS = (
+    PublishedOpinion.id,
+    PublishedOpinion.title,
+    PublishedOpinion.content,
+    PublishedOpinion.admin_notes,
+    PublishedOpinion.priority_score,
+    PublishedOpinion.importance,
+    PublishedOpinion.urgency,
+    PublishedOpinion.expected_impact,
+    PublishedOpinion.supporter_points,
+    PublishedOpinion.is_disclosure_agreed,
+    PublishedOpinion.disclosed_pii,
+)
+EXPORT_UPVOTE_COLUMNS = (
+    Upvote.opinion_id,
+    Upvote.published_comment,
+    Upvote.is_disclosure_agreed,
+    Upvote.disclosed_pii,
+)
+
+# Rows per server-side cursor fetch when the export reads opinions and comments
+EXPORT_FETCH_ROWS = 500
+# Exports up to this size stay in memory; larger ones spill to a temporary file
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# PDF styles, built once: getSampleStyleSheet() constructs a fresh stylesheet on every call
+_PDF_STYLES = getSampleStyleSheet()
+_STYLE_TITLE = _PDF_STYLES["Title"]
+_STYLE_NORMAL = _PDF_STYLES["Normal"]
+_STYLE_HEADING = _PDF_STYLES["Heading2"]
+_STYLE_BODY_SMALL = ParagraphStyle(
+    name="BodySmall",
+    parent=_STYLE_NORMAL,
+    fontSize=9,
+    leading=11,
+    spaceAfter=4,
+)
+_OPINION_TABLE_STYLE = TableStyle(
+    [
+        ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#cccccc")),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
+        ("TOPPADDING", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 12),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+    ]
+)
+
+
+# Paragraph markup escapes, each applied in one str.translate pass
+_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ESCAPE_BR = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br/>"})
+
+
 def _esc(s: str) -> str:
     """Escape for XML/HTML in Paragraph."""
     if s is None:
         return ""
-    return str(s).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-
-def _br(s: str) -> str:
-    """Replace newlines with <br/> for Paragraph."""
-    return (s or "").replace("\n", "<br/>")
+    return str(s).translate(_ESCAPE)
 
 
 def _esc_br(s: str) -> str:
     """Escape and replace newlines - use for user-supplied content in Paragraphs."""
-    return _br(_esc(s or ""))
+    return (s or "").translate(_ESCAPE_BR)
 
 
 def _pii_str(disclosed_pii: dict | None) -> str:
@@ -43,22 +133,19 @@ def _pii_str(disclosed_pii: dict | None) -> str:
     return ", ".join(parts)
 
 
+# Priority score (0-14) -> rating 1-5, the UI's star thresholds (3 / 6 / 9 / 12)
+_RATING_BY_SCORE = (1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5)
+_STARS_BY_SCORE = tuple(f"{rating}★" for rating in _RATING_BY_SCORE)
+
+
 def _score_to_rating(priority_score: int) -> int:
     """Convert priority score (0-14) to rating 1-5 (same as UI stars)."""
-    if priority_score >= 12:
-        return 5
-    if priority_score >= 9:
-        return 4
-    if priority_score >= 6:
-        return 3
-    if priority_score >= 3:
-        return 2
-    return 1
+    return _RATING_BY_SCORE[max(0, min(14, priority_score))]
 
 
 def _score_to_star_display(priority_score: int) -> str:
     """Display as 1★-5★ for export readability."""
-    return f"{_score_to_rating(priority_score)}★"
+    return _STARS_BY_SCORE[max(0, min(14, priority_score))]
 
 
 def _component_label(value: int) -> str:
@@ -66,7 +153,7 @@ def _component_label(value: int) -> str:
     return {0: "Low", 1: "Medium", 2: "High"}.get(value, "—")
 
 
-def _upvote_pii_cells(upvote: Upvote) -> tuple[str, str, str]:
+def _upvote_pii_cells(upvote: ExportUpvote) -> tuple[str, str, str]:
     """Get Name:~, Email:~, Dept.:~ cells for an upvote when PII disclosed."""
     if not upvote.is_disclosure_agreed or not upvote.disclosed_pii:
         return "", "", ""
@@ -78,108 +165,128 @@ def _upvote_pii_cells(upvote: Upvote) -> tuple[str, str, str]:
     )
 
 
-def _pii_columns(opinions: Sequence[PublishedOpinion]) -> list[str]:
+def _pii_columns(opinions: Sequence[ExportOpinion]) -> tuple[str, ...]:
     """Collect PII keys from opinions where is_disclosure_agreed."""
     preferred = ("Name", "Email", "Department")
     seen = set()
     for o in opinions:
-        if getattr(o, "is_disclosure_agreed", False) and o.disclosed_pii:
+        if o.is_disclosure_agreed and o.disclosed_pii:
             for k in o.disclosed_pii:
                 seen.add(k)
-    ordered = [k for k in preferred if k in seen]
-    ordered += [k for k in sorted(seen) if k not in preferred]
-    return ordered
+    return (
+        *(k for k in preferred if k in seen),
+        *(k for k in sorted(seen) if k not in preferred),
+    )
 
 
 def build_xlsx(
-    opinions: Sequence[PublishedOpinion],
+    opinions: Sequence[ExportOpinion],
     supporters_by_opinion: dict[int, int],
-    upvotes_by_opinion: dict[int, list[Upvote]],
+    upvotes_by_opinion: dict[int, list[ExportUpvote]],
     survey_name: str = "",
     document_title: str = "",
-) -> BytesIO:
-    """Build Excel workbook with opinions. Includes Upvotes/Additional comments (├└) and PII columns."""
-    wb = Workbook()
+) -> IO[bytes]:
+    """
+    Build Excel workbook with opinions. Includes Upvotes/Additional comments (├└) and PII columns.
+    Write-only mode: rows are serialized as appended (no cell objects kept); the file is
+    returned at offset 0 in a spooled temporary file (stream it with iter_file).
+    """
+    wb = Workbook(write_only=True)
     if document_title:
         wb.properties.title = document_title
-    ws = wb.active
-    ws.title = "Opinions"
+    ws = wb.create_sheet("Opinions")
     if survey_name:
         ws.append([f"Survey: {survey_name}"])
         ws.append([])
     pii_cols = _pii_columns(opinions)
-    headers = [
-        "ID",
-        "Title",
-        "Content",
-        "Administrator Comments & Notes",
-        "Priority Score (0-14)",
-        "Rating (1-5★)",
-        "Imp",
-        "Urg",
-        "Impact",
-        "Supporters (pts)",
-        "Supporters (count)",
-    ] + list(pii_cols)
-    ws.append(headers)
+    ws.append(
+        (
+            "ID",
+            "Title",
+            "Content",
+            "Administrator Comments & Notes",
+            "Priority Score (0-14)",
+            "Rating (1-5★)",
+            "Imp",
+            "Urg",
+            "Impact",
+            "Supporters (pts)",
+            "Supporters (count)",
+            *pii_cols,
+        )
+    )
+    # Sub-rows leave the opinion's PII columns empty
+    pii_padding = ("",) * len(pii_cols)
     for o in opinions:
         supporters = supporters_by_opinion.get(o.id, 0)
         upvotes = upvotes_by_opinion.get(o.id, [])
-        pii = (o.disclosed_pii or {}) if getattr(o, "is_disclosure_agreed", False) else {}
-        opinion_row = [
-            o.id,
-            o.title,
-            o.content or "",
-            (getattr(o, "admin_notes", None) or ""),
-            o.priority_score,
-            _score_to_star_display(o.priority_score),
-            _component_label(getattr(o, "importance", 0)),
-            _component_label(getattr(o, "urgency", 0)),
-            _component_label(getattr(o, "expected_impact", 0)),
-            _component_label(getattr(o, "supporter_points", 0)),
-            supporters,
-        ]
-        for k in pii_cols:
-            opinion_row.append(pii.get(k, ""))
-        ws.append(opinion_row)
+        pii = (o.disclosed_pii or {}) if o.is_disclosure_agreed else {}
+        ws.append(
+            (
+                o.id,
+                o.title,
+                o.content or "",
+                o.admin_notes or "",
+                o.priority_score,
+                _score_to_star_display(o.priority_score),
+                _component_label(o.importance),
+                _component_label(o.urgency),
+                _component_label(o.expected_impact),
+                _component_label(o.supporter_points),
+                supporters,
+                *(pii.get(k, "") for k in pii_cols),
+            )
+        )
         for u in upvotes:
             comment = (u.published_comment or "").strip()
             if not comment:
                 continue
             nc, ne, nd = _upvote_pii_cells(u)
-            comment_row = [
-                "",  # ID empty for sub-row
-                "Additional comments",
-                comment,
-                nc,  # D列: Name:~
-                ne,  # E列: Email:~
-                nd,  # F列: Dept.:~
-                "",
-                "",
-                "",
-                "",
-                "",  # Imp through Supporters
-            ]
-            for _ in pii_cols:
-                comment_row.append("")
-            ws.append(comment_row)
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return buf
+            ws.append(
+                (
+                    "",  # ID empty for sub-row
+                    "Additional comments",
+                    comment,
+                    nc,  # D列: Name:~
+                    ne,  # E列: Email:~
+                    nd,  # F列: Dept.:~
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",  # Imp through Supporters
+                    *pii_padding,
+                )
+            )
+    out = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)  # noqa: SIM115 (closed by iter_file)
+    wb.save(out)
+    out.seek(0)
+    return out
+
+
+def iter_file(f: IO[bytes], chunk_size: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield f in chunks, then close it (StreamingResponse body)."""
+    try:
+        while chunk := f.read(chunk_size):
+            yield chunk
+    finally:
+        f.close()
 
 
 def build_pdf(
-    opinions: Sequence[PublishedOpinion],
+    opinions: Sequence[ExportOpinion],
     supporters_by_opinion: dict[int, int],
-    upvotes_by_opinion: dict[int, list[Upvote]],
+    upvotes_by_opinion: dict[int, list[ExportUpvote]],
     survey_name: str = "",
     document_title: str = "",
-) -> BytesIO:
-    """Build PDF report with opinions. Structured layout with clear separation for readability."""
-    buf = BytesIO()
+) -> IO[bytes]:
+    """
+    Build PDF report with opinions. Structured layout with clear separation for readability.
+    Returned like build_xlsx: a spooled temporary file at offset 0 (stream it with iter_file).
+    """
+    out = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)  # noqa: SIM115 (closed by iter_file)
     doc = SimpleDocTemplate(
-        buf,
+        out,
         pagesize=A4,
         rightMargin=18 * mm,
         leftMargin=18 * mm,
@@ -187,30 +294,22 @@ def build_pdf(
         bottomMargin=18 * mm,
         title=document_title or None,
     )
-    styles = getSampleStyleSheet()
-    body_small = ParagraphStyle(
-        name="BodySmall",
-        parent=styles["Normal"],
-        fontSize=9,
-        leading=11,
-        spaceAfter=4,
-    )
     col_width = A4[0] - 2 * 18 * mm
     story = []
-    story.append(Paragraph("Survey Opinions Report", styles["Title"]))
+    story.append(Paragraph("Survey Opinions Report", _STYLE_TITLE))
     if survey_name:
-        story.append(Paragraph(f"<b>Survey: {_esc(survey_name)}</b>", styles["Normal"]))
+        story.append(Paragraph(f"<b>Survey: {_esc(survey_name)}</b>", _STYLE_NORMAL))
     story.append(Spacer(1, 14))
     for o in opinions:
         supporters = supporters_by_opinion.get(o.id, 0)
         upvotes = upvotes_by_opinion.get(o.id, [])
-        pii = _pii_str(o.disclosed_pii if getattr(o, "is_disclosure_agreed", False) else None)
+        pii = _pii_str(o.disclosed_pii if o.is_disclosure_agreed else None)
         rating = _score_to_star_display(o.priority_score)
-        imp = _component_label(getattr(o, "importance", 0))
-        urg = _component_label(getattr(o, "urgency", 0))
-        impact = _component_label(getattr(o, "expected_impact", 0))
-        supp_pts = _component_label(getattr(o, "supporter_points", 0))
-        admin_notes = getattr(o, "admin_notes", None)
+        imp = _component_label(o.importance)
+        urg = _component_label(o.urgency)
+        impact = _component_label(o.expected_impact)
+        supp_pts = _component_label(o.supporter_points)
+        admin_notes = o.admin_notes
         has_admin = bool(admin_notes and admin_notes.strip())
         # Build table rows: [Label, Content]
         rows = []
@@ -218,19 +317,19 @@ def build_pdf(
             [
                 Paragraph(
                     f"<b>#{o.id}</b> Score: {o.priority_score} ({rating}) · Supporters: {supporters}",
-                    styles["Heading2"],
+                    _STYLE_HEADING,
                 )
             ]
         )
         title_esc = _esc(o.title or "")
         rows.append(
             [
-                Paragraph(f"<b>{title_esc}</b>", body_small),
+                Paragraph(f"<b>{title_esc}</b>", _STYLE_BODY_SMALL),
             ]
         )
         rows.append(
             [
-                Paragraph(_esc_br(o.content or ""), body_small),
+                Paragraph(_esc_br(o.content or ""), _STYLE_BODY_SMALL),
             ]
         )
         if has_admin:
@@ -239,7 +338,7 @@ def build_pdf(
                 [
                     Paragraph(
                         f'<font size="8" color="#555555">Administrator Comments</font><br/>{admin_esc}',
-                        body_small,
+                        _STYLE_BODY_SMALL,
                     )
                 ]
             )
@@ -248,7 +347,8 @@ def build_pdf(
             rows.append(
                 [
                     Paragraph(
-                        f'<font size="8" color="#555555">PII</font><br/>{pii_esc}', body_small
+                        f'<font size="8" color="#555555">PII</font><br/>{pii_esc}',
+                        _STYLE_BODY_SMALL,
                     ),
                 ]
             )
@@ -259,7 +359,7 @@ def build_pdf(
                     f'<font size="8" color="#555555">Urg</font> {urg} · '
                     f'<font size="8" color="#555555">Impact</font> {impact} · '
                     f'<font size="8" color="#555555">Supporters (pts)</font> {supp_pts}',
-                    body_small,
+                    _STYLE_BODY_SMALL,
                 )
             ]
         )
@@ -286,25 +386,14 @@ def build_pdf(
                         Paragraph(
                             '<font size="8" color="#555555">Additional comments</font><br/>'
                             + "<br/>".join(comments_parts),
-                            body_small,
+                            _STYLE_BODY_SMALL,
                         )
                     ]
                 )
         tbl = Table(rows, colWidths=[col_width])
-        tbl.setStyle(
-            TableStyle(
-                [
-                    ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#cccccc")),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
-                    ("TOPPADDING", (0, 0), (-1, -1), 8),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                ]
-            )
-        )
+        tbl.setStyle(_OPINION_TABLE_STYLE)
         story.append(tbl)
         story.append(Spacer(1, 14))
     doc.build(story)
-    buf.seek(0)
-    return buf
+    out.seek(0)
+    return out
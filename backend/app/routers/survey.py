@@ -1,11 +1,24 @@
 """Public Survey API: contributor submission, opinions and search. No auth; UUID in path."""
 
 import hashlib
-from collections.abc import Sequence
-from uuid import UUID, uuid4
+from typing import Any
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import func, select, text
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,10 +31,14 @@ from app.models.tenant import (
     RawResponse,
     Upvote,
     UpvoteStatus,
+    trimmed_published_comment,
+    upvote_status_is,
 )
-from app.schemas.public_opinion import PublicOpinionItem, UpvoteCreate
-from app.schemas.question import QuestionResponse
+from app.schemas.public_opinion import PublicOpinionItem, UpvoteCreate, UpvoteRecorded
+from app.schemas.question import QuestionResponse, SurveyFormResponse
 from app.schemas.submission import SubmitRequest, SubmitResponse
+from app.services.ids import uuid7
+from app.services.upvote_counts import supporters_per_opinion
 
 router = APIRouter(prefix="/survey", tags=["survey"])
 
@@ -35,7 +52,46 @@ def _require_survey_schema(request: Request) -> None:
         )
 
 
-@router.get("/{survey_id}/questions")
+# Core columns for QuestionResponse (no ORM hydration)
+_QUESTION_COLUMNS = (
+    Question.id,
+    Question.survey_id,
+    Question.label,
+    Question.question_type,
+    Question.options,
+    Question.is_required,
+    Question.is_personal_data,
+)
+# What submit validation reads: no options / question_type payload per question
+_VALIDATION_COLUMNS = (
+    Question.id,
+    Question.label,
+    Question.is_required,
+    Question.is_personal_data,
+)
+
+
+async def _load_survey_with_questions(
+    db: AsyncSession, survey_id: UUID, columns: tuple[Any, ...] = _QUESTION_COLUMNS
+) -> tuple[tuple[str, SurveyStatus] | None, list[Row[Any]]]:
+    """
+    The survey's (name, status) and its question rows (columns, which must include Question.id)
+    in id order, in one round-trip: public.surveys LEFT JOIN the tenant's questions, so a
+    survey without questions still returns its row. (None, []) if the survey does not exist.
+    """
+    result = await db.execute(
+        select(Survey.name.label("survey_name"), Survey.status, *columns)
+        .outerjoin(Question, Question.survey_id == Survey.id)
+        .where(Survey.id == survey_id)
+        .order_by(Question.id)
+    )
+    rows = result.all()
+    if not rows:
+        return None, []
+    return (rows[0].survey_name, rows[0].status), [row for row in rows if row.id is not None]
+
+
+@router.get("/{survey_id}/questions", response_model=SurveyFormResponse)
 async def get_survey_questions(
     survey_id: UUID,
     request: Request,
@@ -46,41 +102,25 @@ async def get_survey_questions(
     Public endpoint – no auth. Returns 404 if survey not found.
     """
     _require_survey_schema(request)
-    schema_name = request.state.survey_schema_name
-
-    # Fetch survey metadata from public schema
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
-        raise HTTPException(status_code=404, detail="Survey not found")
-
-    # Switch back to tenant for questions
-    await db.execute(text(f"SET search_path TO {schema_name}"))
     try:
-        q_result = await db.execute(
-            select(Question).where(Question.survey_id == survey_id).order_by(Question.id)
-        )
-        questions = q_result.scalars().all()
+        survey, questions = await _load_survey_with_questions(db, survey_id)
     except ProgrammingError:
         raise HTTPException(status_code=404, detail="Survey data not found")
+    if survey is None:
+        raise HTTPException(status_code=404, detail="Survey not found")
+    survey_name, status = survey
 
-    return {
-        "survey_name": survey.name,
-        "status": survey.status.value,
-        "questions": [
-            QuestionResponse(
-                id=q.id,
-                survey_id=str(q.survey_id),
-                label=q.label,
-                question_type=q.question_type.value,
-                options=q.options,
-                is_required=q.is_required,
-                is_personal_data=q.is_personal_data,
+    # Typed columns: build without validation (FastAPI only serializes the instances)
+    return SurveyFormResponse.model_construct(
+        survey_name=survey_name,
+        status=status.value,
+        questions=[
+            QuestionResponse.model_construct(
+                **{c.key: getattr(q, c.key) for c in _QUESTION_COLUMNS}
             )
             for q in questions
         ],
-    }
+    )
 
 
 @router.post("/{survey_id}/submit", response_model=SubmitResponse)
@@ -96,95 +136,116 @@ async def submit_survey_response(
     PII consent (is_disclosure_agreed) is stored per-answer for personal-data questions.
     """
     _require_survey_schema(request)
-    schema_name = request.state.survey_schema_name
 
-    # Check survey is active
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
+    # Survey status and the questions to validate against, in one round-trip
+    survey, question_list = await _load_survey_with_questions(db, survey_id, _VALIDATION_COLUMNS)
+    if survey is None:
         raise HTTPException(status_code=404, detail="Survey not found")
-    if survey.status != SurveyStatus.active:
+    if survey[1] != SurveyStatus.active:
         raise HTTPException(
             status_code=403,
             detail="Submissions are closed for this survey.",
         )
-
-    # Switch to tenant
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-
-    # Load questions for validation
-    q_result = await db.execute(select(Question).where(Question.survey_id == survey_id))
-    questions = {q.id: q for q in q_result.scalars().all()}
+    questions = {q.id: q for q in question_list}
     if not questions:
         raise HTTPException(status_code=400, detail="Survey has no questions yet.")
 
-    # Validate: required questions must have answers
+    # Required questions must be answered (AnswerSubmit already strips and rejects blank text);
+    # set difference, reporting the lowest missing id (question_list is in id order)
     answers_by_qid = {a.question_id: a for a in body.answers}
-    for q in questions.values():
-        if q.is_required and q.id not in answers_by_qid:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Required question '{q.label}' (id={q.id}) must be answered.",
-            )
-        if q.id in answers_by_qid:
-            a = answers_by_qid[q.id]
-            if not a.answer_text.strip():
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Question '{q.label}' cannot be empty.",
-                )
-
-    # Create RawResponse and RawAnswers
-    response_id = uuid4()
-    raw_response = RawResponse(id=response_id)
-    db.add(raw_response)
-    await db.flush()
-
-    for a in body.answers:
-        if a.question_id not in questions:
-            continue  # Ignore unknown question_ids
-        q = questions[a.question_id]
-        # For PII questions, honor is_disclosure_agreed; for others, default False
-        is_disclosure = a.is_disclosure_agreed if q.is_personal_data else False
-        raw_answer = RawAnswer(
-            response_id=response_id,
-            question_id=a.question_id,
-            answer_text=a.answer_text.strip(),
-            is_disclosure_agreed=is_disclosure,
+    missing = {q.id for q in question_list if q.is_required} - answers_by_qid.keys()
+    if missing:
+        q = questions[min(missing)]
+        raise HTTPException(
+            status_code=400,
+            detail=f"Required question '{q.label}' (id={q.id}) must be answered.",
         )
-        db.add(raw_answer)
 
-    await db.flush()
+    # Create RawResponse and RawAnswers (time-ordered id keeps raw_responses_pkey inserts local).
+    # Core INSERTs: the answers go out as one multi-row INSERT, with no ORM objects to flush.
+    response_id = uuid7()
+    await db.execute(insert(RawResponse).values(id=response_id))
+    rows = [
+        {
+            "response_id": response_id,
+            "question_id": a.question_id,
+            "answer_text": a.answer_text,
+            # For PII questions, honor is_disclosure_agreed; for others, default False
+            "is_disclosure_agreed": (
+                a.is_disclosure_agreed if questions[a.question_id].is_personal_data else False
+            ),
+        }
+        for a in body.answers
+        if a.question_id in questions  # Ignore unknown question_ids
+    ]
+    if rows:
+        await db.execute(insert(RawAnswer), rows)
 
     return SubmitResponse(response_id=str(response_id))
 
 
-def _opinions_to_public_items(
-    opinions: Sequence[PublishedOpinion],
-    upvotes_by_opinion: dict,
-    supporters_by_opinion: dict[int, int],
-    supported_opinion_ids: set[int] | None = None,
-) -> list[PublicOpinionItem]:
-    """Build public list with supporters, additional_comments, and current_user_has_supported."""
-    supported = supported_opinion_ids or set()
-    out = []
-    for o in opinions:
-        votes = upvotes_by_opinion.get(o.id, [])
-        additional_comments = [v for v in votes if v]
-        supporters = supporters_by_opinion.get(o.id, 0)
-        out.append(
-            PublicOpinionItem(
-                id=o.id,
-                title=o.title,
-                content=o.content,
-                priority_score=o.priority_score,
-                supporters=supporters,
-                additional_comments=additional_comments,
-                current_user_has_supported=(o.id in supported),
-            )
+async def _list_public_items(
+    db: AsyncSession,
+    survey_id: UUID,
+    user_hash: bytes,
+    match: ColumnElement[bool] | None = None,
+) -> list[PublicOpinionItem] | None:
+    """
+    The survey's published opinions (optionally only those matching), newest updated first,
+    with supporters, approved comments and current_user_has_supported, in one statement:
+    public.surveys LEFT JOIN published_opinions plus correlated subqueries per opinion (upvotes
+    indexes on opinion_id / user_hash). None if the survey does not exist.
+    """
+    comment = trimmed_published_comment()
+    comments = (
+        select(func.array_agg(aggregate_order_by(comment, Upvote.created_at, Upvote.id)))
+        .where(
+            Upvote.opinion_id == PublishedOpinion.id,
+            upvote_status_is(UpvoteStatus.published),
+            Upvote.published_comment.is_not(None),  # idx_upvotes_opinion_id_with_comment
+            comment != "",
+        )
+        .correlate(PublishedOpinion)
+        .scalar_subquery()
+    )
+    supported = (
+        exists()
+        .where(Upvote.opinion_id == PublishedOpinion.id, Upvote.user_hash == user_hash)
+        .correlate(PublishedOpinion)
+    )
+    result = await db.execute(
+        select(
+            PublishedOpinion.id,
+            PublishedOpinion.title,
+            PublishedOpinion.content,
+            PublishedOpinion.priority_score,
+            supporters_per_opinion().label("supporters"),
+            comments.label("additional_comments"),
+            supported.label("current_user_has_supported"),
+        )
+        .select_from(Survey)
+        # The filter is part of the join, so the survey row survives when nothing matches
+        .outerjoin(PublishedOpinion, match if match is not None else true())
+        .where(Survey.id == survey_id)
+        .order_by(PublishedOpinion.updated_at.desc(), PublishedOpinion.id)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    # Typed columns: construct without re-validating; a lone row without an id is "no opinions"
+    return [
+        PublicOpinionItem.model_construct(
+            id=row.id,
+            title=row.title,
+            content=row.content,
+            priority_score=row.priority_score,
+            supporters=row.supporters,
+            additional_comments=row.additional_comments or [],
+            current_user_has_supported=row.current_user_has_supported,
         )
-    return out
+        for row in rows
+        if row.id is not None
+    ]
 
 
 @router.get("/{survey_id}/opinions", response_model=list[PublicOpinionItem])
@@ -198,55 +259,13 @@ async def list_public_opinions(
     Includes supporter count and [Additional Comment] from approved upvotes.
     """
     _require_survey_schema(request)
-    schema_name = request.state.survey_schema_name
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Survey not found")
-    await db.execute(text(f"SET search_path TO {schema_name}"))
     try:
-        o_result = await db.execute(
-            select(PublishedOpinion).order_by(
-                PublishedOpinion.updated_at.desc(), PublishedOpinion.id
-            )
-        )
-        opinions = o_result.scalars().all()
+        items = await _list_public_items(db, survey_id, _user_hash_from_request(request))
     except ProgrammingError:
         raise HTTPException(status_code=404, detail="Survey data not found")
-    if not opinions:
-        return []
-    opinion_ids = [o.id for o in opinions]
-    u_result = await db.execute(
-        select(Upvote.opinion_id, Upvote.published_comment).where(
-            Upvote.opinion_id.in_(opinion_ids),
-            Upvote.status == UpvoteStatus.published,
-        )
-    )
-    upvotes_by_opinion: dict[int, list[str]] = {oid: [] for oid in opinion_ids}
-    for row in u_result.all():
-        oid, comment = row[0], row[1]
-        if comment and comment.strip():
-            upvotes_by_opinion[oid].append(comment.strip())
-    user_hash = _user_hash_from_request(request)
-    supported_result = await db.execute(
-        select(Upvote.opinion_id).where(
-            Upvote.opinion_id.in_(opinion_ids),
-            Upvote.user_hash == user_hash,
-        )
-    )
-    supported_opinion_ids = {row[0] for row in supported_result.all()}
-    # Count all upvotes per opinion (supporters = number of Support clicks)
-    supporters_result = await db.execute(
-        select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-        .where(Upvote.opinion_id.in_(opinion_ids))
-        .group_by(Upvote.opinion_id)
-    )
-    supporters_by_opinion = {
-        row[0]: int(row[1]) if row[1] is not None else 0 for row in supporters_result.all()
-    }
-    return _opinions_to_public_items(
-        opinions, upvotes_by_opinion, supporters_by_opinion, supported_opinion_ids
-    )
+    if items is None:
+        raise HTTPException(status_code=404, detail="Survey not found")
+    return items
 
 
 @router.get("/{survey_id}/search", response_model=list[PublicOpinionItem])
@@ -261,95 +280,44 @@ async def search_public_opinions(
     Returns public list with supporter count and additional comments.
     """
     _require_survey_schema(request)
-    schema_name = request.state.survey_schema_name
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Survey not found")
-    await db.execute(text(f"SET search_path TO {schema_name}"))
     query = q.strip() if q else ""
+    # FTS on the generated search_tsv column (GIN-indexed, not mapped on the model)
+    match = (
+        literal_column("search_tsv").bool_op("@@")(func.plainto_tsquery("simple", query))
+        if query
+        else None
+    )
     try:
-        if not query:
-            o_result = await db.execute(
-                select(PublishedOpinion).order_by(
-                    PublishedOpinion.updated_at.desc(), PublishedOpinion.id
-                )
-            )
-            opinions = o_result.scalars().all()
-        else:
-            # FTS: search_path already set to tenant schema
-            safe_q = query.replace("'", "''")
-            raw = await db.execute(
-                text(
-                    """SELECT id, title, content, priority_score
-                        FROM published_opinions
-                        WHERE to_tsvector('simple', coalesce(title,'') || ' ' || coalesce(content,''))
-                              @@ plainto_tsquery('simple', :q)
-                        ORDER BY updated_at DESC, id"""
-                ).bindparams(q=safe_q)
-            )
-            rows = raw.mappings().all()
-            opinions = [
-                type(
-                    "_OpinionRow",
-                    (),
-                    {
-                        "id": r["id"],
-                        "title": r["title"],
-                        "content": r["content"],
-                        "priority_score": r["priority_score"],
-                    },
-                )()
-                for r in rows
-            ]
+        items = await _list_public_items(db, survey_id, _user_hash_from_request(request), match)
     except ProgrammingError:
         raise HTTPException(status_code=404, detail="Survey data not found")
-    if not opinions:
-        return []
-    opinion_ids = [o.id for o in opinions]
-    u_result = await db.execute(
-        select(Upvote.opinion_id, Upvote.published_comment).where(
-            Upvote.opinion_id.in_(opinion_ids),
-            Upvote.status == UpvoteStatus.published,
-        )
-    )
-    upvotes_by_opinion: dict[int, list[str]] = {oid: [] for oid in opinion_ids}
-    for row in u_result.all():
-        oid, comment = row[0], row[1]
-        if comment and comment.strip():
-            upvotes_by_opinion[oid].append(comment.strip())
-    user_hash = _user_hash_from_request(request)
-    supported_result = await db.execute(
-        select(Upvote.opinion_id).where(
-            Upvote.opinion_id.in_(opinion_ids),
-            Upvote.user_hash == user_hash,
-        )
-    )
-    supported_opinion_ids = {row[0] for row in supported_result.all()}
-    supporters_result = await db.execute(
-        select(Upvote.opinion_id, func.count(Upvote.id).label("cnt"))
-        .where(Upvote.opinion_id.in_(opinion_ids))
-        .group_by(Upvote.opinion_id)
-    )
-    supporters_by_opinion = {
-        row[0]: int(row[1]) if row[1] is not None else 0 for row in supporters_result.all()
-    }
-    return _opinions_to_public_items(
-        opinions, upvotes_by_opinion, supporters_by_opinion, supported_opinion_ids
-    )
+    if items is None:
+        raise HTTPException(status_code=404, detail="Survey not found")
+    return items
 
 
-def _user_hash_from_request(request: Request) -> str:
-    """Derive a stable hash from client IP + User-Agent for upvote deduplication."""
+def _user_hash_from_request(request: Request) -> bytes:
+    """Derive a stable 32-byte SHA-256 digest from client IP + User-Agent for upvote deduplication."""
     client = getattr(request.client, "host", "") or ""
     ua = request.headers.get("user-agent", "") or ""
     xff = request.headers.get("x-forwarded-for", "")
     ip = xff.split(",")[0].strip() if xff else client
     raw = f"{ip}:{ua}".encode()
-    return hashlib.sha256(raw).hexdigest()[:64]
+    return hashlib.sha256(raw).digest()
 
 
-@router.post("/{survey_id}/opinions/{opinion_id}/upvote")
+# INSERT ... SELECT target columns of create_upvote (id and created_at are server defaults)
+_UPVOTE_INSERT_COLUMNS = (
+    Upvote.opinion_id,
+    Upvote.user_hash,
+    Upvote.raw_comment,
+    Upvote.status,
+    Upvote.is_disclosure_agreed,
+    Upvote.disclosed_pii,
+)
+
+
+@router.post("/{survey_id}/opinions/{opinion_id}/upvote", response_model=UpvoteRecorded)
 async def create_upvote(
     survey_id: UUID,
     opinion_id: int,
@@ -362,21 +330,7 @@ async def create_upvote(
     One vote per user_hash per opinion; returns 409 if already voted.
     """
     _require_survey_schema(request)
-    schema_name = request.state.survey_schema_name
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Survey not found")
-    await db.execute(text(f"SET search_path TO {schema_name}"))
-    o_result = await db.execute(select(PublishedOpinion).where(PublishedOpinion.id == opinion_id))
-    if not o_result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Opinion not found")
     user_hash = _user_hash_from_request(request)
-    existing = await db.execute(
-        select(Upvote).where(Upvote.opinion_id == opinion_id, Upvote.user_hash == user_hash)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Already voted for this opinion")
     # Store PII whenever entered (for admin moderation); is_disclosure_agreed controls Manager visibility
     disclosed_pii = {}
     if body.name and body.name.strip():
@@ -387,17 +341,34 @@ async def create_upvote(
         disclosed_pii["Department"] = body.dept.strip()
     raw_comment = body.comment.strip() if body.comment and body.comment.strip() else None
     status = UpvoteStatus.published if raw_comment is None else UpvoteStatus.pending
-    upvote = Upvote(
-        opinion_id=opinion_id,
-        user_hash=user_hash,
-        raw_comment=raw_comment,
-        status=status,
-        is_disclosure_agreed=body.is_disclosure_agreed,
-        disclosed_pii=disclosed_pii if disclosed_pii else None,
+    # One round-trip on the happy path: the row is selected from the opinion (none if the
+    # survey or opinion is missing) and a repeat vote hits the unique (user_hash, opinion_id)
+    vote = select(
+        PublishedOpinion.id,
+        literal(user_hash, Upvote.user_hash.type),
+        literal(raw_comment, Upvote.raw_comment.type),
+        literal(status, Upvote.status.type),
+        literal(body.is_disclosure_agreed, Upvote.is_disclosure_agreed.type),
+        literal(disclosed_pii, Upvote.disclosed_pii.type) if disclosed_pii else null(),
+    ).where(PublishedOpinion.id == opinion_id, exists().where(Survey.id == survey_id))
+    inserted = await db.execute(
+        pg_insert(Upvote)
+        .from_select(_UPVOTE_INSERT_COLUMNS, vote)
+        .on_conflict_do_nothing(index_elements=[Upvote.user_hash, Upvote.opinion_id])
+        .returning(Upvote.id)
     )
-    db.add(upvote)
+    if inserted.scalar_one_or_none() is None:
+        checks = await db.execute(
+            select(
+                exists().where(Survey.id == survey_id),
+                exists().where(PublishedOpinion.id == opinion_id),
+            )
+        )
+        survey_exists, opinion_exists = checks.one()
+        if not survey_exists:
+            raise HTTPException(status_code=404, detail="Survey not found")
+        if not opinion_exists:
+            raise HTTPException(status_code=404, detail="Opinion not found")
+        raise HTTPException(status_code=409, detail="Already voted for this opinion")
     await db.commit()
-    return {
-        "status": "ok",
-        "message": "Vote recorded. Comment will appear after moderator approval.",
-    }
+    return UpvoteRecorded()
@@ -1,6 +1,8 @@
 """Moderation & published opinions API schemas."""
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class RawAnswerWithLabel(BaseModel):
@@ -32,7 +34,7 @@ class RawResponseDetail(BaseModel):
 class PublishOpinionCreate(BaseModel):
     """Create a published opinion from a raw response."""
 
-    raw_response_id: str
+    raw_response_id: UUID  # parsed once here; bound to asyncpg as a native uuid
     title: str
     content: str
     admin_notes: str | None = None
@@ -48,6 +50,12 @@ class PublishOpinionCreate(BaseModel):
         return v
 
 
+class PublishOpinionBulkCreate(BaseModel):
+    """Several opinions published in one request (single INSERT ... RETURNING)."""
+
+    opinions: list[PublishOpinionCreate] = Field(min_length=1, max_length=500)
+
+
 class PublishedOpinionResponse(BaseModel):
     """Published opinion (admin view, includes disclosed_pii, supporters, and score components)."""
 
@@ -71,13 +79,6 @@ class PublishedOpinionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-def _score_from_components(
-    importance: int, urgency: int, expected_impact: int, supporter_points: int
-) -> int:
-    """(Imp+Urg+Impact)*2 + supporters → max 14."""
-    return (importance + urgency + expected_impact) * 2 + supporter_points
-
-
 class OpinionUpdate(BaseModel):
     """Update title, content, admin_notes, and/or score components (Imp, Urg, Impact, supporters 0-2) for a published opinion."""
 
@@ -104,7 +105,7 @@ class UpvoteResponse(BaseModel):
 
     id: int
     opinion_id: int
-    user_hash: str
+    user_hash: str  # hex of the stored 32-byte digest
     raw_comment: str | None
     published_comment: str | None
     status: str
@@ -0,0 +1,18 @@
+"""Keyset pagination envelope for list endpoints."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Keyset page size for list endpoints (?limit=)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of results. Pass next_cursor back as ?after= to fetch the next page (null = last)."""
+
+    items: list[T]
+    next_cursor: str | None = None
@@ -23,3 +23,10 @@ class UpvoteCreate(BaseModel):
     name: str | None = None
     email: str | None = None
     is_disclosure_agreed: bool = False
+
+
+class UpvoteRecorded(BaseModel):
+    """Response after a successful upvote."""
+
+    status: str = "ok"
+    message: str = "Vote recorded. Comment will appear after moderator approval."
@@ -1,6 +1,8 @@
 """Question API schemas."""
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class QuestionCreate(BaseModel):
@@ -19,9 +21,15 @@ class QuestionCreate(BaseModel):
         return v
 
 
+class QuestionBulkCreate(BaseModel):
+    """Several questions created in one request (single INSERT ... RETURNING)."""
+
+    questions: list[QuestionCreate] = Field(min_length=1, max_length=500)
+
+
 class QuestionResponse(BaseModel):
     id: int
-    survey_id: str
+    survey_id: UUID
     label: str
     question_type: str
     options: list[str] | None
@@ -29,3 +37,11 @@ class QuestionResponse(BaseModel):
     is_personal_data: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class SurveyFormResponse(BaseModel):
+    """Public survey form: name, status and question definitions."""
+
+    survey_name: str
+    status: str
+    questions: list[QuestionResponse]
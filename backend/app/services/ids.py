@@ -0,0 +1,19 @@
+"""Identifier helpers."""
+
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp, then 74 random bits.
+    New keys land on the right-most B-tree leaf instead of a random page. Do not use for
+    survey ids: their first 8 hex digits name the tenant schema and must stay random.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68  # 12 bits
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits
+    value = (ts_ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return UUID(int=value)
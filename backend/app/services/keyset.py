@@ -0,0 +1,93 @@
+"""Keyset (cursor) pagination helpers for the list endpoints.
+
+A cursor is the sort key of the last row on a page, "|"-joined and base64url-encoded; the
+next page is WHERE <row comes after the cursor> ... LIMIT n. Every decoding error is a
+ValueError (routers answer 400 Invalid cursor).
+"""
+
+import base64
+import binascii
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, literal, or_, tuple_
+
+# Range of the integer (int4) ids and scores used as sort keys; asyncpg rejects anything wider
+INT4_MIN = -(2**31)
+INT4_MAX = 2**31 - 1
+
+
+def encode_cursor(*parts: str) -> str:
+    """Cursor from the sort-key parts of the last row (see the encode_* helpers)."""
+    return base64.urlsafe_b64encode("|".join(parts).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> list[Any]:
+    """The parts of a cursor made by encode_cursor, each converted by its parser."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor") from None
+    parts = raw.split("|")
+    if len(parts) != len(parsers):
+        raise ValueError("Invalid cursor")
+    return [parse(part) for parse, part in zip(parsers, parts, strict=True)]
+
+
+def encode_flag(value: bool) -> str:
+    return "1" if value else ""
+
+
+def decode_flag(part: str) -> bool:
+    if part not in ("", "1"):
+        raise ValueError("Invalid cursor flag")
+    return part == "1"
+
+
+def decode_int(part: str) -> int:
+    """An integer sort key (id, score); a value outside int4 is a ValueError, not a DataError."""
+    value = int(part)
+    if not INT4_MIN <= value <= INT4_MAX:
+        raise ValueError("Invalid cursor integer")
+    return value
+
+
+def encode_timestamp(value: datetime | None) -> str:
+    return value.isoformat() if value is not None else ""
+
+
+def decode_timestamp(part: str) -> datetime | None:
+    return datetime.fromisoformat(part) if part else None
+
+
+def decode_date(part: str) -> date | None:
+    return date.fromisoformat(part) if part else None
+
+
+def after_desc(
+    sort_col: Any, id_col: Any, cur_value: Any, cur_id: Any, *, nulls_last: bool = False
+) -> ColumnElement[bool]:
+    """
+    Rows after (cur_value, cur_id) in ORDER BY sort_col DESC, id_col DESC. NULL sort values
+    form their own block: first (PostgreSQL's default for DESC) or last with nulls_last.
+    """
+    in_null_block = and_(sort_col.is_(None), id_col < literal(cur_id, id_col.type))
+    if cur_value is None:
+        return in_null_block if nulls_last else or_(sort_col.is_not(None), in_null_block)
+    after = tuple_(sort_col, id_col) < tuple_(
+        literal(cur_value, sort_col.type), literal(cur_id, id_col.type)
+    )
+    return or_(after, sort_col.is_(None)) if nulls_last else after
+
+
+def after_in_blocks(
+    first_block: ColumnElement[bool], cur_first: bool, after: ColumnElement[bool]
+) -> ColumnElement[bool]:
+    """
+    Rows after the cursor when rows matching first_block sort ahead of the rest (ORDER BY
+    first_block DESC, ...): `after` orders rows within the cursor's block.
+    """
+    if cur_first:
+        return or_(~first_block, and_(first_block, after))
+    return and_(~first_block, after)
@@ -1,9 +1,9 @@
 """Survey lifecycle batch: suspend expired contracts, delete past retention."""
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import UTC, datetime
 
-from sqlalchemy import select, text, update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.public import Survey, SurveyStatus
@@ -26,8 +26,8 @@ async def run_survey_lifecycle(db: AsyncSession) -> LifecycleResult:
     1. Suspend: surveys where contract_end_date < today and status=active → set to suspended
     2. Delete: surveys where deletion_due_date < today → DROP SCHEMA and remove from public.surveys
     """
-    today = date.today()
-    await db.execute(text("SET search_path TO public"))
+    # UTC calendar date, matching the dates create_survey assigns
+    today = datetime.now(UTC).date()
 
     # 1. Suspend: contract_end_date has passed
     suspend_result = await db.execute(
@@ -0,0 +1,48 @@
+"""Short-lived process cache for the admin survey listing (GET /admin/surveys[/{id}]).
+
+The survey list only changes on create / delete / access-code reset / lifecycle runs, but
+the admin UI fetches it on every page load. Responses are cached for a few seconds and the
+whole cache is dropped on any public.surveys change: directly by the admin write endpoints,
+and on every worker through the survey_schemas NOTIFY listener (see schema_cache), which
+the trigger sends for every INSERT, UPDATE and DELETE from revision 014 on (004 only
+notified schema_name updates, so status / access-code changes did not reach other workers).
+
+Entries are shared by all callers: they sit behind the admin-key check and there is a single
+admin key, so they carry nothing caller-specific.
+"""
+
+from collections.abc import Hashable
+from typing import Any
+
+from cachetools import TTLCache
+
+SURVEY_LIST_CACHE_MAXSIZE = 1_024
+SURVEY_LIST_CACHE_TTL_SECONDS = 30
+
+# Synchronous reads and writes (no await in between), so no lock is needed
+_cache: TTLCache[Hashable, Any] = TTLCache(
+    maxsize=SURVEY_LIST_CACHE_MAXSIZE, ttl=SURVEY_LIST_CACHE_TTL_SECONDS
+)
+# Bumped by clear(): a value computed before an invalidation must not be stored after it
+_generation = 0
+
+
+def generation() -> int:
+    """Current generation; pass it back to put() once the value has been computed."""
+    return _generation
+
+
+def get(key: Hashable) -> Any | None:
+    return _cache.get(key)
+
+
+def put(key: Hashable, value: Any, generation_at_read: int) -> None:
+    """Store value unless the cache was cleared since generation_at_read."""
+    if generation_at_read == _generation:
+        _cache[key] = value
+
+
+def clear() -> None:
+    global _generation
+    _generation += 1
+    _cache.clear()
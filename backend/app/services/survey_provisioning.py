@@ -1,41 +1,55 @@
 """Survey provisioning: create tenant schema and tables, register in public.surveys."""
 
-import re
 import secrets
 import string
-from datetime import date, timedelta
+from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
-from sqlalchemy import select, text
+from sqlalchemy import delete, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import is_valid_schema_name
 from app.models.public import Survey, SurveyStatus
 
-_SCHEMA_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+# Tenant data is kept this long after the contract ends, then the lifecycle batch deletes it
+RETENTION_AFTER_CONTRACT = timedelta(days=90)
+
+_ACCESS_CODE_ALPHABET = (string.ascii_uppercase + string.digits).encode("ascii")
+# Largest multiple of the alphabet size in a byte: higher bytes are rejected (no modulo bias)
+_ACCESS_CODE_BYTE_LIMIT = 256 // len(_ACCESS_CODE_ALPHABET) * len(_ACCESS_CODE_ALPHABET)
 
 
 def _generate_access_code(length: int = 8) -> str:
-    """Generate a random alphanumeric access code."""
-    alphabet = string.ascii_uppercase + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    """Generate a random alphanumeric access code (one OS RNG read in the common case)."""
+    out = bytearray()
+    while len(out) < length:
+        out += bytes(
+            _ACCESS_CODE_ALPHABET[b % len(_ACCESS_CODE_ALPHABET)]
+            for b in secrets.token_bytes(2 * length)
+            if b < _ACCESS_CODE_BYTE_LIMIT
+        )
+    return out[:length].decode("ascii")
 
 
 def _schema_name_from_uuid(survey_id: UUID) -> str:
     """Generate schema name from survey UUID (e.g. survey_550e8400)."""
-    return f"survey_{str(survey_id).replace('-', '')[:8]}"
+    # The first 4 bytes are the first 8 hex digits of the canonical string form
+    return f"survey_{survey_id.bytes[:4].hex()}"
 
 
 def _validate_schema_name(name: str) -> None:
-    if not _SCHEMA_NAME_PATTERN.match(name):
+    if not is_valid_schema_name(name):
         raise ValueError(f"Invalid schema name: {name!r}")
 
 
-def _tenant_ddl_statements(schema: str) -> list[str]:
-    s = schema
-    return [
-        f"CREATE TYPE {s}.question_type AS ENUM ('text', 'textarea', 'select', 'radio')",
-        f"CREATE TYPE {s}.upvote_status AS ENUM ('pending', 'published', 'rejected')",
-        f"""CREATE TABLE {s}.questions (
+# Tenant schema DDL with an {s} placeholder for the schema name, joined once at
+# import: create_survey sends _TENANT_DDL_TEMPLATE.format(s=...) as a single script
+_TENANT_DDL_TEMPLATE = ";\n".join(
+    [
+        "CREATE SCHEMA IF NOT EXISTS {s}",
+        "CREATE TYPE {s}.question_type AS ENUM ('text', 'textarea', 'select', 'radio')",
+        "CREATE TYPE {s}.upvote_status AS ENUM ('pending', 'published', 'rejected')",
+        """CREATE TABLE {s}.questions (
             id SERIAL PRIMARY KEY,
             survey_id UUID NOT NULL,
             label VARCHAR(512) NOT NULL,
@@ -44,23 +58,25 @@ def _tenant_ddl_statements(schema: str) -> list[str]:
             is_required BOOLEAN NOT NULL DEFAULT FALSE,
             is_personal_data BOOLEAN NOT NULL DEFAULT FALSE
         )""",
-        f"""CREATE TABLE {s}.raw_responses (
+        """CREATE TABLE {s}.raw_responses (
             id UUID PRIMARY KEY,
             submitted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
         )""",
-        f"""CREATE TABLE {s}.raw_answers (
+        """CREATE TABLE {s}.raw_answers (
             id SERIAL PRIMARY KEY,
             response_id UUID NOT NULL REFERENCES {s}.raw_responses(id) ON DELETE CASCADE,
             question_id INTEGER NOT NULL REFERENCES {s}.questions(id) ON DELETE CASCADE,
             answer_text TEXT NOT NULL,
             is_disclosure_agreed BOOLEAN NOT NULL DEFAULT FALSE
         )""",
-        f"""CREATE TABLE {s}.published_opinions (
+        """CREATE TABLE {s}.published_opinions (
             id SERIAL PRIMARY KEY,
             raw_response_id UUID NOT NULL,
             title VARCHAR(512) NOT NULL,
             content TEXT NOT NULL,
-            priority_score INTEGER NOT NULL DEFAULT 0,
+            priority_score INTEGER NOT NULL GENERATED ALWAYS AS (
+                (importance + urgency + expected_impact) * 2 + supporter_points
+            ) STORED,
             importance INTEGER NOT NULL DEFAULT 0,
             urgency INTEGER NOT NULL DEFAULT 0,
             expected_impact INTEGER NOT NULL DEFAULT 0,
@@ -68,12 +84,16 @@ def _tenant_ddl_statements(schema: str) -> list[str]:
             is_disclosure_agreed BOOLEAN NOT NULL DEFAULT FALSE,
             disclosed_pii JSONB,
             admin_notes TEXT,
-            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            search_tsv tsvector GENERATED ALWAYS AS (
+                to_tsvector('simple', coalesce(title,'') || ' ' || coalesce(content,''))
+            ) STORED
         )""",
-        f"""CREATE TABLE {s}.upvotes (
+        """CREATE TABLE {s}.upvotes (
             id SERIAL PRIMARY KEY,
             opinion_id INTEGER NOT NULL REFERENCES {s}.published_opinions(id) ON DELETE CASCADE,
-            user_hash VARCHAR(64) NOT NULL,
+            user_hash BYTEA NOT NULL CONSTRAINT ck_upvotes_user_hash_len
+                CHECK (octet_length(user_hash) = 32),
             raw_comment TEXT,
             published_comment TEXT,
             status {s}.upvote_status NOT NULL DEFAULT 'pending',
@@ -81,9 +101,26 @@ def _tenant_ddl_statements(schema: str) -> list[str]:
             disclosed_pii JSONB,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
         )""",
-        f"""CREATE INDEX idx_published_opinions_fts ON {s}.published_opinions
-            USING GIN (to_tsvector('simple', coalesce(title,'') || ' ' || coalesce(content,'')))""",
+        """CREATE INDEX idx_published_opinions_search_tsv ON {s}.published_opinions
+            USING GIN (search_tsv)""",
+        """CREATE INDEX idx_published_opinions_disclosed_pii ON {s}.published_opinions
+            USING GIN (disclosed_pii jsonb_path_ops)""",
+        """CREATE INDEX idx_upvotes_disclosed_pii ON {s}.upvotes
+            USING GIN (disclosed_pii jsonb_path_ops)""",
+        """CREATE INDEX idx_published_opinions_priority_score
+            ON {s}.published_opinions (priority_score DESC, id)""",
+        "CREATE INDEX idx_questions_survey_id_id ON {s}.questions (survey_id, id)",
+        """CREATE INDEX idx_raw_answers_response_id_question_id
+            ON {s}.raw_answers (response_id, question_id)""",
+        "CREATE INDEX idx_upvotes_opinion_id_status ON {s}.upvotes (opinion_id, status)",
+        """CREATE INDEX idx_upvotes_opinion_id_created_at
+            ON {s}.upvotes (opinion_id, created_at DESC, id DESC)""",
+        """CREATE UNIQUE INDEX uq_upvotes_user_hash_opinion_id
+            ON {s}.upvotes (user_hash, opinion_id)""",
+        """CREATE INDEX idx_upvotes_opinion_id_with_comment ON {s}.upvotes (opinion_id)
+            WHERE published_comment IS NOT NULL""",
     ]
+)
 
 
 async def create_survey(
@@ -98,48 +135,52 @@ async def create_survey(
     Returns (Survey model, plain access_code to show to admin once).
     """
     survey_id = uuid4()
+    # "survey_" + 8 hex digits: a valid identifier by construction, so it is not re-validated
+    # (delete_survey still validates, as its name comes back from the database)
     schema_name = _schema_name_from_uuid(survey_id)
-    _validate_schema_name(schema_name)
 
     access_code = _generate_access_code()
-
-    # Ensure we're in public schema for DDL and survey insert
-    await db.execute(text("SET search_path TO public"))
-
-    # CREATE SCHEMA
-    await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema_name}"))
-
-    for stmt in _tenant_ddl_statements(schema_name):
-        await db.execute(text(stmt))
-
-    contract_end = date.today() + timedelta(days=contract_days)
-    deletion_due = contract_end + timedelta(days=90)
-
-    survey = Survey(
-        id=survey_id,
-        name=name,
-        schema_name=schema_name,
-        status=SurveyStatus.active,
-        contract_end_date=contract_end,
-        deletion_due_date=deletion_due,
-        access_code_plain=access_code,
-        notes=notes,
-    )
-    db.add(survey)
-    await db.flush()
-    await db.refresh(survey)
+    # UTC calendar date, as run_survey_lifecycle compares against (not the host's timezone)
+    contract_end = datetime.now(UTC).date() + timedelta(days=contract_days)
+    deletion_due = contract_end + RETENTION_AFTER_CONTRACT
+
+    values = {
+        "id": survey_id,
+        "name": name,
+        "schema_name": schema_name,
+        "status": SurveyStatus.active,
+        "contract_end_date": contract_end,
+        "deletion_due_date": deletion_due,
+        "access_code_plain": access_code,
+        "notes": notes,
+    }
+    # Every column is set client-side: a Core INSERT with nothing to read back and no unit of
+    # work. As the first statement it opens the transaction the DDL script below runs in (a
+    # simple-query script takes no bind parameters, so the row is not folded into it).
+    await db.execute(insert(Survey).values(values))
+    survey = Survey(**values)
+
+    # CREATE SCHEMA and every tenant table / index as one simple-query script: one round-trip,
+    # and no per-schema prepared statements left in the connection's statement cache
+    script = _TENANT_DDL_TEMPLATE.format(s=schema_name)
+    raw = await (await db.connection()).get_raw_connection()
+    driver_conn = raw.driver_connection
+    assert driver_conn is not None
+    if not driver_conn.is_in_transaction():
+        # The script would autocommit on its own, leaving a schema with no survey row on rollback
+        raise RuntimeError("Tenant DDL must run in the survey INSERT's transaction")
+    await driver_conn.execute(script)
 
     return survey, access_code
 
 
 async def delete_survey(db: AsyncSession, survey_id: UUID) -> None:
     """Drop tenant schema and delete survey from public.surveys."""
-    await db.execute(text("SET search_path TO public"))
-    result = await db.execute(select(Survey).where(Survey.id == survey_id))
-    survey = result.scalar_one_or_none()
-    if not survey:
+    # DELETE ... RETURNING: existence check, schema lookup and delete in one statement
+    schema_name = await db.scalar(
+        delete(Survey).where(Survey.id == survey_id).returning(Survey.schema_name)
+    )
+    if schema_name is None:
         raise ValueError("Survey not found")
-    schema_name = survey.schema_name
     _validate_schema_name(schema_name)
     await db.execute(text(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE"))
-    await db.delete(survey)
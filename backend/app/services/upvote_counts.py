@@ -0,0 +1,157 @@
+"""Opinion (with per-opinion upvote counts) and upvote listings for the moderation and
+manager views. Both are keyset-paginated (app.services.keyset)."""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, RowMapping, ScalarSelect, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models.tenant import PublishedOpinion, Upvote, UpvoteStatus, upvote_status_is
+from app.schemas.moderation import PublishedOpinionResponse, UpvoteResponse
+from app.schemas.pagination import Page
+from app.services.keyset import (
+    after_desc,
+    decode_cursor,
+    decode_int,
+    decode_timestamp,
+    encode_cursor,
+    encode_timestamp,
+)
+
+# Core columns for PublishedOpinionResponse (no ORM hydration); search_tsv is never read
+_OPINION_COLUMNS = (
+    PublishedOpinion.id,
+    PublishedOpinion.raw_response_id,
+    PublishedOpinion.title,
+    PublishedOpinion.content,
+    PublishedOpinion.admin_notes,
+    PublishedOpinion.priority_score,
+    PublishedOpinion.importance,
+    PublishedOpinion.urgency,
+    PublishedOpinion.expected_impact,
+    PublishedOpinion.supporter_points,
+    PublishedOpinion.is_disclosure_agreed,
+    PublishedOpinion.disclosed_pii,
+)
+
+_UPVOTE_COLUMNS = (
+    Upvote.id,
+    Upvote.opinion_id,
+    Upvote.user_hash,
+    Upvote.raw_comment,
+    Upvote.published_comment,
+    Upvote.status,
+    Upvote.created_at,
+    Upvote.is_disclosure_agreed,
+    Upvote.disclosed_pii,
+)
+
+
+def _count_per_opinion(*criteria) -> ScalarSelect[int]:
+    # Correlated to the enclosing published_opinions select; uses the upvotes opinion_id index
+    return (
+        select(func.count(Upvote.id))
+        .where(Upvote.opinion_id == PublishedOpinion.id, *criteria)
+        .correlate(PublishedOpinion)
+        .scalar_subquery()
+    )
+
+
+def supporters_per_opinion() -> ScalarSelect[int]:
+    """Total upvotes of each row of an enclosing published_opinions select (COUNT, never NULL)."""
+    return _count_per_opinion()
+
+
+def has_pending_upvotes() -> ColumnElement[bool]:
+    """True for opinions with at least one pending upvote (moderation ordering / keyset)."""
+    return _count_per_opinion(upvote_status_is(UpvoteStatus.pending)) > 0
+
+
+async def list_opinion_responses(
+    db: AsyncSession,
+    *order_by: ColumnElement[Any] | InstrumentedAttribute[Any],
+    limit: int,
+    cursor_of: Callable[[RowMapping], str],
+    where: Sequence[ColumnElement[bool]] = (),
+    consented_pii_only: bool = False,
+) -> Page[PublishedOpinionResponse]:
+    """
+    One keyset page of the tenant's published opinions with total and pending upvote counts,
+    in one statement. where: rows after the caller's cursor; cursor_of(row) encodes the last
+    row of a full page (rows also carry updated_at, which is not part of the response).
+    consented_pii_only: disclosed_pii is returned only where is_disclosure_agreed (Manager view).
+    """
+    stmt = (
+        select(
+            *_OPINION_COLUMNS,
+            PublishedOpinion.updated_at,
+            supporters_per_opinion().label("supporters"),
+            _count_per_opinion(upvote_status_is(UpvoteStatus.pending)).label(
+                "pending_upvotes_count"
+            ),
+        )
+        .where(*where)
+        .order_by(*order_by)
+        .limit(limit + 1)  # one extra row tells whether another page exists
+    )
+    rows = (await db.execute(stmt)).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = cursor_of(rows[-1])
+    items = []
+    for row in rows:
+        fields = dict(row)
+        del fields["updated_at"]
+        fields["raw_response_id"] = str(fields["raw_response_id"])
+        if consented_pii_only and not fields["is_disclosure_agreed"]:
+            fields["disclosed_pii"] = None
+        # Typed columns: construct without re-validating what the database already enforces
+        items.append(PublishedOpinionResponse.model_construct(**fields))
+    return Page[PublishedOpinionResponse].model_construct(items=items, next_cursor=next_cursor)
+
+
+async def list_upvote_responses(
+    db: AsyncSession,
+    opinion_id: int,
+    *,
+    limit: int,
+    after: str | None = None,
+    consented_pii_only: bool = False,
+) -> Page[UpvoteResponse]:
+    """
+    One page of an opinion's upvotes, newest first: ORDER BY created_at DESC, id DESC, a range
+    scan of idx_upvotes_opinion_id_created_at. after: the previous page's next_cursor
+    (ValueError if malformed). consented_pii_only as for list_opinion_responses.
+    """
+    stmt = select(*_UPVOTE_COLUMNS).where(Upvote.opinion_id == opinion_id)
+    if after is not None:
+        cur_created_at, cur_id = decode_cursor(after, decode_timestamp, decode_int)
+        stmt = stmt.where(after_desc(Upvote.created_at, Upvote.id, cur_created_at, cur_id))
+    result = await db.execute(
+        stmt.order_by(Upvote.created_at.desc(), Upvote.id.desc()).limit(limit + 1)
+    )
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(encode_timestamp(rows[-1].created_at), str(rows[-1].id))
+    items = [
+        UpvoteResponse.model_construct(
+            id=u.id,
+            opinion_id=u.opinion_id,
+            user_hash=u.user_hash.hex(),
+            raw_comment=u.raw_comment,
+            published_comment=u.published_comment,
+            status=u.status.value,
+            created_at=u.created_at.isoformat() if u.created_at else "",
+            is_disclosure_agreed=u.is_disclosure_agreed,
+            disclosed_pii=(
+                u.disclosed_pii if u.is_disclosure_agreed or not consented_pii_only else None
+            ),
+        )
+        for u in rows
+    ]
+    return Page[UpvoteResponse].model_construct(items=items, next_cursor=next_cursor)
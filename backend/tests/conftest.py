@@ -6,6 +6,7 @@ from collections.abc import AsyncGenerator
 import pytest
 import pytest_asyncio
 from app.config import settings
+from app.database import engine
 from app.main import app
 from httpx import ASGITransport, AsyncClient
 
@@ -24,10 +25,18 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
             ac.headers["X-Admin-API-Key"] = settings.admin_api_key
             for survey_id in _created_survey_ids:
                 await ac.delete(f"/admin/surveys/{survey_id}")
+        await engine.dispose()
 
     asyncio.run(_cleanup())
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def _dispose_engine_pool() -> AsyncGenerator[None, None]:
+    """Each test runs on its own event loop; drop pooled connections bound to the old loop."""
+    yield
+    await engine.dispose()
+
+
 @pytest_asyncio.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Async HTTP client for FastAPI app."""
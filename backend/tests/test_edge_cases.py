@@ -107,3 +107,51 @@ async def test_admin_add_question_invalid_type(admin_client: AsyncClient) -> Non
         json={"label": "Q", "question_type": "invalid_type", "is_required": False},
     )
     assert resp.status_code == 422
+
+
+async def test_deleted_survey_not_resolved_from_cache(admin_client: AsyncClient) -> None:
+    """After delete, the cached schema mapping is dropped so tenant routes return 404."""
+    create_resp = await admin_client.post("/admin/surveys", json={"name": "Cache Delete"})
+    if create_resp.status_code != 200:
+        pytest.skip("DB or admin not configured")
+    survey_id = create_resp.json()["id"]
+    assert (await admin_client.get(f"/survey/{survey_id}/questions")).status_code == 200
+
+    assert (await admin_client.delete(f"/admin/surveys/{survey_id}")).status_code == 200
+    resp = await admin_client.get(f"/survey/{survey_id}/questions")
+    assert resp.status_code == 404
+
+
+async def test_admin_rejects_wrong_key(client: AsyncClient) -> None:
+    """Admin endpoints return 401 for a wrong (including non-ASCII bytes) X-Admin-API-Key."""
+    from app.routers.admin import _ADMIN_KEY
+
+    if _ADMIN_KEY is None:
+        pytest.skip("ADMIN_API_KEY not configured (dev mode allows all)")
+    for key in (b"wrong-key", "clé".encode()):
+        resp = await client.get("/admin/surveys", headers={"X-Admin-API-Key": key})
+        assert resp.status_code == 401
+    resp = await client.post("/admin/verify-password", json={"password": "wrong-key"})
+    assert resp.status_code == 401
+
+
+async def test_out_of_range_cursor_rejected(admin_client: AsyncClient) -> None:
+    """A cursor with a non-ASCII digit or an int4-overflowing key is a 400, not a 500."""
+    from app.services.keyset import encode_cursor, encode_flag, encode_timestamp
+
+    create_resp = await admin_client.post("/admin/surveys", json={"name": "Cursor Range"})
+    if create_resp.status_code != 200:
+        pytest.skip("DB or admin not configured")
+    survey_id = create_resp.json()["id"]
+
+    huge = str(10**20)
+    cursor = encode_cursor(encode_flag(True), encode_timestamp(None), huge)
+    resp = await admin_client.get(
+        f"/admin/moderation/{survey_id}/opinions", params={"after": cursor}
+    )
+    assert resp.status_code == 400
+    for after in ("\u00b2", huge):
+        resp = await admin_client.get(
+            f"/admin/surveys/{survey_id}/questions", params={"after": after}
+        )
+        assert resp.status_code == 400
@@ -2,7 +2,9 @@
 
 from io import BytesIO
 
-from app.routers.manager_export import build_pdf
+from openpyxl import load_workbook
+
+from app.routers.manager_export import build_pdf, build_xlsx, iter_file
 
 
 def _mock_opinion(
@@ -52,8 +54,8 @@ def test_build_pdf_basic() -> None:
     """build_pdf produces valid PDF bytes."""
     opinion = _mock_opinion()
     buf = build_pdf([opinion], {1: 0}, {1: []}, survey_name="Test Survey")
-    assert isinstance(buf, BytesIO)
-    data = buf.getvalue()
+    assert buf.tell() == 0
+    data = buf.read()
     assert len(data) > 100
     assert data.startswith(b"%PDF")
 
@@ -76,7 +78,25 @@ def test_build_pdf_special_characters_escaped() -> None:
         {1: [upvote]},
         survey_name="Survey & Test",
     )
-    assert isinstance(buf, BytesIO)
-    data = buf.getvalue()
+    assert buf.tell() == 0
+    data = buf.read()
     assert len(data) > 100
     assert data.startswith(b"%PDF")
+
+
+def test_build_xlsx_rows() -> None:
+    """build_xlsx (write-only) yields a workbook with opinion, comment and PII cells."""
+    opinion = _mock_opinion(disclosed_pii={"Name": "Alice"})
+    upvote = _mock_upvote(disclosed_pii={"Name": "Bob"})
+    out = build_xlsx([opinion], {1: 2}, {1: [upvote]}, survey_name="S", document_title="Report")
+    data = b"".join(iter_file(out, chunk_size=1024))
+    assert out.closed
+    wb = load_workbook(BytesIO(data), read_only=True)
+    assert wb.properties.title == "Report"
+    rows = list(wb["Opinions"].iter_rows(values_only=True))
+    assert rows[0][0] == "Survey: S"
+    header, opinion_row, comment_row = rows[2], rows[3], rows[4]
+    assert header[-1] == "Name"
+    assert opinion_row[:2] == (1, "Test")
+    assert opinion_row[10] == 2 and opinion_row[-1] == "Alice"
+    assert comment_row[1:4] == ("Additional comments", "Comment", "Name: Bob")
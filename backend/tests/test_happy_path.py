@@ -15,6 +15,15 @@ async def test_health(client: AsyncClient) -> None:
     assert resp.json()["status"] == "ok"
 
 
+async def test_admin_health_reports_pool(admin_client: AsyncClient) -> None:
+    """Admin health exposes connection pool counters."""
+    resp = await admin_client.get("/admin/health")
+    assert resp.status_code == 200
+    pool = resp.json()["pool"]
+    assert pool["size"] >= 1
+    assert pool["checked_out"] >= 0
+
+
 async def test_admin_create_survey_list(admin_client: AsyncClient) -> None:
     """Create survey, list surveys, verify created survey appears."""
     create_resp = await admin_client.post(
@@ -29,10 +38,42 @@ async def test_admin_create_survey_list(admin_client: AsyncClient) -> None:
     assert access_code
     assert data["name"] == "Happy Path Test Survey"
 
-    list_resp = await admin_client.get("/admin/surveys")
-    assert list_resp.status_code == 200
-    surveys = list_resp.json()
-    assert any(s["id"] == survey_id for s in surveys)
+    # Walk the keyset pages; ids must not repeat across pages
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} | ({"after": cursor} if cursor else {})
+        list_resp = await admin_client.get("/admin/surveys", params=params)
+        assert list_resp.status_code == 200
+        page = list_resp.json()
+        assert len(page["items"]) <= 2
+        seen.extend(s["id"] for s in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert survey_id in seen
+    assert len(seen) == len(set(seen))
+
+    bad_resp = await admin_client.get("/admin/surveys", params={"after": "!!"})
+    assert bad_resp.status_code == 400
+
+
+async def test_admin_survey_cache_invalidated_on_writes(admin_client: AsyncClient) -> None:
+    """Cached survey list / detail responses reflect create and access-code reset at once."""
+    params = {"limit": 200}
+    before = (await admin_client.get("/admin/surveys", params=params)).json()
+    assert (await admin_client.get("/admin/surveys", params=params)).json() == before
+
+    survey_id = (await admin_client.post("/admin/surveys", json={"name": "Cached"})).json()["id"]
+    after = (await admin_client.get("/admin/surveys", params=params)).json()
+    assert survey_id in {s["id"] for s in after["items"]}
+
+    old_code = (await admin_client.get(f"/admin/surveys/{survey_id}")).json()["access_code"]
+    reset = await admin_client.post(f"/admin/surveys/{survey_id}/reset-access-code")
+    new_code = reset.json()["access_code"]
+    assert new_code != old_code
+    detail = (await admin_client.get(f"/admin/surveys/{survey_id}")).json()
+    assert detail["access_code"] == new_code
 
 
 async def test_admin_add_questions(admin_client: AsyncClient) -> None:
@@ -56,10 +97,207 @@ async def test_admin_add_questions(admin_client: AsyncClient) -> None:
 
     list_resp = await admin_client.get(f"/admin/surveys/{survey_id}/questions")
     assert list_resp.status_code == 200
-    questions = list_resp.json()
+    questions = list_resp.json()["items"]
     assert len(questions) >= 1
     assert any(q["label"] == "What is your concern?" for q in questions)
 
+    question_id = add_resp.json()["id"]
+    del_url = f"/admin/surveys/{survey_id}/questions/{question_id}"
+    assert (await admin_client.delete(del_url)).status_code == 200
+    assert (await admin_client.delete(del_url)).status_code == 404
+
+
+async def test_admin_add_questions_bulk(admin_client: AsyncClient) -> None:
+    """Bulk-create questions; response keeps request order and matches the list endpoint."""
+    create_resp = await admin_client.post("/admin/surveys", json={"name": "Bulk Questions"})
+    assert create_resp.status_code == 200
+    survey_id = create_resp.json()["id"]
+
+    bulk_resp = await admin_client.post(
+        f"/admin/surveys/{survey_id}/questions/bulk",
+        json={
+            "questions": [
+                {"label": "Name", "question_type": "text", "is_personal_data": True},
+                {"label": "Area", "question_type": "select", "options": ["A", "B"]},
+                {"label": "Details", "question_type": "textarea", "is_required": True},
+            ]
+        },
+    )
+    assert bulk_resp.status_code == 200
+    created = bulk_resp.json()
+    assert [q["label"] for q in created] == ["Name", "Area", "Details"]
+    assert created[1]["options"] == ["A", "B"]
+    assert created[0]["is_personal_data"] is True
+
+    list_resp = await admin_client.get(f"/admin/surveys/{survey_id}/questions")
+    assert [q["id"] for q in list_resp.json()["items"]] == [q["id"] for q in created]
+
+    first = await admin_client.get(f"/admin/surveys/{survey_id}/questions", params={"limit": 2})
+    page = first.json()
+    assert [q["label"] for q in page["items"]] == ["Name", "Area"]
+    rest = await admin_client.get(
+        f"/admin/surveys/{survey_id}/questions", params={"after": page["next_cursor"]}
+    )
+    assert [q["label"] for q in rest.json()["items"]] == ["Details"]
+    assert rest.json()["next_cursor"] is None
+
+
+async def test_publish_opinion_collects_pii(admin_client: AsyncClient, client: AsyncClient) -> None:
+    """Publishing copies non-empty PII answers (question order); unknown responses are 404."""
+    survey_id = (await admin_client.post("/admin/surveys", json={"name": "PII"})).json()["id"]
+    created = (
+        await admin_client.post(
+            f"/admin/surveys/{survey_id}/questions/bulk",
+            json={
+                "questions": [
+                    {"label": "Name", "question_type": "text", "is_personal_data": True},
+                    {"label": "Opinion", "question_type": "text"},
+                    {"label": "Email", "question_type": "text", "is_personal_data": True},
+                    {"label": "Phone", "question_type": "text", "is_personal_data": True},
+                ]
+            },
+        )
+    ).json()
+    name_id, opinion_id, email_id, _phone_id = (q["id"] for q in created)  # Phone unanswered
+    submit_resp = await client.post(
+        f"/survey/{survey_id}/submit",
+        json={
+            "answers": [
+                {"question_id": email_id, "answer_text": " a@b.c ", "is_disclosure_agreed": True},
+                {"question_id": name_id, "answer_text": "Alice", "is_disclosure_agreed": False},
+                {"question_id": opinion_id, "answer_text": "More parks"},
+            ]
+        },
+    )
+    response_id = submit_resp.json()["response_id"]
+    body = {"title": "Parks", "content": "More parks", "importance": 0, "urgency": 0}
+
+    publish_resp = await admin_client.post(
+        f"/admin/surveys/{survey_id}/opinions", json={"raw_response_id": response_id, **body}
+    )
+    assert publish_resp.status_code == 200
+    opinion = publish_resp.json()
+    assert list(opinion["disclosed_pii"].items()) == [("Name", "Alice"), ("Email", "a@b.c")]
+    assert opinion["is_disclosure_agreed"] is False  # Name was not agreed
+
+    missing_resp = await admin_client.post(
+        f"/admin/surveys/{survey_id}/opinions",
+        json={"raw_response_id": "00000000-0000-7000-8000-000000000000", **body},
+    )
+    assert missing_resp.status_code == 404
+    malformed_resp = await admin_client.post(
+        f"/admin/surveys/{survey_id}/opinions", json={"raw_response_id": "not-a-uuid", **body}
+    )
+    assert malformed_resp.status_code == 422
+
+
+async def test_publish_opinions_bulk(admin_client: AsyncClient, client: AsyncClient) -> None:
+    """Bulk publish keeps request order; one unknown response rejects the whole batch."""
+    survey_id = (await admin_client.post("/admin/surveys", json={"name": "Bulk"})).json()["id"]
+    q = (
+        await admin_client.post(
+            f"/admin/surveys/{survey_id}/questions",
+            json={"label": "Name", "question_type": "text", "is_personal_data": True},
+        )
+    ).json()
+    response_ids = []
+    for name in ("Ann", "Ben"):
+        submit_resp = await client.post(
+            f"/survey/{survey_id}/submit",
+            json={"answers": [{"question_id": q["id"], "answer_text": name}]},
+        )
+        response_ids.append(submit_resp.json()["response_id"])
+    items = [
+        {"raw_response_id": rid, "title": f"T{n}", "content": "c", "importance": n}
+        for n, rid in enumerate(reversed(response_ids))
+    ]
+    url = f"/admin/surveys/{survey_id}/opinions/bulk"
+
+    missing = {
+        "raw_response_id": "00000000-0000-7000-8000-000000000000",
+        "title": "x",
+        "content": "x",
+    }
+    assert (await admin_client.post(url, json={"opinions": [*items, missing]})).status_code == 404
+
+    resp = await admin_client.post(url, json={"opinions": items})
+    assert resp.status_code == 200
+    created = resp.json()
+    assert [o["title"] for o in created] == ["T0", "T1"]
+    assert [o["disclosed_pii"] for o in created] == [{"Name": "Ben"}, {"Name": "Ann"}]
+    assert [o["priority_score"] for o in created] == [0, 2]
+    listed = (await admin_client.get(f"/admin/moderation/{survey_id}/opinions")).json()
+    assert len(listed["items"]) == 2
+
+
+async def _all_pages(api: AsyncClient, url: str, **kwargs) -> list[list[dict]]:
+    """Follow next_cursor with ?limit=1; one list of items per page."""
+    pages: list[list[dict]] = []
+    cursor = None
+    while True:
+        params = {"limit": 1} | ({"after": cursor} if cursor else {})
+        resp = await api.get(url, params=params, **kwargs)
+        assert resp.status_code == 200
+        page = resp.json()
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def test_moderation_listings_keyset_pages(
+    admin_client: AsyncClient, client: AsyncClient
+) -> None:
+    """Submissions, opinions and upvotes page one row at a time in listing order."""
+    survey_id = (await admin_client.post("/admin/surveys", json={"name": "Pages"})).json()["id"]
+    q = (
+        await admin_client.post(
+            f"/admin/surveys/{survey_id}/questions", json={"label": "Q", "question_type": "text"}
+        )
+    ).json()
+    response_ids = []
+    for answer in ("a", "b", "c", "d"):
+        submit_resp = await client.post(
+            f"/survey/{survey_id}/submit",
+            json={"answers": [{"question_id": q["id"], "answer_text": answer}]},
+        )
+        response_ids.append(submit_resp.json()["response_id"])
+    items = [
+        {"raw_response_id": rid, "title": title, "content": "c"}
+        for rid, title in zip(response_ids, ("A", "B"), strict=False)
+    ]
+    resp = await admin_client.post(
+        f"/admin/surveys/{survey_id}/opinions/bulk", json={"opinions": items}
+    )
+    first, second = resp.json()
+    # A pending client vote moves B ahead of A; converting the third response adds a vote
+    await client.post(f"/survey/{survey_id}/opinions/{second['id']}/upvote", json={})
+    await admin_client.post(
+        f"/admin/moderation/{survey_id}/responses/{response_ids[2]}/convert-to-support",
+        json={"opinion_id": second["id"]},
+    )
+
+    pages = await _all_pages(admin_client, f"/admin/moderation/{survey_id}/submissions")
+    assert all(len(page) == 1 for page in pages)
+    listed = [page[0] for page in pages]
+    assert sorted(r["id"] for r in listed) == sorted(response_ids)
+    assert listed[0] == {
+        "id": response_ids[3],
+        "submitted_at": listed[0]["submitted_at"],
+        "status": "pending",
+    }
+    pages = await _all_pages(admin_client, f"/admin/moderation/{survey_id}/opinions")
+    assert [page[0]["id"] for page in pages] == [second["id"], first["id"]]
+    pages = await _all_pages(
+        admin_client, f"/admin/moderation/{survey_id}/opinions/{second['id']}/upvotes"
+    )
+    assert len({page[0]["id"] for page in pages}) == 2
+
+    bad_resp = await admin_client.get(
+        f"/admin/moderation/{survey_id}/submissions", params={"after": "!!"}
+    )
+    assert bad_resp.status_code == 400
+
 
 async def test_survey_submit_full_flow(admin_client: AsyncClient, client: AsyncClient) -> None:
     """
@@ -111,12 +349,21 @@ async def test_survey_submit_full_flow(admin_client: AsyncClient, client: AsyncC
     # List responses (admin)
     list_resp = await admin_client.get(f"/admin/moderation/{survey_id}/submissions")
     assert list_resp.status_code == 200
-    responses = list_resp.json()
-    assert len(responses) >= 1
+    responses = list_resp.json()["items"]
+    assert [r["id"] for r in responses] == [response_id]
 
     # Get response detail
     detail_resp = await admin_client.get(f"/admin/surveys/{survey_id}/responses/{response_id}")
     assert detail_resp.status_code == 200
+    detail = detail_resp.json()
+    assert detail["id"] == response_id
+    assert [(a["question_id"], a["answer_text"]) for a in detail["answers"]] == [
+        (question_id, "Great product!")
+    ]
+    missing_resp = await admin_client.get(
+        f"/admin/surveys/{survey_id}/responses/00000000-0000-7000-8000-000000000000"
+    )
+    assert missing_resp.status_code == 404
 
     # Publish opinion
     publish_resp = await admin_client.post(
@@ -131,6 +378,16 @@ async def test_survey_submit_full_flow(admin_client: AsyncClient, client: AsyncC
         },
     )
     assert publish_resp.status_code == 200
+    opinion = publish_resp.json()
+    assert opinion["priority_score"] == 6  # (1+1+1)*2 + 0, generated by the database
+
+    # Edit score components; priority_score follows
+    update_resp = await admin_client.patch(
+        f"/admin/moderation/{survey_id}/opinions/{opinion['id']}",
+        json={"importance": 2, "supporter_points": 1},
+    )
+    assert update_resp.status_code == 200
+    assert update_resp.json()["priority_score"] == 9
 
     # Manager auth
     auth_resp = await client.post(
@@ -139,6 +396,7 @@ async def test_survey_submit_full_flow(admin_client: AsyncClient, client: AsyncC
     )
     assert auth_resp.status_code == 200
     token = auth_resp.json()["access_token"]
+    assert auth_resp.json()["name"] == "Full Flow Survey"
 
     # Manager get opinions
     opinions_resp = await client.get(
@@ -146,6 +404,51 @@ async def test_survey_submit_full_flow(admin_client: AsyncClient, client: AsyncC
         headers={"Authorization": f"Bearer {token}"},
     )
     assert opinions_resp.status_code == 200
-    opinions = opinions_resp.json()
+    opinions = opinions_resp.json()["items"]
     assert len(opinions) >= 1
     assert any(o["title"] == "Positive feedback" for o in opinions)
+
+    # Public full-text search finds the published opinion
+    search_resp = await client.get(f"/survey/{survey_id}/search", params={"q": "product"})
+    assert search_resp.status_code == 200
+    assert any(o["title"] == "Positive feedback" for o in search_resp.json())
+
+
+async def test_upvote_once_per_client(admin_client: AsyncClient, client: AsyncClient) -> None:
+    """A repeat vote (client or moderator conversion) is 409; a missing opinion is 404."""
+    survey_id = (await admin_client.post("/admin/surveys", json={"name": "Votes"})).json()["id"]
+    q = (
+        await admin_client.post(
+            f"/admin/surveys/{survey_id}/questions", json={"label": "Q", "question_type": "text"}
+        )
+    ).json()
+    response_ids = []
+    for answer in ("a", "b"):
+        submit_resp = await client.post(
+            f"/survey/{survey_id}/submit",
+            json={"answers": [{"question_id": q["id"], "answer_text": answer}]},
+        )
+        response_ids.append(submit_resp.json()["response_id"])
+    opinion = (
+        await admin_client.post(
+            f"/admin/surveys/{survey_id}/opinions",
+            json={"raw_response_id": response_ids[0], "title": "T", "content": "c"},
+        )
+    ).json()
+    url = f"/survey/{survey_id}/opinions/{opinion['id']}/upvote"
+    assert (await client.post(url, json={"comment": "agree"})).status_code == 200
+    assert (await client.post(url, json={})).status_code == 409
+    missing = await client.post(f"/survey/{survey_id}/opinions/{opinion['id'] + 1}/upvote", json={})
+    assert missing.status_code == 404
+
+    convert_url = f"/admin/moderation/{survey_id}/responses/{response_ids[1]}/convert-to-support"
+    converted = await admin_client.post(convert_url, json={"opinion_id": opinion["id"]})
+    assert converted.status_code == 200
+    assert converted.json()["status"] == "published"
+    again = await admin_client.post(convert_url, json={"opinion_id": opinion["id"]})
+    assert again.status_code == 409
+
+    upvotes = await admin_client.get(
+        f"/admin/moderation/{survey_id}/opinions/{opinion['id']}/upvotes"
+    )
+    assert [u["status"] for u in upvotes.json()["items"]] == ["published", "pending"]
@@ -0,0 +1,23 @@
+"""
+Route table sanity: every (method, path) is registered exactly once.
+"""
+
+import warnings
+from collections import Counter
+
+from app.main import app
+from app.routers import admin, manager, survey
+from fastapi.routing import APIRoute
+
+
+def test_no_duplicate_routes() -> None:
+    """Each router declares a method/path once, and OpenAPI sees no duplicate operations."""
+    for module in (admin, manager, survey):
+        routes = [r for r in module.router.routes if isinstance(r, APIRoute)]
+        counts = Counter((method, r.path) for r in routes for method in r.methods)
+        duplicates = [key for key, n in counts.items() if n > 1]
+        assert not duplicates, f"{module.__name__}: {duplicates}"
+    app.openapi_schema = None  # regenerate instead of using a cached schema
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # FastAPI warns on duplicate operation ids
+        app.openapi()
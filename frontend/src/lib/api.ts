@@ -60,10 +60,26 @@ function headers(includeAdminKey = true): HeadersInit {
   return h;
 }
 
+/** Follow next_cursor until the last page of a keyset-paginated list (admin headers by default). */
+async function fetchAllPages<T>(
+  url: string,
+  requestHeaders: HeadersInit = headers()
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const pageUrl: string = cursor ? `${url}?after=${encodeURIComponent(cursor)}` : url;
+    const r = await fetch(pageUrl, { headers: requestHeaders });
+    if (!r.ok) throw new Error(await r.text());
+    const page: import("@/types/api").Page<T> = await r.json();
+    items.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor);
+  return items;
+}
+
 export async function listSurveys(): Promise<import("@/types/api").Survey[]> {
-  const r = await fetch(`${baseUrl}/admin/surveys`, { headers: headers() });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/admin/surveys`);
 }
 
 export async function createSurvey(
@@ -114,11 +130,7 @@ export async function deleteQuestion(surveyId: string, questionId: number): Prom
 }
 
 export async function listQuestions(surveyId: string): Promise<import("@/types/api").Question[]> {
-  const r = await fetch(`${baseUrl}/admin/surveys/${surveyId}/questions`, {
-    headers: headers(),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/admin/surveys/${surveyId}/questions`);
 }
 
 export async function createQuestion(
@@ -203,11 +215,7 @@ export async function listResponses(
   surveyId: string
 ): Promise<import("@/types/api").RawResponseListItem[]> {
   const id = surveyId.startsWith(":") ? surveyId.slice(1) : surveyId;
-  const r = await fetch(`${baseUrl}/admin/moderation/${id}/submissions`, {
-    headers: headers(),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/admin/moderation/${id}/submissions`);
 }
 
 export async function getResponse(
@@ -240,11 +248,7 @@ export async function listOpinions(
   surveyId: string
 ): Promise<import("@/types/api").PublishedOpinion[]> {
   const id = surveyId.startsWith(":") ? surveyId.slice(1) : surveyId;
-  const r = await fetch(`${baseUrl}/admin/moderation/${id}/opinions`, {
-    headers: headers(),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/admin/moderation/${id}/opinions`);
 }
 
 export async function updateOpinion(
@@ -276,11 +280,7 @@ export async function listUpvotesForOpinion(
   opinionId: number
 ): Promise<import("@/types/api").UpvoteItem[]> {
   const id = surveyId.startsWith(":") ? surveyId.slice(1) : surveyId;
-  const r = await fetch(`${baseUrl}/admin/moderation/${id}/opinions/${opinionId}/upvotes`, {
-    headers: headers(),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/admin/moderation/${id}/opinions/${opinionId}/upvotes`);
 }
 
 /** Update upvote (published_comment, status) */
@@ -334,6 +334,21 @@ export function getManagerToken(surveyId: string): string | null {
   }
 }
 
+/** Survey name from the stored manager token's `name` claim (null for tokens without it). */
+export function getManagerTokenSurveyName(surveyId: string): string | null {
+  const token = getManagerToken(surveyId);
+  const payload = token?.split(".")[1];
+  if (!payload) return null;
+  try {
+    const b64 = payload.replace(/-/g, "+").replace(/_/g, "/");
+    const bytes = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0));
+    const claims = JSON.parse(new TextDecoder().decode(bytes));
+    return typeof claims.name === "string" ? claims.name : null;
+  } catch {
+    return null;
+  }
+}
+
 export function setManagerToken(surveyId: string, token: string): void {
   localStorage.setItem(`${MANAGER_TOKEN_KEY}_${normalizeSurveyId(surveyId)}`, token);
 }
@@ -345,7 +360,7 @@ export function clearManagerToken(surveyId: string): void {
 export async function managerAuth(
   surveyId: string,
   accessCode: string
-): Promise<{ access_token: string; token_type: string }> {
+): Promise<{ access_token: string; token_type: string; name: string }> {
   const id = normalizeSurveyId(surveyId);
   const r = await fetch(`${baseUrl}/manager/auth`, {
     method: "POST",
@@ -377,11 +392,7 @@ export async function listManagerOpinions(
   surveyId: string
 ): Promise<import("@/types/api").PublishedOpinion[]> {
   const id = normalizeSurveyId(surveyId);
-  const r = await fetch(`${baseUrl}/manager/${id}/opinions`, {
-    headers: managerHeaders(surveyId),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(`${baseUrl}/manager/${id}/opinions`, managerHeaders(surveyId));
 }
 
 export async function listManagerUpvotes(
@@ -389,11 +400,10 @@ export async function listManagerUpvotes(
   opinionId: number
 ): Promise<import("@/types/api").UpvoteItem[]> {
   const id = normalizeSurveyId(surveyId);
-  const r = await fetch(`${baseUrl}/manager/${id}/opinions/${opinionId}/upvotes`, {
-    headers: managerHeaders(surveyId),
-  });
-  if (!r.ok) throw new Error(await r.text());
-  return r.json();
+  return fetchAllPages(
+    `${baseUrl}/manager/${id}/opinions/${opinionId}/upvotes`,
+    managerHeaders(surveyId)
+  );
 }
 
 /** Parse filename from Content-Disposition header (e.g. attachment; filename="Report - Name.pdf"). */
@@ -4,6 +4,7 @@ import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import {
   managerAuth,
   getManagerSurvey,
+  getManagerTokenSurveyName,
   listManagerOpinions,
   listManagerUpvotes,
   exportManagerReport,
@@ -77,6 +78,8 @@ export function ManagerDashboard() {
 
   const token = surveyId ? getManagerToken(surveyId) : null;
   const isLoggedIn = !!token;
+  // Tokens carry the survey name; only older tokens need the survey lookup
+  const tokenSurveyName = surveyId && token ? getManagerTokenSurveyName(surveyId) : null;
 
   const authMutation = useMutation({
     mutationFn: () => managerAuth(surveyId!, accessCode),
@@ -95,8 +98,9 @@ export function ManagerDashboard() {
   const { data: survey } = useQuery({
     queryKey: ["manager-survey", surveyId],
     queryFn: () => getManagerSurvey(surveyId!),
-    enabled: !!surveyId && isLoggedIn,
+    enabled: !!surveyId && isLoggedIn && !tokenSurveyName,
   });
+  const surveyName = tokenSurveyName ?? survey?.name;
 
   const {
     data: opinions = [],
@@ -185,7 +189,7 @@ export function ManagerDashboard() {
       <div className="flex flex-wrap items-center justify-between gap-4 mb-6">
         <div>
           <h1 className="text-xl font-semibold text-slate-800">Manager dashboard</h1>
-          {survey?.name && <p className="text-sm text-slate-500 mt-0.5">Survey: {survey.name}</p>}
+          {surveyName && <p className="text-sm text-slate-500 mt-0.5">Survey: {surveyName}</p>}
         </div>
         <div className="flex items-center gap-2">
           <button
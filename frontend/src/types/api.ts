@@ -10,6 +10,12 @@ export interface Survey {
   access_code?: string | null;
 }
 
+/** Keyset-paginated list: pass next_cursor back as ?after= (null = last page). */
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 export interface SurveyCreateResponse extends Survey {
   access_code: string;
 }